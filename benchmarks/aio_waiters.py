@@ -0,0 +1,87 @@
+"""Many concurrent `AsyncCountdown.wait()` calls on the shared scheduler.
+
+Starts N countdowns with staggered short durations, pauses and resumes a share
+of them, cancels another share, and reports how late the rest resolved, how
+many loop timers were pending at peak, and the CPU used. `--baseline` runs the
+same waits as one `asyncio.sleep` per waiter for comparison.
+
+Usage:
+    python benchmarks/aio_waiters.py
+    python benchmarks/aio_waiters.py --waiters 50000 --baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.aio import AsyncCountdown  # noqa: E402
+
+
+async def _waiter(countdown: AsyncCountdown, late: list[float]) -> None:
+    await countdown.wait()
+    late.append(time.monotonic() - countdown.next_deadline)
+
+
+async def _sleeper(seconds: float, late: list[float]) -> None:
+    deadline = time.monotonic() + seconds
+    await asyncio.sleep(seconds)
+    late.append(time.monotonic() - deadline)
+
+
+async def _run(waiters: int, baseline: bool) -> None:
+    loop = asyncio.get_running_loop()
+    late: list[float] = []
+    cpu = time.process_time()
+    if baseline:
+        tasks = [
+            asyncio.create_task(_sleeper(random.uniform(1.0, 2.0), late)) for _ in range(waiters)
+        ]
+    else:
+        countdowns = [AsyncCountdown(random.uniform(1.0, 2.0)) for _ in range(waiters)]
+        tasks = [asyncio.create_task(_waiter(c, late)) for c in countdowns]
+
+    await asyncio.sleep(0.2)
+    peak = len(loop._scheduled)  # private, but the clearest view of pending timers
+    if not baseline:
+        for countdown in countdowns[: waiters // 10]:
+            countdown.pause()
+        for task in tasks[waiters // 10 : waiters // 5]:
+            task.cancel()
+        await asyncio.sleep(0.2)
+        for countdown in countdowns[: waiters // 10]:
+            countdown.resume()
+
+    await asyncio.gather(*tasks, return_exceptions=True)
+    cpu = time.process_time() - cpu
+
+    ordered = sorted(late)
+    name = "asyncio.sleep" if baseline else "AsyncCountdown"
+    print(
+        f"{name:<15} {len(ordered)} resolved  loop timers {peak:6d}"
+        f"  late p50 {statistics.median(ordered) * 1000:6.2f} ms"
+        f"  p99 {ordered[int(len(ordered) * 0.99)] * 1000:6.2f} ms"
+        f"  cpu {cpu * 1000:7.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--waiters", type=int, default=10000)
+    parser.add_argument("--baseline", action="store_true")
+    args = parser.parse_args()
+
+    asyncio.run(_run(args.waiters, baseline=False))
+    if args.baseline:
+        asyncio.run(_run(args.waiters, baseline=True))
+
+
+if __name__ == "__main__":
+    main()
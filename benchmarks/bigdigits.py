@@ -0,0 +1,114 @@
+"""Render cost per update of `BigDigits` vs. Textual's `Digits`, measured headless.
+
+Mounts each widget in the TUIs' card layout (with `theme.tcss`) at a few
+terminal sizes and feeds it consecutive stopwatch values. Two costs are
+reported per update:
+
+- render: `update()` followed by `render_lines()` over the whole widget, which
+  is what the compositor asks the widget for; `--updates` of these.
+- repaint: `update()` followed by Textual's full idle cycle (styles, compositor,
+  headless driver); `--repaints` of these. This one is mostly framework overhead
+  shared by both widgets.
+
+For `BigDigits` it also reports how many character cells each update redrew.
+
+Usage:
+    python benchmarks/bigdigits.py
+    python benchmarks/bigdigits.py --updates 20000 --repaints 100 --sizes 80x24 250x70
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from textual.app import App, ComposeResult  # noqa: E402
+from textual.containers import Container  # noqa: E402
+from textual.geometry import Region  # noqa: E402
+from textual.widgets import Digits  # noqa: E402
+
+from core.formatting import format_time  # noqa: E402
+from tui.bigdigits import BigDigits  # noqa: E402
+
+_THEME = Path(__file__).resolve().parent.parent / "src" / "tui" / "theme.tcss"
+
+
+class _DigitsApp(App):
+    CSS_PATH = str(_THEME)
+
+    def __init__(self, widget_cls) -> None:
+        super().__init__()
+        self.widget_cls = widget_cls
+
+    def compose(self) -> ComposeResult:
+        with Container(id="content"):
+            with Container(id="card-row"):
+                with Container(id="display-container"):
+                    with Container(id="time-row"):
+                        yield self.widget_cls("00:00:00", id="time-display")
+
+
+def _values(count: int) -> list[str]:
+    return [
+        format_time(second, show_centiseconds=False, fixed_hours=True) for second in range(count)
+    ]
+
+
+async def _measure(
+    widget_cls, size: tuple[int, int], updates: int, repaints: int
+) -> tuple[float, float, float]:
+    """Return render and repaint CPU seconds per update, and cells redrawn per update."""
+    app = _DigitsApp(widget_cls)
+    async with app.run_test(headless=True, size=size) as pilot:
+        widget = app.query_one("#time-display")
+        await pilot.pause()
+        crop = Region(0, 0, widget.size.width, widget.size.height)
+
+        values = _values(updates + 1)[1:]
+        render = time.process_time()
+        for value in values:
+            widget.update(value)
+            widget.render_lines(crop)
+        render = (time.process_time() - render) / updates
+        cells = getattr(widget, "cells_refreshed", 0) / updates
+
+        values = _values(repaints + 1)[1:]
+        repaint = time.process_time()
+        for value in values:
+            widget.update(value)
+            await pilot.pause()
+        repaint = (time.process_time() - repaint) / repaints
+    return render, repaint, cells
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--updates", type=int, default=5000)
+    parser.add_argument("--repaints", type=int, default=200)
+    parser.add_argument("--sizes", nargs="+", default=["80x24", "120x40", "200x60"])
+    args = parser.parse_args()
+
+    for spec in args.sizes:
+        width, height = (int(part) for part in spec.split("x"))
+        results = {}
+        for widget_cls in (Digits, BigDigits):
+            results[widget_cls] = await _measure(
+                widget_cls, (width, height), args.updates, args.repaints
+            )
+            render, repaint, cells = results[widget_cls]
+            detail = f"  cells/update {cells:4.2f}" if widget_cls is BigDigits else ""
+            print(
+                f"{spec:<8} {widget_cls.__name__:<10} render {render * 1e6:7.1f} us"
+                f"  repaint {repaint * 1e6:7.1f} us{detail}"
+            )
+        ratio = results[Digits][0] / results[BigDigits][0]
+        print(f"{spec:<8} BigDigits renders {ratio:.1f}x faster than Digits")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,195 @@
+"""Memory and time per CLI frame: cached views vs. rebuilding panels.
+
+Renders frames through a Rich `Live` into a captured console, first with the
+original code that builds a new `Panel` every iteration and calls
+`live.update`, then with `_StopwatchView`/`_CountdownView`, which mutate one
+panel and skip the redraw when nothing visible changed. For each it reports
+the tracemalloc peak (transient bytes allocated within a frame), net retained
+blocks per frame and time per frame, for unchanged frames (e.g. a keypress that changes
+nothing) and changed frames (a new second). It also checks that both produce
+identical output.
+
+Usage:
+    python benchmarks/cli_frames.py
+    python benchmarks/cli_frames.py --frames 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from rich import box  # noqa: E402
+from rich.align import Align  # noqa: E402
+from rich.console import Console, Group  # noqa: E402
+from rich.live import Live  # noqa: E402
+from rich.panel import Panel  # noqa: E402
+from rich.text import Text  # noqa: E402
+
+from cli.cli import _CountdownView, _StopwatchView  # noqa: E402
+from core.formatting import format_time  # noqa: E402
+from core.termclock import Countdown, Stopwatch  # noqa: E402
+
+SUBTITLE = "Space: Start/Stop | l: Lap | r: Reset | q: Quit"
+
+
+def reference_stopwatch_panel(stopwatch: Stopwatch, subtitle: str) -> Panel:
+    """The original per-frame builder, kept verbatim as the baseline."""
+    elapsed = stopwatch.elapsed
+    time_str = format_time(elapsed, show_centiseconds=False, fixed_hours=True)
+    style = "bold green" if stopwatch.is_running else "dim green"
+    border_style = "green" if stopwatch.is_running else "white"
+    lines = [
+        Align.center(Text(time_str, style=style)),
+        Align.center(Text("HH:MM:SS", style="dim")),
+    ]
+    if stopwatch.laps:
+        lines.append(Align.center(Text(stopwatch.laps.summary(), style="dim")))
+    return Panel(
+        Group(*lines),
+        title="Stopwatch",
+        subtitle=subtitle,
+        box=box.ROUNDED,
+        border_style=border_style,
+        padding=(1, 2),
+    )
+
+
+def reference_countdown_panel(countdown: Countdown, subtitle: str) -> Panel:
+    """The original per-frame builder, kept verbatim as the baseline."""
+    remaining = countdown.time_left
+    time_str = format_time(remaining, show_centiseconds=False)
+    color = "blue"
+    if remaining < 10:
+        color = "red"
+    elif remaining < 30:
+        color = "yellow"
+    style = f"bold {color}" if countdown.is_running else f"dim {color}"
+    border_style = color if countdown.is_running else "white"
+    return Panel(
+        Text(time_str, style=style, justify="center"),
+        title="Countdown",
+        subtitle=subtitle,
+        box=box.ROUNDED,
+        border_style=border_style,
+        padding=(1, 2),
+    )
+
+
+def _console(file=None) -> Console:
+    return Console(
+        file=file if file is not None else io.StringIO(),
+        width=80,
+        force_terminal=True,
+        color_system="truecolor",
+    )
+
+
+def _render(renderable) -> str:
+    console = _console()
+    console.print(renderable)
+    return console.file.getvalue()
+
+
+def _check_identical() -> None:
+    stopwatch_view, countdown_view = _StopwatchView(SUBTITLE), _CountdownView(SUBTITLE)
+    for seconds in (0.0, 59.5, 3600.0, 86399.0, 360000.0):
+        for running in (False, True):
+            stopwatch = Stopwatch(_accumulated_time=seconds)
+            if running:
+                stopwatch.start()
+            stopwatch.stop()
+            if seconds == 3600.0:
+                stopwatch.lap()
+            stopwatch_view.update(stopwatch)
+            assert _render(stopwatch_view.panel) == _render(
+                reference_stopwatch_panel(stopwatch, SUBTITLE)
+            ), ("stopwatch", seconds, running)
+    for seconds in (5, 25, 90, 7200):
+        for running in (False, True):
+            # Half a second from a boundary, so both renders show the same second.
+            countdown = Countdown(seconds + 0.5)
+            if not running:
+                countdown.pause()
+            countdown_view.update(countdown)
+            assert _render(countdown_view.panel) == _render(
+                reference_countdown_panel(countdown, SUBTITLE)
+            ), ("countdown", seconds, running)
+    print("output identical to the original panels")
+
+
+def _measure(name: str, frame: Callable[[int], None], frames: int) -> None:
+    frame(0)  # warm caches before measuring
+    started = time.perf_counter()
+    for i in range(1, frames + 1):
+        frame(i)
+    elapsed = time.perf_counter() - started
+
+    # Traced separately, since tracemalloc slows every allocation down.
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    transient = 0
+    for i in range(1, frames + 1):
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        frame(i)
+        transient += tracemalloc.get_traced_memory()[1] - current
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    print(
+        f"{name:<28} peak {transient / frames / 1024:7.1f} KiB/frame"
+        f"  net {blocks / frames:5.2f} blocks/frame"
+        f"  {elapsed / frames * 1e6:8.1f} µs/frame"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=2000)
+    args = parser.parse_args()
+
+    _check_identical()
+
+    stopwatches = [Stopwatch(_accumulated_time=t) for t in (1.0, 2.0)]
+    countdowns = [Countdown(t) for t in (3600, 1800)]
+    for countdown in countdowns:
+        countdown.pause()
+
+    sink = open(os.devnull, "w")
+    for label, reference, view, timers in (
+        ("stopwatch", reference_stopwatch_panel, _StopwatchView(SUBTITLE), stopwatches),
+        ("countdown", reference_countdown_panel, _CountdownView(SUBTITLE), countdowns),
+    ):
+        for changing in (False, True):
+            kind = "changed" if changing else "unchanged"
+
+            console = _console(sink)
+            with Live(auto_refresh=False, console=console, redirect_stdout=False) as live:
+
+                def rebuild(i: int) -> None:
+                    timer = timers[i % 2 if changing else 0]
+                    live.update(reference(timer, SUBTITLE), refresh=True)
+
+                _measure(f"{label} {kind} rebuild", rebuild, args.frames)
+
+            live = Live(view.panel, auto_refresh=False, console=console, redirect_stdout=False)
+            with live:
+
+                def cached(i: int) -> None:
+                    if view.update(timers[i % 2 if changing else 0]):
+                        live.refresh()
+
+                _measure(f"{label} {kind} cached", cached, args.frames)
+
+
+if __name__ == "__main__":
+    main()
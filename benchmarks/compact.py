@@ -0,0 +1,93 @@
+"""Memory and drift of the compact (slotted, integer-ns) timers.
+
+- memory: bytes per instance when holding `--count` instances (tracemalloc)
+- drift: error against exact integer time after simulating `--days` of
+  start/stop cycles on a machine that has been up for 100 days
+
+Usage:
+    python benchmarks/compact.py
+    python benchmarks/compact.py --count 100000 --days 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.clock import VirtualClock  # noqa: E402
+from core.termclock import (  # noqa: E402
+    CompactCountdown,
+    CompactStopwatch,
+    Countdown,
+    Stopwatch,
+)
+
+NS_PER_DAY = 86_400 * 1_000_000_000
+
+
+def bytes_per_instance(factory, count: int) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [factory() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Don't charge the list itself to the instances.
+    return (after - before - sys.getsizeof(instances)) / count
+
+
+def drift(days: float) -> dict[str, float]:
+    clock = VirtualClock(100 * NS_PER_DAY)
+
+    rng = random.Random(0)
+    regular, compact = Stopwatch(clock=clock), CompactStopwatch(clock)
+    exact_ns = 0
+    end = clock.now_ns() + int(days * NS_PER_DAY)
+    cycles = 0
+    while clock.now_ns() < end:
+        regular.start()
+        compact.start()
+        step = rng.randrange(1, 3_000_000_000)  # run for up to 3 s
+        clock.advance_ns(step)
+        exact_ns += step
+        regular.stop()
+        compact.stop()
+        clock.advance_ns(rng.randrange(1, 500_000_000))  # paused for up to 0.5 s
+        cycles += 1
+
+    return {
+        "cycles": cycles,
+        "Stopwatch": abs(regular.elapsed - exact_ns / 1e9),
+        "CompactStopwatch": abs(compact.elapsed_ns - exact_ns) / 1e9,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--days", type=float, default=30.0)
+    args = parser.parse_args()
+
+    factories = {
+        "Stopwatch": Stopwatch,
+        "CompactStopwatch": CompactStopwatch,
+        "Countdown": lambda: Countdown(60),
+        "CompactCountdown": lambda: CompactCountdown(60),
+    }
+    print(f"memory at {args.count:,} instances")
+    for name, factory in factories.items():
+        print(f"  {name:<18} {bytes_per_instance(factory, args.count):7.1f} bytes")
+
+    result = drift(args.days)
+    print(f"drift after {args.days:g} simulated days ({result['cycles']:,} cycles)")
+    for name in ("Stopwatch", "CompactStopwatch"):
+        print(f"  {name:<18} {result[name] * 1e6:10.3f} µs")
+    assert result["CompactStopwatch"] == 0, "integer-ns stopwatch drifted"
+
+
+if __name__ == "__main__":
+    main()
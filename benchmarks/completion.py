@@ -0,0 +1,171 @@
+"""How late countdowns finish, with and without `--precise`.
+
+Runs the real CLI countdown (`run_countdown_cli`) many times with its stdin on
+a pseudo-terminal. Each run uses a clock that jumps ahead just after the
+countdown reads its start time, so a 1 s countdown expires 5-20 ms later and
+the loop goes through its real final wait (`coarse_timeout` and `wait_until`
+in precise mode). Lateness is measured from the deadline to the moment the
+"Time's Up" panel is written, so it includes drawing that frame.
+
+A third pass presses space just after each deadline, inside the wait's wake
+slack, which is where a keypress once crashed the finished countdown. Any
+exception fails the run. Optionally runs the TUI headless too. Exits with
+status 1 if the precise median lateness exceeds `--bound`. The bound is
+advisory: the tail percentiles are reported but not gated, since preemption
+on a busy machine defeats any spin and makes them swing from run to run.
+
+Usage:
+    python benchmarks/completion.py
+    python benchmarks/completion.py --runs 500 --bound 3 --tui
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import os
+import random
+import statistics
+import sys
+import threading
+from pathlib import Path
+from time import monotonic, sleep
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from cli.cli import run_countdown_cli  # noqa: E402
+
+
+class _SkippingClock:
+    """`monotonic()`, but jumps ahead by `skip` seconds right after its first reading.
+
+    The countdown takes its deadline from that first reading, so a countdown of
+    `seconds` expires `seconds - skip` seconds of real time after it starts.
+    """
+
+    def __init__(self, skip: float, seconds: int) -> None:
+        self.skip = skip
+        self.seconds = seconds
+        self.deadline: float | None = None
+
+    def now(self) -> float:
+        if self.deadline is None:
+            start = monotonic()
+            self.deadline = start + self.seconds
+            return start
+        return monotonic() + self.skip
+
+    def now_ns(self) -> int:
+        return round(self.now() * 1e9)
+
+
+class _Screen(io.StringIO):
+    """Stands in for stdout: notes when the "Time's Up" panel is written, then quits."""
+
+    def __init__(self, clock: _SkippingClock, master: int) -> None:
+        super().__init__()
+        self.clock = clock
+        self.master = master
+        self.shown_at: float | None = None
+
+    def isatty(self) -> bool:
+        return True  # so Rich draws live frames instead of waiting for the end
+
+    def write(self, text: str) -> int:
+        if self.shown_at is None and "Time's Up" in text:
+            self.shown_at = self.clock.now()
+            os.write(self.master, b"q")  # end the 2 s "Time's Up" display
+        return super().write(text)
+
+
+def _run_once(precise: bool, press: bool) -> float:
+    """Run one countdown to completion and return how late its panel appeared."""
+    seconds = 1
+    clock = _SkippingClock(seconds - random.uniform(0.005, 0.02), seconds)
+    master, slave = os.openpty()
+    stdin, stdout = os.dup(0), sys.stdout
+    screen = _Screen(clock, master)
+    presser = None
+    if press:
+
+        def press_after_deadline() -> None:
+            while clock.deadline is None or clock.now() < clock.deadline + 0.001:
+                sleep(0.0005)
+            os.write(master, b" ")
+
+        presser = threading.Thread(target=press_after_deadline, daemon=True)
+    try:
+        os.dup2(slave, 0)
+        sys.stdout = screen
+        if presser is not None:
+            presser.start()
+        run_countdown_cli(seconds, precise=precise, clock=clock)
+    finally:
+        sys.stdout = stdout
+        os.dup2(stdin, 0)
+        os.close(stdin)
+        if presser is not None:
+            presser.join()
+        os.close(master)
+        os.close(slave)
+    if screen.shown_at is None:
+        raise RuntimeError("the countdown never showed Time's Up")
+    return screen.shown_at - clock.deadline
+
+
+def _lateness(runs: int, precise: bool, press: bool = False) -> list[float]:
+    return [_run_once(precise, press) for _ in range(runs)]
+
+
+async def _tui_lateness(runs: int) -> list[float]:
+    from tui import CountdownTui
+
+    late = []
+    for _ in range(runs):
+        app = CountdownTui(1, precise=True)
+        async with app.run_test(headless=True):
+            while app.completion_latency is None:
+                await asyncio.sleep(0.05)
+        late.append(app.completion_latency)
+    return late
+
+
+def _report(name: str, late: list[float]) -> float:
+    """Print the lateness percentiles and return the median."""
+    ordered = sorted(late)
+
+    def pct(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+    print(
+        f"{name:<12} p50 {statistics.median(ordered) * 1000:7.3f} ms"
+        f"  p95 {pct(0.95) * 1000:7.3f} ms  p99 {pct(0.99) * 1000:7.3f} ms"
+        f"  max {ordered[-1] * 1000:7.3f} ms"
+    )
+    return statistics.median(ordered)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument(
+        "--bound", type=float, default=2.0, help="max precise median, in ms (advisory)"
+    )
+    parser.add_argument("--tui", action="store_true", help="also time the TUI (1 s per run)")
+    args = parser.parse_args()
+
+    _report("default", _lateness(args.runs, precise=False))
+    median = _report("precise", _lateness(args.runs, precise=True))
+    _report("key at end", _lateness(args.runs, precise=False, press=True))
+    if args.tui:
+        _report("tui precise", asyncio.run(_tui_lateness(5)))
+
+    if median * 1000 > args.bound:
+        print(f"precise median exceeds {args.bound} ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""Load test for `tm daemon` over a local Unix socket.
+
+Starts the daemon in a subprocess, creates timers, connects many subscribers on
+one asyncio loop, and reports pushed events per second, request round-trip
+latency under that load, and the daemon's CPU time.
+
+Usage:
+    python benchmarks/daemon_load.py
+    python benchmarks/daemon_load.py --subscribers 5000 --timers 100 --seconds 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC))
+
+from daemon.protocol import decode, encode  # noqa: E402
+
+
+async def _call(reader, writer, message: dict) -> dict:
+    writer.write(encode(message))
+    return decode(await reader.readline())
+
+
+async def _subscriber(path: str, names, counts: list[int], index: int) -> None:
+    reader, writer = await asyncio.open_unix_connection(path, limit=1 << 22)
+    message = {"op": "subscribe", "names": names} if names else {"op": "subscribe"}
+    await _call(reader, writer, message)
+    try:
+        while await reader.readline():
+            counts[index] += 1
+    finally:
+        writer.close()
+
+
+async def run(path: str, args) -> None:
+    reader, writer = await asyncio.open_unix_connection(path)
+    for i in range(args.timers):
+        seconds = None if i % 2 else 3600
+        message = {"op": "create", "name": f"t{i}"}
+        if seconds:
+            message["seconds"] = seconds
+        await _call(reader, writer, message)
+
+    counts = [0] * args.subscribers
+    names = ["t0"] if args.one_timer else None
+    tasks = [
+        asyncio.create_task(_subscriber(path, names, counts, i))
+        for i in range(args.subscribers)
+    ]
+    await asyncio.sleep(1.0)  # let every subscriber connect
+
+    start_counts = sum(counts)
+    started = time.perf_counter()
+    latencies = []
+    while time.perf_counter() - started < args.seconds:
+        sent = time.perf_counter()
+        await _call(reader, writer, {"op": "query", "name": "t0"})
+        latencies.append(time.perf_counter() - sent)
+        await asyncio.sleep(0.01)
+    elapsed = time.perf_counter() - started
+    events = sum(counts) - start_counts
+
+    failed = sum(1 for task in tasks if task.done() and task.exception())
+    for task in tasks:
+        task.cancel()
+    writer.close()
+
+    latencies.sort()
+    print(f"subscribers        {args.subscribers}")
+    print(f"timers             {args.timers}")
+    print(f"events pushed      {events / elapsed:,.0f}/s")
+    print(f"failed to connect  {failed}")
+    print(f"query latency p50  {statistics.median(latencies) * 1000:.2f} ms")
+    print(f"query latency p99  {latencies[int(len(latencies) * 0.99)] * 1000:.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--subscribers", type=int, default=1000)
+    parser.add_argument("--timers", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument(
+        "--one-timer", action="store_true", help="Subscribe to a single timer only."
+    )
+    args = parser.parse_args()
+
+    # Each subscriber needs a socket here and one in the daemon.
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "tm.sock")
+        daemon = subprocess.Popen(
+            [sys.executable, "-c", "import app; app.main()", "daemon", "--socket", path],
+            env=dict(os.environ, PYTHONPATH=str(SRC)),
+        )
+        while not os.path.exists(path):
+            time.sleep(0.05)
+        try:
+            asyncio.run(run(path, args))
+        finally:
+            daemon.terminate()
+            _, _, usage = os.wait4(daemon.pid, 0)
+        print(f"daemon cpu         {usage.ru_utime + usage.ru_stime:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
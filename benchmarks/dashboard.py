@@ -0,0 +1,60 @@
+"""Idle and scrolling cost of `tm dash` as the number of timers grows.
+
+Runs `DashboardTui` headless with N generated timers and reports, per second
+of idle time, the CPU used, refresh wakeups and table lines rendered, then the
+CPU per page of scrolling. With a virtual table all of these should stay flat
+as N grows.
+
+Usage:
+    python benchmarks/dashboard.py
+    python benchmarks/dashboard.py --timers 100 10000 100000 --seconds 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from tui.dashboard import DashboardTui  # noqa: E402
+
+
+async def _measure(count: int, seconds: float, pages: int) -> None:
+    app = DashboardTui.demo(count)
+    async with app.run_test(headless=True, size=(100, 40)) as pilot:
+        await pilot.pause()
+        table = app.table
+        lines, wakeups = table.lines_rendered, app.refresher.wakeups
+        cpu = time.process_time()
+        await asyncio.sleep(seconds)
+        cpu = time.process_time() - cpu
+        idle = (
+            f"idle cpu {cpu / seconds * 1000:6.1f} ms/s"
+            f"  wakeups {(app.refresher.wakeups - wakeups) / seconds:5.1f}/s"
+            f"  lines {(table.lines_rendered - lines) / seconds:6.1f}/s"
+        )
+
+        cpu = time.process_time()
+        for _ in range(pages):
+            await pilot.press("pagedown")
+        await pilot.pause()
+        cpu = time.process_time() - cpu
+        print(f"{count:>7} timers  {idle}  scroll {cpu / pages * 1000:6.2f} ms/page")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--timers", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--pages", type=int, default=20)
+    args = parser.parse_args()
+    for count in args.timers:
+        await _measure(count, args.seconds, args.pages)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,93 @@
+"""Cost of `--metrics-file` to a 60 Hz stopwatch loop.
+
+Runs the CLI's stopwatch frame (`_StopwatchView.update` plus profiler
+bookkeeping) at 60 Hz for `--seconds`, once without an exporter and once with
+one rewriting its file every `--interval` seconds, toggling the stopwatch twice
+a second so state changes trigger extra (coalesced) writes. Reports the loop
+thread's CPU time per frame and the frame-time percentiles for both runs, and
+the number of file writes.
+
+Usage:
+    python benchmarks/exporter.py
+    python benchmarks/exporter.py --seconds 10 --interval 0.1
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter, sleep, thread_time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from cli.cli import _StopwatchView  # noqa: E402
+from core.exporter import MetricsExporter  # noqa: E402
+from core.profiling import LoopProfiler  # noqa: E402
+from core.termclock import Stopwatch  # noqa: E402
+
+_FRAME = 1 / 60
+
+
+def _run(seconds: float, exporter: MetricsExporter | None) -> tuple[list[float], float]:
+    """Return frame times and the loop thread's CPU seconds per frame."""
+    stopwatch = Stopwatch()
+    stopwatch.start()
+    profiler = LoopProfiler()
+    view = _StopwatchView("")
+    if exporter is not None:
+        exporter.start(stopwatch, profiler)
+
+    frames = []
+    cpu = thread_time()
+    started = next_frame = perf_counter()
+    toggle_every = int(0.5 / _FRAME)
+    count = 0
+    while perf_counter() - started < seconds:
+        frame = perf_counter()
+        view.update(stopwatch)
+        count += 1
+        if count % toggle_every == 0:
+            stopwatch.toggle()
+            if exporter is not None:
+                exporter.publish()
+        rendered = perf_counter()
+        next_frame += _FRAME
+        sleep(max(0.0, next_frame - perf_counter()))
+        woke = perf_counter()
+        profiler.record(frame, rendered, _FRAME, woke, True)
+        frames.append(rendered - frame)
+    cpu = (thread_time() - cpu) / count
+    if exporter is not None:
+        exporter.close()
+    return frames, cpu
+
+
+def _report(name: str, frames: list[float], cpu: float) -> None:
+    ordered = sorted(frames)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(
+        f"{name:<10} frames {len(frames):>5}  cpu/frame {cpu * 1e6:7.1f} us"
+        f"  frame p50 {statistics.median(ordered) * 1e6:7.1f} us  p99 {p99 * 1e6:7.1f} us"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--interval", type=float, default=1.0)
+    args = parser.parse_args()
+
+    _report("baseline", *_run(args.seconds, None))
+    with tempfile.TemporaryDirectory() as directory:
+        exporter = MetricsExporter(os.path.join(directory, "tm.prom"), interval=args.interval)
+        _report("exporter", *_run(args.seconds, exporter))
+    print(f"{exporter.writes} metrics file writes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
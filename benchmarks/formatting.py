@@ -0,0 +1,109 @@
+"""Micro-benchmark for `core.formatting` against the original `format_time`.
+
+Checks that `format_time` and `format_times` produce byte-identical output to the
+reference implementation, then times both.
+
+Usage:
+    python benchmarks/formatting.py
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.formatting import format_time, format_times  # noqa: E402
+
+
+def reference_format_time(seconds: float, *, show_centiseconds: bool = True) -> str:
+    """The original implementation, kept verbatim as the source of truth."""
+
+    seconds = max(0.0, float(seconds))
+    minutes, secs = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+
+    if show_centiseconds:
+        centiseconds = int((seconds * 100) % 100)
+        if hours > 0:
+            return f"{int(hours):02}:{int(minutes):02}:{int(secs):02}.{centiseconds:02}"
+        return f"{int(minutes):02}:{int(secs):02}.{centiseconds:02}"
+
+    if hours > 0:
+        return f"{int(hours):02}:{int(minutes):02}:{int(secs):02}"
+    return f"{int(minutes):02}:{int(secs):02}"
+
+
+def reference_stopwatch(seconds: float) -> str:
+    """The original HH:MM:SS re-padding done by the stopwatch UIs."""
+    time_str = reference_format_time(seconds, show_centiseconds=False)
+    if time_str.count(":") == 1:
+        return f"00:{time_str}"
+    return time_str
+
+
+def _samples() -> list[float]:
+    rng = random.Random(0)
+    edges = [0, 0.0, -1, -0.5, 0.004, 0.999, 59.999, 60, 3599.995, 3600, 359999.99]
+    edges += [360000, 10**7 + 0.5, float("nan")]
+    floats = [rng.uniform(0, 400_000) for _ in range(100_000)]
+    ints = [rng.randrange(-10, 400_000) for _ in range(20_000)]
+    return edges + floats + ints
+
+
+def check(samples: list[float]) -> None:
+    for show_centiseconds in (True, False):
+        expected = [
+            reference_format_time(v, show_centiseconds=show_centiseconds)
+            for v in samples
+        ]
+        actual = [format_time(v, show_centiseconds=show_centiseconds) for v in samples]
+        assert actual == expected, "format_time output differs from reference"
+        batch = format_times(samples, show_centiseconds=show_centiseconds)
+        assert batch == expected, "format_times output differs from reference"
+
+    expected = [reference_stopwatch(v) for v in samples]
+    fixed = [format_time(v, show_centiseconds=False, fixed_hours=True) for v in samples]
+    assert fixed == expected, "fixed_hours output differs from stopwatch padding"
+    print(f"output identical for {len(samples)} samples")
+
+
+def main() -> None:
+    samples = _samples()
+    check(samples)
+
+    values = samples[:10_000]
+    cases = {
+        "format_time (float)": (
+            lambda: [reference_format_time(v) for v in values],
+            lambda: [format_time(v) for v in values],
+        ),
+        "format_time (int, no cs)": (
+            lambda: [reference_format_time(v, show_centiseconds=False) for v in range(10_000)],
+            lambda: [format_time(v, show_centiseconds=False) for v in range(10_000)],
+        ),
+        "stopwatch HH:MM:SS": (
+            lambda: [reference_stopwatch(v) for v in values],
+            lambda: [
+                format_time(v, show_centiseconds=False, fixed_hours=True) for v in values
+            ],
+        ),
+        "batch, no cs": (
+            lambda: [reference_format_time(v, show_centiseconds=False) for v in values],
+            lambda: format_times(values, show_centiseconds=False),
+        ),
+    }
+    for name, (reference, current) in cases.items():
+        t_ref = min(timeit.repeat(reference, number=5, repeat=5)) / 5 / len(values)
+        t_cur = min(timeit.repeat(current, number=5, repeat=5)) / 5 / len(values)
+        print(
+            f"{name:<26} reference {t_ref * 1e9:7.0f} ns  current {t_cur * 1e9:7.0f} ns"
+            f"  ({t_ref / t_cur:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
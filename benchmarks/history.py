@@ -0,0 +1,87 @@
+"""`tm stats` query time over a large session history.
+
+Writes N sessions spread over D days into a temporary log (records and index
+written in bulk, in the same format `SessionLog.append` produces), checks a
+sample of real appends, then times `stats()` for the last week, the last
+month and the whole history. Only the last two should grow with N.
+
+Usage:
+    python benchmarks/history.py
+    python benchmarks/history.py --sessions 1000000 --days 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, datetime, time as dtime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.history import _INDEX, _RECORD, SessionLog, stats  # noqa: E402
+
+TAGS = ["", "focus", "reading", "email", "review", "exercise"]
+
+
+def _fill(log: SessionLog, sessions: int, days: int) -> None:
+    rng = random.Random(0)
+    today = date.today()
+    per_day = sessions // days
+    os.makedirs(log.directory, exist_ok=True)
+    with open(log.data_path, "wb") as data, open(log.index_path, "wb") as index:
+        number = 0
+        for offset in range(days - 1, -1, -1):
+            day = today - timedelta(days=offset)
+            index.write(_INDEX.pack(day.toordinal(), number))
+            midnight = datetime.combine(day, dtime()).timestamp()
+            ends = sorted(midnight + rng.uniform(0, 86000) for _ in range(per_day))
+            records = bytearray()
+            for ended in ends:
+                countdown = rng.random() < 0.5
+                active = rng.uniform(60, 3600)
+                tag = rng.choice(TAGS).encode()
+                planned = active if countdown else 0.0
+                records += _RECORD.pack(ended, active, planned, countdown, countdown, tag)
+            data.write(records)
+            number += per_day
+
+
+def _time(label: str, fn) -> None:
+    started = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - started
+    sessions = sum(entry.sessions for entry in result.values())
+    print(f"{label:<24} {elapsed * 1000:9.2f} ms  ({sessions} sessions, {len(result)} groups)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=500_000)
+    parser.add_argument("--days", type=int, default=730)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        log = SessionLog(directory)
+        started = time.perf_counter()
+        _fill(log, args.sessions, args.days)
+        print(f"wrote {len(log)} sessions in {time.perf_counter() - started:.1f} s")
+
+        started = time.perf_counter()
+        for _ in range(1000):
+            log.append("stopwatch", 90.0, tag="appended")
+        print(f"{'append':<24} {(time.perf_counter() - started):9.3f} ms/op")
+        today = stats(log, 1, by="tag")
+        assert today["appended"].sessions == 1000, today
+
+        _time("last 7 days by day", lambda: stats(log, 7))
+        _time("last 30 days by tag", lambda: stats(log, 30, by="tag"))
+        _time("everything by week", lambda: stats(log, args.days, by="week"))
+
+
+if __name__ == "__main__":
+    main()
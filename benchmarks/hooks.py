@@ -0,0 +1,71 @@
+"""Cost of hooks to the display loop, with hooks slower than their interval.
+
+Drives a stopwatch on a `VirtualClock` through `--ticks` tick boundaries,
+calling `HookRunner.poll()` after each one as a redraw would. The tick hook
+sleeps for `--hook-seconds`, far longer than the loop takes to reach the next
+boundary, so most ticks find the previous run still going and are skipped.
+Reports the per-poll cost, how many runs started or were skipped, and the
+queue delay and run time of the runs. Exits with status 1 if the slowest poll
+exceeds `--bound`.
+
+Usage:
+    python benchmarks/hooks.py
+    python benchmarks/hooks.py --ticks 2000 --hook-seconds 0.5 --bound 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.clock import VirtualClock  # noqa: E402
+from core.hooks import HookRunner, TickHook  # noqa: E402
+from core.termclock import Stopwatch  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=1000)
+    parser.add_argument("--hook-seconds", type=float, default=0.2)
+    parser.add_argument("--bound", type=float, default=5.0, help="max poll time, in ms")
+    args = parser.parse_args()
+
+    clock = VirtualClock()
+    stopwatch = Stopwatch(clock=clock)
+    stopwatch.start()
+    hooks = HookRunner(
+        on_tick=[TickHook(1, f"sleep {args.hook_seconds}"), TickHook(1, "true")],
+        timeout=args.hook_seconds * 10,
+    )
+
+    polls = []
+    started = perf_counter()
+    for _ in range(args.ticks):
+        clock.advance(1.0)
+        before = perf_counter()
+        hooks.poll(stopwatch)
+        polls.append(perf_counter() - before)
+    loop = perf_counter() - started
+    hooks.close()
+
+    runs = list(hooks.records)
+    print(
+        f"{args.ticks} ticks in {loop * 1000:.1f} ms: poll p50 "
+        f"{statistics.median(polls) * 1e6:.1f} us, max {max(polls) * 1e6:.1f} us"
+    )
+    print(f"{len(runs)} runs, {hooks.skipped} skipped while the previous run was going")
+    hooks.print_report(sys.stdout)
+
+    if max(polls) * 1000 > args.bound:
+        print(f"slowest poll exceeds {args.bound} ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
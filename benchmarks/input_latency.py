@@ -0,0 +1,147 @@
+"""Keypress-to-state-change latency of the CLI input loop.
+
+Replays the stopwatch CLI loop on a pseudo-terminal: a writer thread sends
+bursts of keys (as a paste or key auto-repeat would), and the loop toggles a
+`Stopwatch` for every space it reads. Latency is measured from the write to
+the moment the last key of the burst has changed the stopwatch. The batched
+reader (`NonBlockingInput.read_keys`) is compared with the old one-character
+buffered `sys.stdin.read(1)`, whose read-ahead hides the rest of a burst from
+`select` until more input arrives. Exits with status 1 if the batched p95
+latency exceeds `--bound`.
+
+A burst whose keys are still unhandled after 1 s is reported as stranded, and
+the next burst is sent anyway. Both loops wait at most 1 s per wakeup here,
+since a paused stopwatch would otherwise block until the next keypress.
+
+Usage:
+    python benchmarks/input_latency.py
+    python benchmarks/input_latency.py --bursts 100 --keys 6 --bound 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import select
+import statistics
+import sys
+import threading
+from pathlib import Path
+from time import perf_counter, sleep
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from cli.cli import NonBlockingInput, _wait_timeout  # noqa: E402
+from core.termclock import Stopwatch  # noqa: E402
+
+
+class _OneCharReader:
+    """The previous reader: `select`, then one buffered character per wakeup."""
+
+    def __init__(self, fd: int) -> None:
+        self.fd = fd
+        self.file = open(fd, "r", closefd=False)
+
+    def read_keys(self, timeout: float) -> list[str]:
+        if select.select([self.fd], [], [], timeout)[0]:
+            return [self.file.read(1)]
+        return []
+
+
+def _burst(keys: int) -> bytes:
+    # Spaces with an arrow key in the middle, as its escape sequence.
+    half = keys // 2
+    return b" " * half + b"\x1b[A" + b" " * (keys - half)
+
+
+def _measure(reader_cls, bursts: int, keys: int) -> tuple[list[float], float, int]:
+    """Return per-burst latencies, mean wakeups per burst and the stranded burst count.
+
+    A burst is stranded if its keys are still unhandled when the writer gives
+    up waiting (after 1 s) and sends the next one.
+    """
+    master, slave = os.openpty()
+    sent: list[float] = []
+    handled = threading.Event()
+
+    def writer() -> None:
+        for _ in range(bursts):
+            sleep(random.uniform(0.01, 0.05))
+            handled.clear()
+            sent.append(perf_counter())
+            os.write(master, _burst(keys))
+            handled.wait(1.0)
+
+    stopwatch = Stopwatch()
+    stopwatch.start()
+    latencies: list[float] = []
+    stranded = wakeups = toggles = 0
+    thread = threading.Thread(target=writer, daemon=True)
+    try:
+        with NonBlockingInput(slave) as keyboard:
+            reader = keyboard if reader_cls is NonBlockingInput else reader_cls(slave)
+            thread.start()
+            while thread.is_alive() or len(latencies) + stranded < len(sent):
+                timeout = _wait_timeout(stopwatch.until_next_second())
+                pressed = reader.read_keys(1.0 if timeout is None else min(timeout, 1.0))
+                if not pressed:
+                    if not thread.is_alive():
+                        stranded = len(sent) - len(latencies)
+                    continue
+                wakeups += 1
+                for key in pressed:
+                    if key == " ":
+                        stopwatch.toggle()
+                        toggles += 1
+                now = perf_counter()
+                # Settle the bursts whose last key just landed. Any burst overtaken
+                # by a newer one counts as stranded.
+                while toggles >= keys * (len(latencies) + stranded + 1):
+                    burst = len(latencies) + stranded
+                    if burst < len(sent) - 1:
+                        stranded += 1
+                    else:
+                        latencies.append(now - sent[burst])
+                        handled.set()
+    finally:
+        thread.join()
+        os.close(master)
+        os.close(slave)
+    return latencies, wakeups / bursts, stranded
+
+
+def _report(name: str, latencies: list[float], wakeups: float, stranded: int) -> float:
+    if not latencies:
+        print(f"{name:<9} every burst stranded")
+        return float("inf")
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(
+        f"{name:<9} p50 {statistics.median(ordered) * 1000:8.3f} ms"
+        f"  p95 {p95 * 1000:8.3f} ms  max {ordered[-1] * 1000:8.3f} ms"
+        f"  wakeups/burst {wakeups:5.2f}  stranded {stranded}"
+    )
+    return p95
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bursts", type=int, default=50)
+    parser.add_argument("--keys", type=int, default=4, help="spaces per burst")
+    parser.add_argument("--bound", type=float, default=5.0, help="max batched p95, in ms")
+    parser.add_argument("--skip-old", action="store_true", help="don't time the old reader")
+    args = parser.parse_args()
+
+    p95 = _report("batched", *_measure(NonBlockingInput, args.bursts, args.keys))
+    if not args.skip_old:
+        _report("read(1)", *_measure(_OneCharReader, args.bursts, args.keys))
+
+    if p95 * 1000 > args.bound:
+        print(f"batched p95 exceeds {args.bound} ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
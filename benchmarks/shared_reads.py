@@ -0,0 +1,76 @@
+"""Read throughput of the memory-mapped shared timer state.
+
+Publishes a running stopwatch and countdown with `SharedStateWriter`, then times
+`SharedStateReader.read()` in a tight loop, optionally while another process
+republishes continuously (exercising seqlock retries).
+
+Usage:
+    python benchmarks/shared_reads.py
+    python benchmarks/shared_reads.py --reads 2000000 --contended
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.shared import SharedStateReader, SharedStateWriter  # noqa: E402
+from core.termclock import Countdown, Stopwatch  # noqa: E402
+
+
+def _republish(path: str, stop) -> None:
+    stopwatch = Stopwatch()
+    with SharedStateWriter(path, stopwatch) as shared:
+        while not stop.is_set():
+            stopwatch.toggle()
+            shared.publish()
+
+
+def _time_reads(path: str, reads: int) -> float:
+    with SharedStateReader(path) as reader:
+        read = reader.read
+        started = time.perf_counter()
+        for _ in range(reads):
+            read()
+        return reads / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reads", type=int, default=1_000_000)
+    parser.add_argument(
+        "--contended", action="store_true", help="Also measure with a busy writer."
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stopwatch = Stopwatch()
+        stopwatch.start()
+        for name, timer in (("stopwatch", stopwatch), ("countdown", Countdown(3600))):
+            path = os.path.join(tmp, name)
+            with SharedStateWriter(path, timer):
+                print(f"{name:<22} {_time_reads(path, args.reads):>12,.0f} reads/s")
+
+        if args.contended:
+            path = os.path.join(tmp, "contended")
+            SharedStateWriter(path, Stopwatch()).close()
+            stop = multiprocessing.Event()
+            writer = multiprocessing.Process(target=_republish, args=(path, stop))
+            writer.start()
+            try:
+                rate = _time_reads(path, args.reads)
+            finally:
+                stop.set()
+                writer.join()
+            print(f"{'stopwatch (contended)':<22} {rate:>12,.0f} reads/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Replay a day of timer activity on a virtual clock and check the results.
+
+Creates N countdowns of up to 24 hours, pauses and resumes each once at a
+random point, and runs them with `core.simulation.Simulation`. Every expiry must
+land exactly at duration + time paused. Also replays stopwatch start/stop
+cycles and checks their elapsed totals. Reports how long the replay took.
+
+Usage:
+    python benchmarks/simulate.py
+    python benchmarks/simulate.py --countdowns 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.simulation import Simulation  # noqa: E402
+
+DAY = 86_400.0
+
+
+def countdowns(count: int) -> None:
+    rng = random.Random(0)
+    sim = Simulation()
+    registry = sim.registry
+    expected = {}
+    for i in range(count):
+        name = f"countdown-{i}"
+        duration = rng.uniform(60, DAY)
+        registry.add_countdown(name, duration)
+        pause_at = rng.uniform(0, duration)
+        paused_for = rng.uniform(0, 3600)
+        sim.at(pause_at, lambda name=name: registry.pause(name))
+        sim.at(pause_at + paused_for, lambda name=name: registry.resume(name))
+        expected[name] = duration + paused_for
+
+    started = time.perf_counter()
+    steps = sim.run()
+    elapsed = time.perf_counter() - started
+
+    assert len(sim.finished) == count, len(sim.finished)
+    worst = max(abs(when - expected[name]) for when, name in sim.finished)
+    assert worst < 1e-6, f"expiry off by {worst} s"
+    print(
+        f"{count} countdowns, {steps} steps, {sim.now / 3600:.1f} simulated hours"
+        f" in {elapsed * 1000:.0f} ms (worst error {worst * 1e9:.0f} ns)"
+    )
+
+
+def stopwatches(count: int, cycles: int) -> None:
+    rng = random.Random(1)
+    sim = Simulation()
+    registry = sim.registry
+    expected = {}
+    for i in range(count):
+        name = f"stopwatch-{i}"
+        registry.add_stopwatch(name)
+        moment, total = 0.0, 0.0
+        for _ in range(cycles):
+            run_for, rest = rng.uniform(1, 600), rng.uniform(1, 600)
+            sim.at(moment, lambda name=name: registry.resume(name))
+            sim.at(moment + run_for, lambda name=name: registry.pause(name))
+            moment += run_for + rest
+            total += run_for
+        expected[name] = total
+
+    started = time.perf_counter()
+    steps = sim.run()
+    elapsed = time.perf_counter() - started
+
+    worst = max(abs(registry[name].elapsed - total) for name, total in expected.items())
+    assert worst < 1e-6, f"elapsed off by {worst} s"
+    print(
+        f"{count} stopwatches x {cycles} cycles, {steps} steps,"
+        f" {sim.now / 3600:.1f} simulated hours in {elapsed * 1000:.0f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--countdowns", type=int, default=10_000)
+    parser.add_argument("--stopwatches", type=int, default=1_000)
+    parser.add_argument("--cycles", type=int, default=100)
+    args = parser.parse_args()
+
+    countdowns(args.countdowns)
+    stopwatches(args.stopwatches, args.cycles)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Startup-time benchmark for the `tm` entry point.
+
+Runs each scenario in a fresh interpreter with `python -X importtime` and reports
+process wall time plus the import cost grouped by top-level package.
+
+- cold: bytecode is compiled from scratch (empty `PYTHONPYCACHEPREFIX`)
+- warm: bytecode cache already populated (median of `--repeat` runs)
+
+Usage:
+    python benchmarks/startup.py
+    python benchmarks/startup.py --repeat 10 --json startup.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+# name -> code run by the child interpreter. Interactive modes can't run without a
+# TTY, so they are measured up to the point where the UI module has been imported.
+SCENARIOS: dict[str, str] = {
+    "tm --help": "import app; app.app(['--help'])",
+    "tm sw --help": "import app; app.app(['sw', '--help'])",
+    "tm cd --help": "import app; app.app(['cd', '--help'])",
+    "tm sw --cli": "import app; import cli.cli",
+    "tm sw": "import app; import tui",
+}
+
+
+def _run(code: str, pycache: str) -> tuple[float, dict[str, int]]:
+    env = dict(os.environ, PYTHONPATH=str(SRC), PYTHONPYCACHEPREFIX=pycache)
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    wall = time.perf_counter() - started
+    return wall, _parse_importtime(proc.stderr)
+
+
+def _parse_importtime(stderr: str) -> dict[str, int]:
+    """Sum self-time (µs) per top-level package from `-X importtime` output."""
+    totals: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _cumulative, name = line[len("import time:") :].split("|")
+        package = name.strip().split(".")[0]
+        totals[package] = totals.get(package, 0) + int(self_us)
+    return totals
+
+
+def _top(totals: dict[str, int], n: int = 5) -> str:
+    ranked = sorted(totals.items(), key=lambda item: item[1], reverse=True)[:n]
+    return ", ".join(f"{name} {us / 1000:.1f}ms" for name, us in ranked)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Warm runs per scenario.")
+    parser.add_argument("--json", type=Path, help="Write results to this JSON file.")
+    args = parser.parse_args()
+
+    results: dict[str, dict] = {}
+    for name, code in SCENARIOS.items():
+        with tempfile.TemporaryDirectory() as pycache:
+            cold_wall, cold_imports = _run(code, pycache)
+            warm = [_run(code, pycache) for _ in range(args.repeat)]
+
+        warm_wall = statistics.median(wall for wall, _ in warm)
+        warm_imports = warm[-1][1]
+        results[name] = {
+            "cold_wall_ms": round(cold_wall * 1000, 2),
+            "warm_wall_ms": round(warm_wall * 1000, 2),
+            "cold_imports_us": cold_imports,
+            "warm_imports_us": warm_imports,
+        }
+        print(
+            f"{name:<14} cold {cold_wall * 1000:7.1f}ms  warm {warm_wall * 1000:7.1f}ms"
+            f"  | {_top(warm_imports)}"
+        )
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""Benchmark suite for core, CLI frame cost and headless TUI throughput.
+
+Writes every metric to a JSON file so results can be diffed between releases,
+and can compare against an earlier run to flag regressions.
+
+- core: `format_time`, `Stopwatch.elapsed`, `Countdown.time_left`/`until_next_second`
+- cli:  updating the cached Rich panel and rendering one frame into a captured console
+- tui:  frames/s and CPU per frame for `StopwatchTui`/`CountdownTui` under
+        Textual's headless `run_test` pilot
+
+Usage:
+    python benchmarks/suite.py --output bench.json
+    python benchmarks/suite.py --output new.json --compare old.json --threshold 0.15
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import json
+import platform
+import sys
+import time
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from rich.console import Console  # noqa: E402
+
+from cli.cli import _CountdownView, _StopwatchView  # noqa: E402
+from core.formatting import format_time  # noqa: E402
+from core.termclock import Countdown, Stopwatch  # noqa: E402
+from tui import CountdownTui, StopwatchTui  # noqa: E402
+
+# name -> {"value": ..., "unit": ..., "lower_is_better": ...}
+Results = dict[str, dict]
+
+
+def _per_call_ns(fn: Callable[[], object], number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e9
+
+
+def bench_core(results: Results) -> None:
+    stopwatch = Stopwatch()
+    stopwatch.start()
+    countdown = Countdown(3600)
+    cases = {
+        "core.format_time": lambda: format_time(3723.45),
+        "core.format_time.hms": lambda: format_time(
+            3723.45, show_centiseconds=False, fixed_hours=True
+        ),
+        "core.stopwatch.elapsed": lambda: stopwatch.elapsed,
+        "core.countdown.time_left": lambda: countdown.time_left,
+        "core.countdown.until_next_second": countdown.until_next_second,
+    }
+    for name, fn in cases.items():
+        results[name] = {
+            "value": _per_call_ns(fn, 100_000),
+            "unit": "ns/op",
+            "lower_is_better": True,
+        }
+
+
+def bench_cli(results: Results) -> None:
+    console = Console(file=io.StringIO(), width=80, force_terminal=True)
+    subtitle = "Space: Start/Stop | q: Quit"
+
+    # Alternate between two timers showing different values, so every update is
+    # a real change rather than the cached no-op.
+    stopwatches = [Stopwatch(_accumulated_time=t) for t in (1.0, 2.0)]
+    countdowns = [Countdown(t) for t in (3600, 1800)]
+    for countdown in countdowns:
+        countdown.pause()
+
+    def updater(view, timers):
+        flip = [0]
+
+        def update():
+            flip[0] ^= 1
+            view.update(timers[flip[0]])
+            return view.panel
+
+        return update
+
+    frames = {
+        "stopwatch": updater(_StopwatchView(subtitle), stopwatches),
+        "countdown": updater(_CountdownView(subtitle), countdowns),
+    }
+    for name, build in frames.items():
+        results[f"cli.{name}.build"] = {
+            "value": _per_call_ns(build, 2_000) / 1000,
+            "unit": "µs/frame",
+            "lower_is_better": True,
+        }
+
+        def frame():
+            console.file.seek(0)
+            console.file.truncate()
+            console.print(build())
+
+        results[f"cli.{name}.frame"] = {
+            "value": _per_call_ns(frame, 500) / 1000,
+            "unit": "µs/frame",
+            "lower_is_better": True,
+        }
+
+
+async def _tui_frames(app, frames: int) -> tuple[float, float]:
+    async with app.run_test(headless=True, size=(100, 30)) as pilot:
+        await pilot.pause()
+        display = app.time_display
+        wall, cpu = time.perf_counter(), time.process_time()
+        for i in range(frames):
+            display.update(format_time(i, show_centiseconds=False, fixed_hours=True))
+            await pilot.pause()
+        return time.perf_counter() - wall, time.process_time() - cpu
+
+
+def bench_tui(results: Results, frames: int) -> None:
+    for name, factory in (("stopwatch", StopwatchTui), ("countdown", lambda: CountdownTui(3600))):
+        wall, cpu = asyncio.run(_tui_frames(factory(), frames))
+        results[f"tui.{name}.fps"] = {
+            "value": frames / wall,
+            "unit": "frames/s",
+            "lower_is_better": False,
+        }
+        results[f"tui.{name}.cpu_per_frame"] = {
+            "value": cpu / frames * 1000,
+            "unit": "ms/frame",
+            "lower_is_better": True,
+        }
+
+
+def compare(results: Results, baseline_path: Path, threshold: float) -> int:
+    """Print the change against a baseline; return the number of regressions."""
+    baseline = json.loads(baseline_path.read_text())["results"]
+    regressions = 0
+    print(f"\ncompared with {baseline_path}:")
+    for name, current in results.items():
+        if name not in baseline:
+            continue
+        before, after = baseline[name]["value"], current["value"]
+        change = (after - before) / before if before else 0.0
+        worse = change > threshold if current["lower_is_better"] else change < -threshold
+        regressions += worse
+        flag = "  REGRESSION" if worse else ""
+        print(f"  {name:<34} {before:>10.2f} -> {after:>10.2f} {current['unit']:<9} {change:+7.1%}{flag}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path, help="Write results to this JSON file.")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON file to compare against.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Relative change that counts as a regression. [default: 0.10]",
+    )
+    parser.add_argument("--frames", type=int, default=200, help="TUI frames to render.")
+    parser.add_argument(
+        "--only", choices=("core", "cli", "tui"), action="append", help="Run only these parts."
+    )
+    args = parser.parse_args()
+    parts = args.only or ["core", "cli", "tui"]
+
+    results: Results = {}
+    if "core" in parts:
+        bench_core(results)
+    if "cli" in parts:
+        bench_cli(results)
+    if "tui" in parts:
+        bench_tui(results, args.frames)
+
+    for name, result in results.items():
+        print(f"{name:<34} {result['value']:>12.2f} {result['unit']}")
+
+    if args.output:
+        report = {
+            "meta": {
+                "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+            },
+            "results": results,
+        }
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    if args.compare and compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
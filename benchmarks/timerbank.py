@@ -0,0 +1,70 @@
+"""TimerBank versus a list of Stopwatch objects.
+
+Compares reading every timer's elapsed time, and starting/stopping every other
+timer, at several bank sizes.
+
+Usage:
+    python benchmarks/timerbank.py
+    python benchmarks/timerbank.py --sizes 1000 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.termclock import Stopwatch  # noqa: E402
+from core.timerbank import TimerBank  # noqa: E402
+
+
+def _best(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000]
+    )
+    args = parser.parse_args()
+
+    print(f"{'timers':>9} {'op':<12} {'objects':>11} {'bank':>11} {'speedup':>8}")
+    for size in args.sizes:
+        stopwatches = [Stopwatch() for _ in range(size)]
+        for stopwatch in stopwatches:
+            stopwatch.start()
+        bank = TimerBank(size)
+        bank.start()
+
+        every_other = stopwatches[::2]
+
+        def toggle_objects():
+            for stopwatch in every_other:
+                stopwatch.toggle()
+
+        cases = {
+            "elapsed": (
+                lambda: [stopwatch.elapsed for stopwatch in stopwatches],
+                lambda: bank.elapsed(),
+            ),
+            "toggle half": (toggle_objects, lambda: bank.toggle(slice(None, None, 2))),
+        }
+        for op, (objects, vectorised) in cases.items():
+            t_objects, t_bank = _best(objects), _best(vectorised)
+            print(
+                f"{size:>9} {op:<12} {t_objects * 1000:>9.2f}ms {t_bank * 1000:>9.2f}ms"
+                f" {t_objects / t_bank:>7.0f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Idle cost of the Textual TUIs, measured headless.
+
+Runs each app under Textual's `run_test` pilot for a few seconds without input
+and reports CPU time, refresh wakeups and `BigDigits.update` calls per second.
+
+Usage:
+    python benchmarks/tui_idle.py
+    python benchmarks/tui_idle.py --seconds 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from tui import CountdownTui, StopwatchTui  # noqa: E402
+
+
+async def _measure(name: str, app, seconds: float, pause: bool = False) -> None:
+    async with app.run_test(headless=True) as pilot:
+        if pause:
+            await pilot.press("space")
+        await pilot.pause()
+
+        refresher, display = app.refresher, app.time_display
+        wakeups, updates = refresher.wakeups, display.updates
+        cpu = time.process_time()
+        await asyncio.sleep(seconds)
+        cpu = time.process_time() - cpu
+
+        print(
+            f"{name:<20} cpu {cpu / seconds * 1000:6.1f} ms/s"
+            f"  wakeups {(refresher.wakeups - wakeups) / seconds:5.2f}/s"
+            f"  updates {(display.updates - updates) / seconds:5.2f}/s"
+        )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    stopwatch = StopwatchTui()
+    stopwatch.stopwatch.start()
+    await _measure("stopwatch running", stopwatch, args.seconds)
+    await _measure("stopwatch paused", StopwatchTui(), args.seconds)
+    await _measure("countdown running", CountdownTui(3600), args.seconds)
+    await _measure("countdown paused", CountdownTui(3600), args.seconds, pause=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -7,11 +7,17 @@ Commands:
 - `time-manager cd <amount> [unit]` Start a countdown timer
 - `tm cd <amount> [unit]`           Start a countdown timer
 - `tm countdown <amount> [unit]`    Start a countdown timer
+- `tm stats`                        Summarise the session history
+- `tm dash`                         Show many timers in a scrolling dashboard
+- `tm run -- <command>`            Time a command over repeated runs
+- `tm daemon`                       Host timers in a background daemon
+- `tm ctl <op> ...`                 Control timers hosted by the daemon
 """
 
 from __future__ import annotations
 
 import os
+from typing import Any, Optional
 
 # Terminal emulators differ in how they advertise TrueColor support.
 # These defaults help keep Textual/Rich rendering consistent across Windows Terminal,
@@ -21,8 +27,9 @@ os.environ.setdefault("RICH_COLOR_SYSTEM", "truecolor")
 
 import typer
 
-from cli import run_countdown_cli, run_stopwatch_cli
-from tui import CountdownTui, StopwatchTui
+# The `cli` (Rich, termios) and `tui` (Textual) packages are imported inside the
+# commands that need them, so `tm --help` and `tm cd 5 s --cli` don't pay for
+# importing the UI they won't use. Run `benchmarks/startup.py` after touching imports.
 
 _ALIASES: dict[str, str] = {
     "stopwatch": "sw",
@@ -60,6 +67,79 @@ app = typer.Typer(
 )
 
 CLI_MODE = typer.Option(False, "--cli", help="Run in CLI mode instead of TUI.")
+SHARE = typer.Option(
+    None,
+    "--share",
+    metavar="PATH",
+    help="Publish the timer state to a memory-mapped file other processes can read.",
+)
+PROFILE = typer.Option(
+    False, "--profile", help="Print loop, wakeup and render timing percentiles on exit."
+)
+PROFILE_OUT = typer.Option(
+    None,
+    "--profile-out",
+    metavar="PATH",
+    help="Write the --profile percentiles to a JSON file (implies --profile).",
+)
+STREAM = typer.Option(
+    None,
+    "--stream",
+    metavar="FORMAT",
+    help="Write 'json' (NDJSON) or 'plain' lines to stdout instead of drawing (no TTY needed).",
+)
+RATE = typer.Option(
+    1.0,
+    "--rate",
+    metavar="HZ",
+    help="Lines per second for --stream; 0 writes only when the second changes.",
+)
+TAG = typer.Option(
+    None, "--tag", help="Tag the session in the history log (see `tm stats`)."
+)
+NO_HISTORY = typer.Option(
+    False, "--no-history", help="Don't record this session in the history log."
+)
+CLOCK = typer.Option(
+    "monotonic", "--clock", help="Time source: 'monotonic' or 'perf_counter'."
+)
+ON_FINISH = typer.Option(
+    None,
+    "--on-finish",
+    metavar="COMMAND",
+    help="Shell command to run when the countdown finishes (repeatable).",
+)
+ON_TICK_EVERY = typer.Option(
+    None,
+    "--on-tick-every",
+    metavar="SECONDS:COMMAND",
+    help="Shell command to run every SECONDS of active time (repeatable).",
+)
+HOOK_TIMEOUT = typer.Option(
+    10.0, "--hook-timeout", metavar="SECONDS", help="Kill hooks that run longer than this."
+)
+METRICS_FILE = typer.Option(
+    None,
+    "--metrics-file",
+    metavar="PATH",
+    help="Keep an OpenMetrics text file with the timer's state up to date.",
+)
+METRICS_PORT = typer.Option(
+    None, "--metrics-port", metavar="PORT", help="Serve the metrics on 127.0.0.1:PORT/metrics."
+)
+METRICS_INTERVAL = typer.Option(
+    5.0, "--metrics-interval", metavar="SECONDS", help="Rewrite the metrics file this often."
+)
+SOCKET = typer.Option(
+    None, "--socket", help="Daemon socket path. [default: $XDG_RUNTIME_DIR/time-manager.sock]"
+)
+
+ctl_app = typer.Typer(
+    help="Control timers hosted by `tm daemon`.",
+    no_args_is_help=True,
+    add_completion=False,
+)
+app.add_typer(ctl_app, name="ctl")
 
 _UNIT_SECONDS: dict[str, int] = {
     # seconds
@@ -104,6 +184,89 @@ def _parse_countdown_seconds(amount: int, unit: str) -> int:
     return seconds
 
 
+def _check_stream(stream: str, rate: float) -> None:
+    if stream not in ("json", "plain"):
+        _die(f"Unknown stream format '{stream}'. Please use 'json' or 'plain'.")
+    if rate < 0:
+        _die("Rate must not be negative.")
+
+
+def _clock(name: str, share: Optional[str]):
+    from core.clock import CLOCKS, MONOTONIC
+
+    clock = CLOCKS.get(name)
+    if clock is None:
+        _die(f"Unknown clock '{name}'. Please use {' or '.join(map(repr, CLOCKS))}.")
+    if share and clock is not MONOTONIC:
+        _die("--share needs the monotonic clock, since readers compare against it.")
+    return clock
+
+
+def _make_profiler(profile: bool, profile_out: Optional[str]):
+    if not (profile or profile_out):
+        return None
+    from core.profiling import LoopProfiler
+
+    return LoopProfiler()
+
+
+def _report_profile(profiler, profile: bool, profile_out: Optional[str], hooks=None) -> None:
+    # The exporter keeps a profiler for its loop timings even without --profile.
+    if profiler is None or not (profile or profile_out):
+        return
+    profiler.print_report()
+    if hooks is not None:
+        hooks.print_report()
+    if profile_out:
+        profiler.dump(profile_out)
+
+
+def _session_log(no_history: bool):
+    if no_history:
+        return None
+    from core.history import SessionLog
+
+    return SessionLog()
+
+
+def _hooks(on_finish: Optional[list[str]], on_tick_every: Optional[list[str]], timeout: float):
+    if not (on_finish or on_tick_every):
+        return None
+    from core.hooks import HookRunner, parse_tick_hook
+
+    if timeout <= 0:
+        _die("Hook timeout must be greater than 0.")
+    try:
+        ticks = [parse_tick_hook(spec) for spec in on_tick_every or ()]
+    except ValueError as exc:
+        _die(str(exc))
+    return HookRunner(on_finish or (), ticks, timeout=timeout)
+
+
+def _exporter(path: Optional[str], port: Optional[int], interval: float, tag: Optional[str]):
+    if path is None and port is None:
+        return None
+    from core.exporter import MetricsExporter
+
+    if interval <= 0:
+        _die("Metrics interval must be greater than 0.")
+    if port is not None and not 0 <= port <= 65535:
+        _die("Metrics port must be between 0 and 65535.")
+    try:
+        return MetricsExporter(path, port, interval=interval, tag=tag)
+    except OSError as exc:
+        if exc.filename is not None:
+            _die(f"Could not write the metrics file {path}: {exc.strerror or exc}")
+        _die(f"Could not serve metrics on port {port}: {exc.strerror or exc}")
+
+
+def _close(*resources) -> None:
+    """Close the optional hook runner / exporter a command created."""
+    for resource in resources:
+        if resource is not None:
+            resource.close()
+
+
 def _print_error_box(message: str) -> None:
     """Print an error message in a boxed panel when Rich is available."""
     try:
@@ -146,7 +309,29 @@ def _root(ctx: typer.Context, cli: bool = CLI_MODE) -> None:
 
 
 @app.command(help="Start a stopwatch. (alias: stopwatch)")
-def sw(ctx: typer.Context, cli: bool = CLI_MODE) -> None:
+def sw(
+    ctx: typer.Context,
+    cli: bool = CLI_MODE,
+    share: Optional[str] = SHARE,
+    laps_file: Optional[str] = typer.Option(
+        None,
+        "--laps-file",
+        metavar="PATH",
+        help="Stream laps to a file (.csv, otherwise binary int64 ns) instead of memory.",
+    ),
+    profile: bool = PROFILE,
+    profile_out: Optional[str] = PROFILE_OUT,
+    stream: Optional[str] = STREAM,
+    rate: float = RATE,
+    tag: Optional[str] = TAG,
+    no_history: bool = NO_HISTORY,
+    clock_name: str = CLOCK,
+    on_tick_every: Optional[list[str]] = ON_TICK_EVERY,
+    hook_timeout: float = HOOK_TIMEOUT,
+    metrics_file: Optional[str] = METRICS_FILE,
+    metrics_port: Optional[int] = METRICS_PORT,
+    metrics_interval: float = METRICS_INTERVAL,
+) -> None:
     """
     Start a stopwatch.
 
@@ -154,12 +339,49 @@ def sw(ctx: typer.Context, cli: bool = CLI_MODE) -> None:
     tm sw
     tm sw --cli
     tm stopwatch
+    tm sw --stream json --rate 10
+    tm sw --tag reading
+    tm sw --on-tick-every "1500:notify-send 'Take a break'"
+    tm sw --metrics-file /var/lib/node_exporter/tm.prom
     """
+    clock = _clock(clock_name, share)
+    if stream is not None:
+        _check_stream(stream, rate)
+    hooks = _hooks(None, on_tick_every, hook_timeout)
+    exporter = _exporter(metrics_file, metrics_port, metrics_interval, tag)
+    history = _session_log(no_history)
+    if stream is not None:
+        from cli import stream_stopwatch
+
+        try:
+            stream_stopwatch(
+                stream,
+                rate,
+                share,
+                history=history,
+                tag=tag,
+                clock=clock,
+                hooks=hooks,
+                exporter=exporter,
+            )
+        finally:
+            _close(hooks, exporter)
+        return
+
+    profiler = _make_profiler(profile or exporter is not None, profile_out)
     effective_cli = bool(cli or (ctx.obj or {}).get("cli", False))
-    if effective_cli:
-        run_stopwatch_cli()
-    else:
-        StopwatchTui().run()
+    try:
+        if effective_cli:
+            from cli import run_stopwatch_cli
+
+            run_stopwatch_cli(share, laps_file, profiler, history, tag, clock, hooks, exporter)
+        else:
+            from tui import StopwatchTui
+
+            StopwatchTui(share, laps_file, profiler, history, tag, clock, hooks, exporter).run()
+    finally:
+        _close(hooks, exporter)
+    _report_profile(profiler, profile, profile_out, hooks)
 
 
 @app.command(help="Start a countdown timer. (alias: countdown)")
@@ -170,6 +392,25 @@ def cd(
         "m", help="The unit of time. [s]econds, [m]inutes, [h]ours."
     ),
     cli: bool = CLI_MODE,
+    share: Optional[str] = SHARE,
+    profile: bool = PROFILE,
+    profile_out: Optional[str] = PROFILE_OUT,
+    precise: bool = typer.Option(
+        False,
+        "--precise",
+        help="Spin through the last few milliseconds to finish on time and report the lateness.",
+    ),
+    stream: Optional[str] = STREAM,
+    rate: float = RATE,
+    tag: Optional[str] = TAG,
+    no_history: bool = NO_HISTORY,
+    clock_name: str = CLOCK,
+    on_finish: Optional[list[str]] = ON_FINISH,
+    on_tick_every: Optional[list[str]] = ON_TICK_EVERY,
+    hook_timeout: float = HOOK_TIMEOUT,
+    metrics_file: Optional[str] = METRICS_FILE,
+    metrics_port: Optional[int] = METRICS_PORT,
+    metrics_interval: float = METRICS_INTERVAL,
 ):
     """
     Start a countdown timer.
@@ -178,15 +419,265 @@ def cd(
     tm cd 5 m
     tm cd 60 s --cli
     tm countdown 10 s
+    tm cd 30 s --cli --precise
+    tm cd 5 m --stream plain --rate 0
+    tm cd 25 m --on-finish "paplay /usr/share/sounds/freedesktop/stereo/complete.oga"
     """
 
     seconds = _parse_countdown_seconds(amount, unit)
+    clock = _clock(clock_name, share)
+    if stream is not None:
+        _check_stream(stream, rate)
+    hooks = _hooks(on_finish, on_tick_every, hook_timeout)
+    exporter = _exporter(metrics_file, metrics_port, metrics_interval, tag)
+    history = _session_log(no_history)
+    if stream is not None:
+        from cli import stream_countdown
+
+        try:
+            stream_countdown(
+                seconds,
+                stream,
+                rate,
+                share,
+                history=history,
+                tag=tag,
+                clock=clock,
+                hooks=hooks,
+                exporter=exporter,
+            )
+        finally:
+            _close(hooks, exporter)
+        return
 
+    profiler = _make_profiler(profile or exporter is not None, profile_out)
     effective_cli = bool(cli or (ctx.obj or {}).get("cli", False))
-    if effective_cli:
-        run_countdown_cli(seconds)
+    try:
+        if effective_cli:
+            from cli import run_countdown_cli
+
+            run_countdown_cli(
+                seconds, share, profiler, precise, history, tag, clock, hooks, exporter
+            )
+        else:
+            from tui import CountdownTui
+
+            CountdownTui(
+                seconds, share, profiler, precise, history, tag, clock, hooks, exporter
+            ).run()
+    finally:
+        _close(hooks, exporter)
+    _report_profile(profiler, profile, profile_out, hooks)
+
+
+@app.command(help="Show totals from the session history by day, week or tag.")
+def stats(
+    by: str = typer.Option("day", "--by", help="Group by 'day', 'week' or 'tag'."),
+    days: int = typer.Option(7, "--days", "-d", help="How many days back to include."),
+    tag: Optional[str] = typer.Option(None, "--tag", help="Only count sessions with this tag."),
+) -> None:
+    """
+    Summarise recorded `sw`/`cd` sessions.
+
+    Examples:
+    tm stats
+    tm stats --by week --days 90
+    tm stats --by tag --days 30
+    """
+    if by not in ("day", "week", "tag"):
+        _die(f"Unknown grouping '{by}'. Please use 'day', 'week' or 'tag'.")
+    if days < 1:
+        _die("Days must be at least 1.")
+
+    from rich import box
+    from rich.console import Console
+    from rich.table import Table
+
+    from core.formatting import format_time
+    from core.history import SessionLog
+    from core.history import stats as session_stats
+
+    totals = session_stats(SessionLog(), days, by=by, tag=tag)
+    console = Console()
+    if not totals:
+        console.print(f"No sessions in the last {days} day(s).")
+        return
+
+    table = Table(box=box.SIMPLE_HEAD)
+    table.add_column(by.capitalize())
+    table.add_column("Sessions", justify="right")
+    table.add_column("Time", justify="right")
+    table.add_column("Countdowns done", justify="right")
+    for key, entry in totals.items():
+        table.add_row(
+            key,
+            str(entry.sessions),
+            format_time(entry.active, show_centiseconds=False, fixed_hours=True),
+            str(entry.completed),
+        )
+    console.print(table)
+
+
+@app.command(help="Show many named timers in a scrolling dashboard.")
+def dash(
+    demo: int = typer.Option(
+        0, "--demo", metavar="N", help="Start with N generated timers (to try it out)."
+    ),
+    profile: bool = PROFILE,
+    profile_out: Optional[str] = PROFILE_OUT,
+) -> None:
+    """
+    Open the timer dashboard. Press `s`/`c` to add timers, `space` to start/stop.
+
+    Examples:
+    tm dash
+    tm dash --demo 5000
+    """
+    if demo < 0:
+        _die("Demo timer count must not be negative.")
+
+    from tui.dashboard import DashboardTui
+
+    profiler = _make_profiler(profile, profile_out)
+    DashboardTui.demo(demo, profiler).run()
+    _report_profile(profiler, profile, profile_out)
+
+
+@app.command(
+    help="Time a command over repeated runs.",
+    context_settings={"allow_extra_args": True, "ignore_unknown_options": True},
+)
+def run(
+    command: list[str] = typer.Argument(..., help="The command to run, after `--`."),
+    runs: int = typer.Option(10, "--runs", "-n", help="Number of measured runs."),
+    warmup: int = typer.Option(0, "--warmup", "-w", help="Unmeasured runs before measuring."),
+    jobs: int = typer.Option(1, "--jobs", "-j", help="Measured runs to execute at once."),
+    show_output: bool = typer.Option(
+        False, "--show-output", help="Let the command write to the terminal."
+    ),
+) -> None:
+    """
+    Report wall time, user/system CPU and peak RSS of a command.
+
+    Examples:
+    tm run -- sleep 0.1
+    tm run -n 50 -w 5 -- python -c pass
+    tm run -n 100 -j 8 -- curl -s https://example.com
+    """
+    import shutil
+
+    if shutil.which(command[0]) is None:
+        _die(f"Command not found: {command[0]}")
+    if runs < 1:
+        _die("Runs must be at least 1.")
+    if warmup < 0:
+        _die("Warmup must not be negative.")
+    if jobs < 1:
+        _die("Jobs must be at least 1.")
+
+    from cli import run_command_cli
+    from core.runner import CommandRunner
+
+    runner = CommandRunner(command, runs, warmup=warmup, jobs=jobs, show_output=show_output)
+    raise typer.Exit(code=run_command_cli(runner))
+
+
+@app.command(help="Host timers in a background daemon on a Unix socket.")
+def daemon(socket: Optional[str] = SOCKET) -> None:
+    """
+    Run the timer daemon in the foreground. Use `tm ctl` to talk to it.
+
+    Examples:
+    tm daemon &
+    tm ctl create tea 5 m
+    """
+    import asyncio
+
+    from daemon.server import TimerDaemon
+
+    try:
+        asyncio.run(TimerDaemon(socket).serve())
+    except RuntimeError as exc:
+        _die(str(exc))
+    except KeyboardInterrupt:
+        pass
+
+
+def _ctl(message: dict[str, Any], socket: Optional[str]) -> dict[str, Any]:
+    from daemon import DaemonError, request
+
+    try:
+        return request(message, socket)
+    except DaemonError as exc:
+        _die(str(exc))
+
+
+def _timer_line(timer: dict[str, Any]) -> str:
+    from core.formatting import format_time
+
+    if timer["kind"] == "cd":
+        value = format_time(timer["time_left"], show_centiseconds=False)
     else:
-        CountdownTui(seconds).run()
+        value = format_time(timer["elapsed"], show_centiseconds=False, fixed_hours=True)
+    status = "finished" if timer["finished"] else ("running" if timer["running"] else "paused")
+    return f"{timer['name']}\t{timer['kind']}\t{status}\t{value}"
+
+
+@ctl_app.command("create", help="Create a stopwatch, or a countdown if AMOUNT is given.")
+def ctl_create(
+    name: str = typer.Argument(..., help="The timer name."),
+    amount: Optional[int] = typer.Argument(None, help="Countdown amount of time."),
+    unit: str = typer.Argument("m", help="The unit of time. [s]econds, [m]inutes, [h]ours."),
+    socket: Optional[str] = SOCKET,
+) -> None:
+    message: dict[str, Any] = {"op": "create", "name": name}
+    if amount is not None:
+        message["seconds"] = _parse_countdown_seconds(amount, unit)
+    typer.echo(_timer_line(_ctl(message, socket)["timer"]))
+
+
+def _ctl_timer_command(op: str, help: str) -> None:
+    def command(
+        name: str = typer.Argument(..., help="The timer name."),
+        socket: Optional[str] = SOCKET,
+    ) -> None:
+        typer.echo(_timer_line(_ctl({"op": op, "name": name}, socket)["timer"]))
+
+    ctl_app.command(op, help=help)(command)
+
+
+_ctl_timer_command("query", "Show a timer.")
+_ctl_timer_command("pause", "Pause a timer.")
+_ctl_timer_command("resume", "Resume a timer.")
+_ctl_timer_command("toggle", "Pause or resume a timer.")
+_ctl_timer_command("reset", "Reset a timer.")
+_ctl_timer_command("remove", "Remove a timer.")
+
+
+@ctl_app.command("list", help="List all timers.")
+def ctl_list(socket: Optional[str] = SOCKET) -> None:
+    for timer in _ctl({"op": "list"}, socket)["timers"]:
+        typer.echo(_timer_line(timer))
+
+
+@ctl_app.command("watch", help="Follow timers (all if no NAMES are given) until Ctrl+C.")
+def ctl_watch(
+    names: Optional[list[str]] = typer.Argument(None, help="Timer names to follow."),
+    socket: Optional[str] = SOCKET,
+) -> None:
+    from daemon import DaemonError, subscribe
+
+    try:
+        for event in subscribe(names, socket):
+            if event["event"] == "finished":
+                typer.echo(f"{event['name']}: Time's up!")
+            else:
+                for timer in event["timers"]:
+                    typer.echo(_timer_line(timer))
+    except DaemonError as exc:
+        _die(str(exc))
+    except KeyboardInterrupt:
+        pass
 
 
 def main() -> None:
@@ -1,5 +1,20 @@
 # time-manager CLI Components
 
-from .cli import run_stopwatch_cli, run_countdown_cli
+# Resolved lazily so `--stream` never pays for importing Rich and termios.
+_EXPORTS = {
+    "run_stopwatch_cli": ".cli",
+    "run_countdown_cli": ".cli",
+    "stream_stopwatch": ".stream",
+    "stream_countdown": ".stream",
+    "run_command_cli": ".run",
+}
 
-__all__ = ["run_stopwatch_cli", "run_countdown_cli"]
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    return getattr(import_module(_EXPORTS[name], __name__), name)
@@ -1,140 +1,393 @@
-import time
+import codecs
+import os
 import sys
 import select
 import termios
 import tty
+from time import perf_counter
+from typing import TYPE_CHECKING, Optional
 from rich.align import Align
 from rich.console import Group
 from rich.live import Live
 from rich.panel import Panel
 from rich.text import Text
 from rich import box
+from core.clock import MONOTONIC, Clock
 from core.formatting import format_time
+from core.history import SessionLog, log_session
+from core.laps import LapRecorder
+from core.precision import coarse_timeout, wait_until
+from core.profiling import LoopProfiler
+from core.shared import SharedStateWriter
 from core.termclock import Stopwatch, Countdown
 
+if TYPE_CHECKING:  # subprocess, threads and http.server only load when these are used
+    from core.exporter import MetricsExporter
+    from core.hooks import HookRunner
+
+# Wake slightly after a second boundary so the new value is already visible.
+_WAKE_SLACK = 0.005
+# Bytes drained per wakeup; far more than any burst of typed or pasted keys.
+_READ_SIZE = 4096
+# How long to wait for the rest of a split escape sequence.
+_ESCAPE_WAIT = 0.01
+
+
+def _split_keys(text: str) -> tuple[list[str], str]:
+    """Split decoded input into keys; also return a trailing incomplete escape sequence.
+
+    An escape sequence (CSI `ESC [ ... final`, SS3 `ESC O x`, or Alt+key) stays
+    together as one key, so its bytes are never mistaken for separate keypresses.
+    """
+    keys = []
+    i, n = 0, len(text)
+    while i < n:
+        char = text[i]
+        if char != "\x1b":
+            keys.append(char)
+            i += 1
+            continue
+        if i + 1 == n:
+            return keys, text[i:]
+        if text[i + 1] == "[":
+            end = i + 2
+            while end < n and not "@" <= text[end] <= "~":
+                end += 1
+            if end == n:
+                return keys, text[i:]
+        elif text[i + 1] == "O":
+            end = i + 2
+            if end == n:
+                return keys, text[i:]
+        else:
+            end = i + 1
+        keys.append(text[i : end + 1])
+        i = end + 1
+    return keys, ""
+
 
 class NonBlockingInput:
-    """Context manager for non-blocking terminal input."""
+    """Context manager for non-blocking terminal input.
+
+    Each wakeup drains everything pending with one unbuffered `os.read`, so
+    pasted or auto-repeated keys are handled as one batch. (A buffered
+    `sys.stdin.read(1)` can pull several keys into Python's buffer where
+    `select` no longer sees them, stranding them until the next keypress.)
+    """
+
+    def __init__(self, fd: Optional[int] = None) -> None:
+        self.fd = sys.stdin.fileno() if fd is None else fd
+        self.old_settings = None
+        self.closed = False
+        self._decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        self._pending = ""
 
     def __enter__(self):
-        self.old_settings = termios.tcgetattr(sys.stdin)
-        tty.setcbreak(sys.stdin.fileno())
+        if os.isatty(self.fd):
+            self.old_settings = termios.tcgetattr(self.fd)
+            tty.setcbreak(self.fd)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self.old_settings)
+        if self.old_settings is not None:
+            termios.tcsetattr(self.fd, termios.TCSADRAIN, self.old_settings)
+
+    def _read(self, timeout: Optional[float]) -> Optional[str]:
+        if self.closed:
+            select.select([], [], [], timeout)
+            return None
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return None
+        try:
+            data = os.read(self.fd, _READ_SIZE)
+        except OSError:  # the terminal went away
+            data = b""
+        if not data:
+            self.closed = True
+            return None
+        return self._decoder.decode(data)
+
+    def read_keys(self, timeout: Optional[float] = 0) -> list[str]:
+        """Wait up to `timeout` seconds (forever if None) for input; return every key read."""
+        text = self._read(timeout)
+        if text is None:
+            return []
+        keys, self._pending = _split_keys(self._pending + text)
+        while self._pending:
+            # The rest of a sequence is normally in the same write; if it doesn't
+            # follow promptly, pass on what arrived (e.g. a lone Esc).
+            text = self._read(_ESCAPE_WAIT)
+            if text is None:
+                keys.append(self._pending)
+                self._pending = ""
+                break
+            more, self._pending = _split_keys(self._pending + text)
+            keys += more
+        return keys
+
+
+def _wait_timeout(delay: Optional[float]) -> Optional[float]:
+    """Turn the delay until the next visible change into a `select` timeout.
 
-    @staticmethod
-    def get_char():
-        """Check for and return a character if available, else None."""
-        if select.select([sys.stdin], [], [], 0) == ([sys.stdin], [], []):
-            return sys.stdin.read(1)
+    None means nothing changes on its own (paused), so block until a key is pressed.
+    """
+    if delay is None:
         return None
+    return delay + _WAKE_SLACK
+
+
+class _StopwatchView:
+    """The stopwatch panel, built once and updated in place.
+
+    `update()` only touches the time text, styles and laps line, and returns
+    False when none of them changed so the caller can skip redrawing.
+    """
+
+    def __init__(self, subtitle: str) -> None:
+        self._time = Text()
+        self._laps = Text(style="dim")
+        self._laps_line = Align.center(self._laps)
+        self._group = Group(
+            Align.center(self._time),
+            Align.center(Text("HH:MM:SS", style="dim")),
+        )
+        self.panel = Panel(
+            self._group,
+            title="Stopwatch",
+            subtitle=subtitle,
+            box=box.ROUNDED,
+            padding=(1, 2),
+        )
+        self._state: Optional[tuple] = None
+
+    def update(self, stopwatch: Stopwatch) -> bool:
+        # Always display HH:MM:SS (even when hours == 0)
+        time_str = format_time(stopwatch.elapsed, show_centiseconds=False, fixed_hours=True)
+        laps = stopwatch.laps.summary() if stopwatch.laps else None
+        state = (time_str, stopwatch.is_running, laps)
+        if state == self._state:
+            return False
+        self._state = state
+
+        # Visual feedback for paused state
+        self._time.plain = time_str
+        self._time.style = "bold green" if stopwatch.is_running else "dim green"
+        self.panel.border_style = "green" if stopwatch.is_running else "white"
+
+        lines = self._group.renderables
+        if laps is not None:
+            self._laps.plain = laps
+            if len(lines) == 2:
+                lines.append(self._laps_line)
+        elif len(lines) == 3:
+            lines.pop()
+        return True
+
+
+class _CountdownView:
+    """The countdown panel, built once and updated in place (see `_StopwatchView`)."""
+
+    def __init__(self, subtitle: str) -> None:
+        self._time = Text(justify="center")
+        self.panel = Panel(
+            self._time,
+            title="Countdown",
+            subtitle=subtitle,
+            box=box.ROUNDED,
+            padding=(1, 2),
+        )
+        self._state: Optional[tuple] = None
+
+    def update(self, countdown: Countdown) -> bool:
+        remaining = countdown.time_left
+        time_str = format_time(remaining, show_centiseconds=False)
 
+        # Change color based on urgency
+        color = "blue"
+        if remaining < 10:
+            color = "red"
+        elif remaining < 30:
+            color = "yellow"
 
-def run_stopwatch_cli():
-    stopwatch = Stopwatch()
+        state = (time_str, color, countdown.is_running)
+        if state == self._state:
+            return False
+        self._state = state
+
+        # Visual feedback for paused state
+        self._time.plain = time_str
+        self._time.style = f"bold {color}" if countdown.is_running else f"dim {color}"
+        self.panel.border_style = color if countdown.is_running else "white"
+        return True
+
+
+def run_stopwatch_cli(
+    share: Optional[str] = None,
+    laps_file: Optional[str] = None,
+    profiler: Optional[LoopProfiler] = None,
+    history: Optional[SessionLog] = None,
+    tag: Optional[str] = None,
+    clock: Clock = MONOTONIC,
+    hooks: Optional["HookRunner"] = None,
+    exporter: Optional["MetricsExporter"] = None,
+):
+    # Laps streamed to a file aren't also kept in memory.
+    laps = LapRecorder(laps_file, keep=False) if laps_file else None
+    stopwatch = Stopwatch(laps=laps, clock=clock)
     stopwatch.start()
+    shared = SharedStateWriter(share, stopwatch) if share else None
+    if exporter is not None:
+        exporter.start(stopwatch, profiler)
 
-    subtitle = "Space: Start/Stop | r: Reset | q: Quit"
+    subtitle = "Space: Start/Stop | l: Lap | r: Reset | q: Quit"
 
     try:
-        with NonBlockingInput(), Live(refresh_per_second=60, screen=False) as live:
+        view = _StopwatchView(subtitle)
+        view.update(stopwatch)
+        # Rendering is driven by the loop below, so Live doesn't need its own refresh thread.
+        keyboard = NonBlockingInput()
+        with keyboard, Live(view.panel, auto_refresh=False, screen=False) as live:
             while True:
-                # Handle Input
-                char = NonBlockingInput.get_char()
-                if char:
-                    if char.lower() == "q":
+                # Redraw only if the displayed values changed
+                started = perf_counter()
+                if view.update(stopwatch):
+                    live.refresh()
+                if hooks is not None:
+                    hooks.poll(stopwatch)
+                rendered = perf_counter()
+
+                # Sleep until a key is pressed or the displayed second changes
+                timeout = _wait_timeout(stopwatch.until_next_second())
+                keys = keyboard.read_keys(timeout)
+                woke = perf_counter()
+                done = False
+                for key in keys:
+                    key = key.lower()
+                    if key == "q":
+                        done = True
                         break
-                    elif char == " ":
+                    elif key == " ":
                         stopwatch.toggle()
-                    elif char.lower() == "r":
+                    elif key == "r":
                         stopwatch.reset()
+                    elif key == "l" and stopwatch.is_running:
+                        stopwatch.lap()
+                if keys and shared is not None:
+                    shared.publish()
+                if keys and exporter is not None:
+                    exporter.publish()
 
-                # Update Display
-                elapsed = stopwatch.elapsed
-                time_str = format_time(elapsed, show_centiseconds=False)
-                # Always display HH:MM:SS (even when hours == 0)
-                if time_str.count(":") == 1:
-                    time_str = f"00:{time_str}"
-
-                # Visual feedback for paused state
-                style = "bold green" if stopwatch.is_running else "dim green"
-                border_style = "green" if stopwatch.is_running else "white"
-
-                display = Group(
-                    Align.center(Text(time_str, style=style)),
-                    Align.center(Text("HH:MM:SS", style="dim")),
-                )
-
-                panel = Panel(
-                    display,
-                    title="Stopwatch",
-                    subtitle=subtitle,
-                    box=box.ROUNDED,
-                    border_style=border_style,
-                    padding=(1, 2),
-                )
-                live.update(panel)
-                time.sleep(1 / 60)
+                if profiler is not None:
+                    profiler.record(started, rendered, timeout, woke, not keys)
+                if done:
+                    break
     except KeyboardInterrupt:
         pass
+    finally:
+        if shared is not None:
+            shared.close()
+        if stopwatch.laps is not None:
+            stopwatch.laps.close()
+        if history is not None:
+            log_session(stopwatch, tag, history)
 
 
-def run_countdown_cli(seconds: int):
-    countdown = Countdown(seconds)
+def run_countdown_cli(
+    seconds: int,
+    share: Optional[str] = None,
+    profiler: Optional[LoopProfiler] = None,
+    precise: bool = False,
+    history: Optional[SessionLog] = None,
+    tag: Optional[str] = None,
+    clock: Clock = MONOTONIC,
+    hooks: Optional["HookRunner"] = None,
+    exporter: Optional["MetricsExporter"] = None,
+):
+    countdown = Countdown(seconds, clock=clock)
+    shared = SharedStateWriter(share, countdown) if share else None
+    if exporter is not None:
+        exporter.start(countdown, profiler)
 
     subtitle = "Space: Pause/Resume | q: Quit"
 
     try:
-        with NonBlockingInput(), Live(refresh_per_second=10, screen=False) as live:
+        view = _CountdownView(subtitle)
+        view.update(countdown)
+        keyboard = NonBlockingInput()
+        deadline = countdown.next_deadline
+        with keyboard, Live(view.panel, auto_refresh=False, screen=False) as live:
             while not countdown.is_finished:
-                # Handle Input
-                char = NonBlockingInput.get_char()
-                if char:
-                    if char.lower() == "q":
+                started = perf_counter()
+                if view.update(countdown):
+                    live.refresh()
+                if hooks is not None:
+                    hooks.poll(countdown)
+                rendered = perf_counter()
+
+                # Sleep until a key is pressed or the displayed second changes
+                delay = countdown.until_next_second()
+                if delay is None and countdown.is_running:
+                    break  # expired since the loop check; go straight to "Time's Up"
+                timeout = _wait_timeout(delay)
+                deadline = countdown.next_deadline
+                # In precise mode the last wait stops just short of the deadline and spins the rest.
+                finishing = (
+                    precise
+                    and timeout is not None
+                    and deadline is not None
+                    and deadline - clock.now() <= timeout
+                )
+                if finishing:
+                    timeout = coarse_timeout(deadline, timeout, clock=clock)
+                keys = keyboard.read_keys(timeout)
+                # Taken before any spin, which is deliberate and not wakeup lag.
+                woke = perf_counter()
+                if finishing and not keys:
+                    wait_until(deadline, clock=clock)
+                done = False
+                for key in keys:
+                    key = key.lower()
+                    if key == "q":
+                        done = True
                         break
-                    elif char == " ":
+                    elif key == " ":
                         countdown.toggle()
+                if keys and shared is not None:
+                    shared.publish()
+                if keys and exporter is not None:
+                    exporter.publish()
 
-                countdown.tick()
-                remaining = countdown.time_left
-                time_str = format_time(remaining, show_centiseconds=False)
-
-                # Change color based on urgency
-                color = "blue"
-                if remaining < 10:
-                    color = "red"
-                elif remaining < 30:
-                    color = "yellow"
-
-                # Visual feedback for paused state
-                style = f"bold {color}" if countdown.is_running else f"dim {color}"
-                border_style = color if countdown.is_running else "white"
-
-                panel = Panel(
-                    Text(time_str, style=style, justify="center"),
-                    title="Countdown",
-                    subtitle=subtitle,
-                    box=box.ROUNDED,
-                    border_style=border_style,
-                    padding=(1, 2),
-                )
-                live.update(panel)
-                time.sleep(0.1)
+                if profiler is not None:
+                    profiler.record(started, rendered, timeout, woke, not keys)
+                if done:
+                    break
 
             # Final "Time's Up" display
             if countdown.is_finished:
+                # From the deadline the last wait aimed at; keys after expiry can't move it.
+                late = clock.now() - deadline if precise and deadline is not None else None
+                if hooks is not None:
+                    hooks.poll(countdown)
+                    hooks.finish(countdown)
+                if exporter is not None:
+                    exporter.publish()
+                message = "Time's Up!" if late is None else f"Time's Up! (+{late * 1000:.2f} ms)"
                 panel = Panel(
                     Text("00:00", style="bold red blink", justify="center"),
                     title="Countdown",
-                    subtitle="Time's Up!",
+                    subtitle=message,
                     box=box.ROUNDED,
                     border_style="red",
                     padding=(1, 2),
                 )
-                live.update(panel)
-                time.sleep(2)  # Show for a bit before exiting
+                live.update(panel, refresh=True)
+                # Show it for a bit before exiting, or until a key is pressed.
+                keyboard.read_keys(2.0)
 
     except KeyboardInterrupt:
         pass
+    finally:
+        if shared is not None:
+            shared.close()
+        if history is not None:
+            log_session(countdown, tag, history)
@@ -0,0 +1,133 @@
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Optional
+from rich import box
+from rich.console import Console, Group
+from rich.live import Live
+from rich.panel import Panel
+from rich.table import Table
+from rich.text import Text
+from core.formatting import format_time
+from core.runner import CommandRunner, Summary
+from core.termclock import Stopwatch
+
+# Wake slightly after a second boundary so the new value is already visible.
+_WAKE_SLACK = 0.005
+
+
+def _duration(seconds: float) -> str:
+    if seconds < 1:
+        return f"{seconds * 1000:.1f} ms"
+    return f"{seconds:.3f} s"
+
+
+def _memory(size: float) -> str:
+    return f"{size / (1024 * 1024):.1f} MiB"
+
+
+def _progress_panel(runner: CommandRunner, stopwatch: Stopwatch, command: str) -> Panel:
+    done = len(runner.results)
+    running = min(runner.jobs, runner.runs - done)
+    elapsed = format_time(stopwatch.elapsed, show_centiseconds=False, fixed_hours=True)
+    lines = [
+        Text(elapsed, style="bold green", justify="center"),
+        Text(f"Run {done}/{runner.runs}  ({running} running)", justify="center"),
+    ]
+    wall = runner.summary().get("wall")
+    if wall is not None:
+        lines.append(
+            Text(
+                f"wall {_duration(wall.mean)} ± {_duration(wall.stddev)}"
+                f"  (min {_duration(wall.min)}, max {_duration(wall.max)})",
+                style="dim",
+                justify="center",
+            )
+        )
+    return Panel(
+        Group(*lines),
+        title=command,
+        subtitle="Ctrl+C: Stop",
+        box=box.ROUNDED,
+        border_style="green",
+        padding=(1, 2),
+    )
+
+
+def _report_table(stats: dict[str, Summary]) -> Table:
+    table = Table(box=box.SIMPLE_HEAD)
+    table.add_column("")
+    for column in ("mean", "median", "stddev", "min", "max", "outliers"):
+        table.add_column(column, justify="right")
+    for name, label, fmt in (
+        ("wall", "Wall", _duration),
+        ("user", "User", _duration),
+        ("sys", "System", _duration),
+        ("max_rss", "Max RSS", _memory),
+    ):
+        s = stats[name]
+        table.add_row(
+            label,
+            fmt(s.mean),
+            fmt(s.median),
+            fmt(s.stddev),
+            fmt(s.min),
+            fmt(s.max),
+            str(s.outliers),
+        )
+    return table
+
+
+def _print_errors(console: Console, errors: list[str], total: int) -> None:
+    if errors:
+        console.print(f"[red]{len(errors)} of {total} runs could not be run: {errors[0]}[/red]")
+
+
+def run_command_cli(runner: CommandRunner, console: Optional[Console] = None) -> int:
+    """Run `runner` with a live progress panel, print the statistics and return an exit code."""
+    console = console or Console()
+    command = " ".join(runner.argv)
+
+    stopwatch = Stopwatch()
+    try:
+        if runner.warmup:
+            with console.status(f"Warming up ({runner.warmup} runs)..."):
+                runner.run_warmup()
+        stopwatch.start()
+        pending = set(runner.submit())
+        with Live(console=console, auto_refresh=False, transient=True) as live:
+            while pending:
+                live.update(_progress_panel(runner, stopwatch, command), refresh=True)
+                timeout = stopwatch.until_next_second() + _WAKE_SLACK
+                _, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+    except KeyboardInterrupt:
+        console.print("[yellow]Interrupted; waiting for running commands to finish.[/yellow]")
+    finally:
+        runner.shutdown()
+        stopwatch.stop()
+
+    stats = runner.summary()
+    errors = runner.errors
+    if not stats:
+        _print_errors(console, errors, len(runner.results))
+        console.print("[red]No runs finished.[/red]")
+        return 1
+
+    wall = stats["wall"]
+    console.print(
+        f"[bold]{command}[/bold]  {wall.count} runs"
+        + (f" after {runner.warmup} warmup" if runner.warmup else "")
+        + (f", {runner.jobs} at a time" if runner.jobs > 1 else "")
+        + f", total {_duration(stopwatch.elapsed)}"
+    )
+    console.print(_report_table(stats))
+    if wall.outliers:
+        console.print(
+            f"[yellow]{wall.outliers} wall-time outlier(s) outside 1.5×IQR; "
+            "consider more warmup runs or a quieter machine.[/yellow]"
+        )
+    _print_errors(console, errors, len(runner.results))
+    exited = runner.failures - len(errors)
+    if exited:
+        console.print(f"[red]{exited} of {len(runner.results)} runs exited non-zero.[/red]")
+    if runner.failures:
+        return 1
+    return 0
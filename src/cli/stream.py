@@ -0,0 +1,141 @@
+import os
+import sys
+import time
+from typing import TYPE_CHECKING, BinaryIO, Callable, Optional, Union
+from core.clock import MONOTONIC, Clock
+from core.history import SessionLog, log_session
+from core.shared import SharedStateWriter
+from core.termclock import Countdown, Stopwatch
+
+if TYPE_CHECKING:  # subprocess, threads and http.server only load when these are used
+    from core.exporter import MetricsExporter
+    from core.hooks import HookRunner
+
+# Wake slightly after a second boundary so the new value is already visible.
+_WAKE_SLACK = 0.005
+
+FORMATS = ("json", "plain")
+
+Frame = Callable[[str, str, float, Optional[float]], bytes]
+
+
+def _json_frame(kind: str, state: str, elapsed: float, remaining: Optional[float]) -> bytes:
+    left = "null" if remaining is None else f"{remaining:.3f}"
+    return (
+        f'{{"ts":{time.time():.3f},"kind":"{kind}","state":"{state}",'
+        f'"elapsed":{elapsed:.3f},"remaining":{left}}}\n'
+    ).encode()
+
+
+def _plain_frame(kind: str, state: str, elapsed: float, remaining: Optional[float]) -> bytes:
+    left = "-" if remaining is None else f"{remaining:.3f}"
+    return f"{time.time():.3f}\t{kind}\t{state}\t{elapsed:.3f}\t{left}\n".encode()
+
+
+def _stream(
+    timer: Union[Stopwatch, Countdown],
+    fmt: str,
+    rate: float,
+    share: Optional[str],
+    out: Optional[BinaryIO],
+    history: Optional[SessionLog] = None,
+    tag: Optional[str] = None,
+    hooks: Optional["HookRunner"] = None,
+    exporter: Optional["MetricsExporter"] = None,
+) -> None:
+    """Write one line per frame until the countdown finishes (or forever for a stopwatch).
+
+    `rate` is frames per second; 0 writes only when the displayed second changes.
+    Tick hooks are checked once per frame. The session is logged to `history` at exit.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown stream format {fmt!r}; expected one of {', '.join(FORMATS)}.")
+    frame: Frame = _json_frame if fmt == "json" else _plain_frame
+    out = out if out is not None else sys.stdout.buffer
+    shared = SharedStateWriter(share, timer) if share else None
+    if exporter is not None:
+        exporter.start(timer)
+    countdown = timer if isinstance(timer, Countdown) else None
+    kind = "stopwatch" if countdown is None else "countdown"
+    interval = 1.0 / rate if rate > 0 else None
+    now = timer.clock.now
+    next_frame = now()
+
+    try:
+        while True:
+            if countdown is None:
+                line = frame(kind, "running", timer.elapsed, None)
+            else:
+                left = countdown.time_left
+                state = "finished" if left <= 0 else "running"
+                line = frame(kind, state, countdown.initial_seconds - left, left)
+            # A single write + flush is one syscall per frame on the buffered writer.
+            out.write(line)
+            out.flush()
+            if hooks is not None:
+                hooks.poll(timer)
+            # Decide from the value just written, so the last line always says finished.
+            if countdown is not None and left <= 0:
+                if hooks is not None:
+                    hooks.finish(countdown)
+                if exporter is not None:
+                    exporter.publish()
+                return
+
+            if interval is None:
+                until = timer.until_next_second()
+                # None: the countdown expired since the check above; write its last line now.
+                delay = 0.0 if until is None else until + _WAKE_SLACK
+            else:
+                next_frame += interval
+                current = now()
+                if next_frame < current:  # fell behind; skip frames rather than burst
+                    next_frame = current
+                delay = next_frame - current
+            if countdown is not None:
+                delay = min(delay, countdown.time_left)
+            time.sleep(delay)
+    except BrokenPipeError:
+        # The reader went away (e.g. `tm sw --stream json | head`). Point stdout at
+        # /dev/null so the interpreter's final flush doesn't complain again.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if shared is not None:
+            shared.close()
+        if history is not None:
+            log_session(timer, tag, history)
+
+
+def stream_stopwatch(
+    fmt: str = "json",
+    rate: float = 1.0,
+    share: Optional[str] = None,
+    out: Optional[BinaryIO] = None,
+    history: Optional[SessionLog] = None,
+    tag: Optional[str] = None,
+    clock: Clock = MONOTONIC,
+    hooks: Optional["HookRunner"] = None,
+    exporter: Optional["MetricsExporter"] = None,
+) -> None:
+    stopwatch = Stopwatch(clock=clock)
+    stopwatch.start()
+    _stream(stopwatch, fmt, rate, share, out, history, tag, hooks, exporter)
+
+
+def stream_countdown(
+    seconds: int,
+    fmt: str = "json",
+    rate: float = 1.0,
+    share: Optional[str] = None,
+    out: Optional[BinaryIO] = None,
+    history: Optional[SessionLog] = None,
+    tag: Optional[str] = None,
+    clock: Clock = MONOTONIC,
+    hooks: Optional["HookRunner"] = None,
+    exporter: Optional["MetricsExporter"] = None,
+) -> None:
+    countdown = Countdown(seconds, clock=clock)
+    _stream(countdown, fmt, rate, share, out, history, tag, hooks, exporter)
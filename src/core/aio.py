@@ -0,0 +1,216 @@
+import asyncio
+import heapq
+from dataclasses import dataclass, field
+from itertools import count
+from time import monotonic
+from typing import AsyncIterator, Optional, Union
+from weakref import WeakKeyDictionary
+
+from core.clock import MONOTONIC
+from core.termclock import Countdown, Stopwatch
+
+# Don't bother compacting small heaps; cancelled entries are cheap to skip there.
+_COMPACT_MIN_SIZE = 1024
+
+
+class _Scheduler:
+    """Wakes futures at `monotonic()` deadlines using a single loop timer.
+
+    Deadlines live in a min-heap and only the earliest one has a `call_at`
+    handle, so thousands of waiters cost one timer instead of one each.
+    Cancelled waiters are skipped when they surface, and the heap is compacted
+    once they dominate it.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self._heap: list[tuple[float, int, asyncio.Future]] = []
+        self._counter = count()
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._armed_at: Optional[float] = None
+        self._stale = 0
+
+    def __len__(self) -> int:
+        return len(self._heap) - self._stale
+
+    def add(self, deadline: float, future: asyncio.Future) -> None:
+        heapq.heappush(self._heap, (deadline, next(self._counter), future))
+        if self._armed_at is None or deadline < self._armed_at:
+            self._arm()
+
+    def discard(self) -> None:
+        """Note that a waiter was resolved or cancelled before its deadline."""
+        self._stale += 1
+        if len(self._heap) >= _COMPACT_MIN_SIZE and self._stale * 2 >= len(self._heap):
+            self._heap = [entry for entry in self._heap if not entry[2].done()]
+            heapq.heapify(self._heap)
+            self._stale = 0
+
+    def _arm(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._armed_at = None
+        while self._heap and self._heap[0][2].done():
+            heapq.heappop(self._heap)
+            self._stale = max(0, self._stale - 1)
+        if not self._heap:
+            return
+        deadline = self._heap[0][0]
+        # The loop's clock is usually `monotonic()` too, but don't rely on it.
+        when = self._loop.time() + (deadline - monotonic())
+        self._handle = self._loop.call_at(when, self._fire)
+        self._armed_at = deadline
+
+    def _fire(self) -> None:
+        self._handle = None
+        now = monotonic()
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            _, _, future = heapq.heappop(heap)
+            if future.done():
+                self._stale = max(0, self._stale - 1)
+            else:
+                future.set_result(None)
+        self._arm()
+
+
+_schedulers: "WeakKeyDictionary[asyncio.AbstractEventLoop, _Scheduler]" = WeakKeyDictionary()
+
+
+def _scheduler() -> _Scheduler:
+    loop = asyncio.get_running_loop()
+    scheduler = _schedulers.get(loop)
+    if scheduler is None:
+        scheduler = _schedulers[loop] = _Scheduler(loop)
+    return scheduler
+
+
+async def _wait(deadline: Optional[float], waiters: Optional[set] = None) -> None:
+    """Sleep until `deadline` (forever if None) or until a future in `waiters` is woken."""
+    future = asyncio.get_running_loop().create_future()
+    scheduler = _scheduler()
+    if deadline is not None:
+        scheduler.add(deadline, future)
+    if waiters is not None:
+        waiters.add(future)
+    try:
+        await future
+    finally:
+        if waiters is not None:
+            waiters.discard(future)
+        if deadline is not None and deadline > monotonic():
+            scheduler.discard()
+
+
+async def sleep_until(deadline: float) -> None:
+    """Sleep until the `monotonic()` deadline on the shared per-loop scheduler."""
+    while monotonic() < deadline:
+        await _wait(deadline)
+
+
+def _require_monotonic(timer: Union[Countdown, Stopwatch]) -> None:
+    # The scheduler sleeps on `monotonic()`; deadlines from another clock would
+    # be in a different timebase and make waiters spin.
+    if timer.clock is not MONOTONIC:
+        raise ValueError(f"{type(timer).__name__} needs the monotonic clock.")
+
+
+def _notify(waiters: set) -> None:
+    for future in waiters:
+        if not future.done():
+            future.set_result(None)
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """A stopwatch reading taken by `AsyncStopwatch.ticks()`."""
+
+    elapsed: float
+    running: bool
+
+
+@dataclass
+class AsyncCountdown(Countdown):
+    """A `Countdown` that can be awaited.
+
+    Pause, resume and reset wake any waiters so they re-aim at the new deadline.
+    Use it from the event loop's thread. Only the default monotonic clock is supported.
+    """
+
+    _waiters: set = field(init=False, default_factory=set, repr=False)
+
+    def __post_init__(self):
+        _require_monotonic(self)
+        super().__post_init__()
+
+    async def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the countdown to expire; return False if `timeout` seconds pass first.
+
+        Time spent paused counts towards `timeout`. Cancelling the waiting task
+        leaves the countdown and other waiters untouched.
+        """
+        give_up = None if timeout is None else monotonic() + timeout
+        while not self.is_finished:
+            if give_up is not None and monotonic() >= give_up:
+                return False
+            deadline = self.next_deadline
+            if give_up is not None:
+                deadline = give_up if deadline is None else min(deadline, give_up)
+            await _wait(deadline, self._waiters)
+        return True
+
+    def pause(self):
+        super().pause()
+        _notify(self._waiters)
+
+    def resume(self):
+        super().resume()
+        _notify(self._waiters)
+
+    def reset(self):
+        super().reset()
+        _notify(self._waiters)
+
+
+@dataclass
+class AsyncStopwatch(Stopwatch):
+    """A `Stopwatch` with an async iterator of periodic readings.
+
+    Use it from the event loop's thread. Only the default monotonic clock is supported.
+    """
+
+    _waiters: set = field(init=False, default_factory=set, repr=False)
+
+    def __post_init__(self):
+        _require_monotonic(self)
+
+    async def ticks(self, interval: float = 1.0) -> AsyncIterator[Snapshot]:
+        """Yield a `Snapshot` each time the elapsed time crosses a multiple of `interval`.
+
+        Nothing is yielded while stopped. A slow consumer skips the ticks it
+        missed instead of receiving a burst of stale ones.
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        while True:
+            if not self.is_running:
+                await _wait(None, self._waiters)
+                continue
+            elapsed = self.elapsed
+            target = (elapsed // interval + 1) * interval
+            await _wait(monotonic() + (target - elapsed), self._waiters)
+            if self.is_running and self.elapsed >= target:
+                yield Snapshot(self.elapsed, True)
+
+    def start(self):
+        super().start()
+        _notify(self._waiters)
+
+    def stop(self):
+        super().stop()
+        _notify(self._waiters)
+
+    def reset(self):
+        super().reset()
+        _notify(self._waiters)
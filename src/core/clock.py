@@ -0,0 +1,66 @@
+import time
+from typing import Protocol
+
+
+class Clock(Protocol):
+    """A monotonic time source: seconds as a float and integer nanoseconds."""
+
+    def now(self) -> float: ...
+
+    def now_ns(self) -> int: ...
+
+
+class MonotonicClock:
+    """`time.monotonic`, the default. Comparable across processes (see `core.shared`)."""
+
+    name = "monotonic"
+    now = staticmethod(time.monotonic)
+    now_ns = staticmethod(time.monotonic_ns)
+
+
+class PerfCounterClock:
+    """`time.perf_counter`: the highest available resolution, but per-process."""
+
+    name = "perf_counter"
+    now = staticmethod(time.perf_counter)
+    now_ns = staticmethod(time.perf_counter_ns)
+
+
+class VirtualClock:
+    """A clock that only moves when told to, for simulations and benchmarks.
+
+    Time is kept in integer nanoseconds, so the compact timers stay exact.
+    """
+
+    name = "virtual"
+
+    def __init__(self, start_ns: int = 0) -> None:
+        self._ns = start_ns
+
+    def now(self) -> float:
+        return self._ns / 1e9
+
+    def now_ns(self) -> int:
+        return self._ns
+
+    def advance_ns(self, ns: int) -> None:
+        if ns < 0:
+            raise ValueError("a clock can't go backwards")
+        self._ns += ns
+
+    def advance(self, seconds: float) -> None:
+        self.advance_ns(round(seconds * 1e9))
+
+    def advance_to(self, when: float) -> None:
+        """Move to `when` seconds (never backwards), landing on or just after it."""
+        ns = max(self._ns, round(when * 1e9))
+        # Float deadlines aren't always whole nanoseconds; never stop short of one.
+        while ns / 1e9 < when:
+            ns += 1
+        self._ns = ns
+
+
+MONOTONIC = MonotonicClock()
+PERF_COUNTER = PerfCounterClock()
+
+CLOCKS = {clock.name: clock for clock in (MONOTONIC, PERF_COUNTER)}
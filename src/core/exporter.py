@@ -0,0 +1,234 @@
+"""Export a timer's state as OpenMetrics text, to a file and/or a local HTTP port.
+
+The display loop only calls `publish()` when the timer's state changes, which
+stores a small snapshot (like `SharedStateWriter`). A background thread turns
+the snapshot into text and rewrites the file at most once per `interval`, or
+sooner (but no more than every `MIN_GAP` seconds) after a state change. The
+file is replaced atomically, so a scraper never sees a partial write. Elapsed
+and remaining times are computed from the snapshot when the text is rendered,
+so the loop does no formatting or I/O for the exporter.
+"""
+
+import errno
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import monotonic
+from typing import Optional, Union
+
+from core.profiling import LoopProfiler
+from core.termclock import Countdown, Stopwatch
+
+DEFAULT_INTERVAL = 5.0
+# Coalesce state changes that arrive closer together than this into one write.
+MIN_GAP = 0.25
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+_QUANTILES = (("0.5", "p50"), ("0.95", "p95"), ("0.99", "p99"), ("1", "max"))
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _family(lines: list[str], name: str, kind: str, help: str, unit: str = "") -> None:
+    lines.append(f"# TYPE {name} {kind}")
+    if unit:
+        lines.append(f"# UNIT {name} {unit}")
+    lines.append(f"# HELP {name} {help}")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "_Server"
+
+    def do_GET(self) -> None:
+        if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = self.server.exporter.render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass  # Request logs would draw over the timer display.
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    exporter: "MetricsExporter"
+
+
+class MetricsExporter:
+    """Writes a `Stopwatch` or `Countdown` as OpenMetrics text.
+
+    Create it (checking that the file can be written and binding the HTTP port,
+    if any, so errors surface early), then `start()` it with the timer once the
+    timer exists. An `OSError` about the file has its `filename` set; one about
+    the port doesn't. Call `publish()` after every state change and `close()`
+    at exit, which writes the final state with `tm_running 0`.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        port: Optional[int] = None,
+        *,
+        interval: float = DEFAULT_INTERVAL,
+        tag: Optional[str] = None,
+    ) -> None:
+        self.path = path
+        self.interval = interval
+        self.tag = tag
+        self.writes = 0
+        self.error: Optional[str] = None
+        self.timer: Optional[Union[Stopwatch, Countdown]] = None
+        self.profiler: Optional[LoopProfiler] = None
+        self._state: tuple = ()
+        self._closed = False
+        self._written: Optional[str] = None
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._serving = False
+        self._thread: Optional[threading.Thread] = None
+        self._server: Optional[_Server] = None
+        if path is not None:
+            self._check_path()
+        if port is not None:
+            self._server = _Server(("127.0.0.1", port), _Handler)
+            self._server.exporter = self
+
+    @property
+    def port(self) -> Optional[int]:
+        return None if self._server is None else self._server.server_address[1]
+
+    def start(
+        self, timer: Union[Stopwatch, Countdown], profiler: Optional[LoopProfiler] = None
+    ) -> None:
+        self.timer = timer
+        self.profiler = profiler
+        self.publish()
+        if self.path is not None:
+            self._thread = threading.Thread(target=self._run, name="tm-metrics", daemon=True)
+            self._thread.start()
+        if self._server is not None:
+            self._serving = True
+            threading.Thread(
+                target=self._server.serve_forever, name="tm-metrics-http", daemon=True
+            ).start()
+
+    def publish(self) -> None:
+        """Snapshot the timer's state; the file is rewritten shortly after."""
+        timer = self.timer
+        if isinstance(timer, Countdown):
+            self._state = (timer.is_running, timer.next_deadline, timer.time_left)
+        elif timer.is_running:
+            self._state = (True, timer._start_time, timer._accumulated_time)
+        else:
+            self._state = (False, None, timer.elapsed)
+        self._wake.set()
+
+    def render(self) -> str:
+        timer = self.timer
+        if timer is None:
+            return "# EOF\n"
+        running, anchor, value = self._state
+        now = timer.clock.now()
+        countdown = isinstance(timer, Countdown)
+        if countdown:
+            remaining = max(0.0, anchor - now) if running else value
+            elapsed = timer.initial_seconds - remaining
+            finished = remaining <= 0
+            running = running and not finished
+        else:
+            elapsed = value + (now - anchor) if running else value
+        running = running and not self._closed
+
+        labels = f'kind="{"countdown" if countdown else "stopwatch"}"'
+        if self.tag:
+            labels += f',tag="{_label(self.tag)}"'
+        lines: list[str] = []
+        _family(lines, "tm_elapsed_seconds", "gauge", "Active time so far.", "seconds")
+        lines.append(f"tm_elapsed_seconds{{{labels}}} {elapsed:.3f}")
+        if countdown:
+            _family(lines, "tm_remaining_seconds", "gauge", "Countdown time left.", "seconds")
+            lines.append(f"tm_remaining_seconds{{{labels}}} {remaining:.3f}")
+        _family(lines, "tm_running", "gauge", "1 while the timer is running.")
+        lines.append(f"tm_running{{{labels}}} {int(running)}")
+        if countdown:
+            _family(lines, "tm_finished", "gauge", "1 once the countdown has run to zero.")
+            lines.append(f"tm_finished{{{labels}}} {int(finished)}")
+
+        if self.profiler is not None:
+            _family(
+                lines,
+                "tm_loop_seconds",
+                "summary",
+                "Render loop timings by phase (iteration, wakeup_lag, render).",
+                "seconds",
+            )
+            for phase, stats in self.profiler.report().items():
+                phase_labels = f'{labels},phase="{phase}"'
+                for quantile, key in _QUANTILES:
+                    lines.append(
+                        f'tm_loop_seconds{{{phase_labels},quantile="{quantile}"}} {stats[key]:.6f}'
+                    )
+                lines.append(f"tm_loop_seconds_count{{{phase_labels}}} {stats['count']}")
+        lines.append("# EOF\n")
+        return "\n".join(lines)
+
+    def _check_path(self) -> None:
+        if os.path.isdir(self.path):
+            raise IsADirectoryError(errno.EISDIR, os.strerror(errno.EISDIR), self.path)
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w"):
+            pass
+        os.unlink(tmp)
+
+    def _write(self) -> None:
+        text = self.render()
+        if text == self._written:
+            return
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "w") as f:
+                f.write(text)
+            os.replace(tmp, self.path)
+        except OSError as exc:
+            self.error = str(exc)
+            return
+        self._written = text
+        self.writes += 1
+
+    def _run(self) -> None:
+        last = 0.0
+        while True:
+            self._wake.wait(self.interval)
+            gap = last + MIN_GAP - monotonic()
+            # Let a burst of state changes settle into a single write.
+            if self._stopped.wait(max(0.0, gap)):
+                break
+            self._wake.clear()
+            self._write()
+            last = monotonic()
+
+    def close(self) -> None:
+        """Stop exporting and write the final state (reported as not running)."""
+        if self._closed:
+            return
+        self._closed = True
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+        if self.path is not None and self.timer is not None:
+            self._write()
+        if self._server is not None:
+            if self._serving:
+                self._server.shutdown()
+            self._server.server_close()
+        if self.error is not None:
+            print(f"time-manager: could not write metrics: {self.error}", file=sys.stderr)
@@ -1,19 +1,71 @@
 from __future__ import annotations
 
+from typing import Iterable
 
-def format_time(seconds: float, *, show_centiseconds: bool = True) -> str:
-    """Format a duration in seconds as MM:SS(.CC) or HH:MM:SS(.CC)."""
+# "00".."99", so the hot path indexes a tuple instead of formatting integers.
+_TWO_DIGITS = tuple(f"{i:02}" for i in range(100))
 
-    seconds = max(0.0, float(seconds))
-    minutes, secs = divmod(seconds, 60)
+
+def format_time(
+    seconds: float, *, show_centiseconds: bool = True, fixed_hours: bool = False
+) -> str:
+    """Format a duration in seconds as MM:SS(.CC) or HH:MM:SS(.CC).
+
+    Hours are shown once the duration reaches an hour, or always with `fixed_hours`.
+    """
+
+    if type(seconds) is int:
+        # Whole seconds: no float conversion, and the centiseconds are always 0.
+        whole = seconds if seconds > 0 else 0
+        centiseconds = 0
+    else:
+        seconds = max(0.0, float(seconds))
+        whole = int(seconds)
+        centiseconds = int((seconds * 100) % 100) if show_centiseconds else 0
+
+    minutes, secs = divmod(whole, 60)
     hours, minutes = divmod(minutes, 60)
 
+    if hours or fixed_hours:
+        hh = _TWO_DIGITS[hours] if hours < 100 else str(hours)
+        text = f"{hh}:{_TWO_DIGITS[minutes]}:{_TWO_DIGITS[secs]}"
+    else:
+        text = f"{_TWO_DIGITS[minutes]}:{_TWO_DIGITS[secs]}"
+
+    if show_centiseconds:
+        return f"{text}.{_TWO_DIGITS[centiseconds]}"
+    return text
+
+
+def format_times(
+    values: Iterable[float],
+    *,
+    show_centiseconds: bool = True,
+    fixed_hours: bool = False,
+) -> list[str]:
+    """Format many durations at once; accepts any iterable, including NumPy arrays.
+
+    Without centiseconds, durations that share a whole second share one string,
+    which is the common case when formatting a table of timers every second.
+    """
+
+    if hasattr(values, "tolist"):
+        values = values.tolist()
+
     if show_centiseconds:
-        centiseconds = int((seconds * 100) % 100)
-        if hours > 0:
-            return f"{int(hours):02}:{int(minutes):02}:{int(secs):02}.{centiseconds:02}"
-        return f"{int(minutes):02}:{int(secs):02}.{centiseconds:02}"
-
-    if hours > 0:
-        return f"{int(hours):02}:{int(minutes):02}:{int(secs):02}"
-    return f"{int(minutes):02}:{int(secs):02}"
+        return [
+            format_time(value, show_centiseconds=True, fixed_hours=fixed_hours)
+            for value in values
+        ]
+
+    cache: dict[int, str] = {}
+    result = []
+    for value in values:
+        whole = int(value) if value > 0 else 0
+        text = cache.get(whole)
+        if text is None:
+            text = cache[whole] = format_time(
+                whole, show_centiseconds=False, fixed_hours=fixed_hours
+            )
+        result.append(text)
+    return result
@@ -0,0 +1,243 @@
+import fcntl
+import mmap
+import os
+import struct
+import sys
+import time
+from bisect import bisect_left
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Iterator, Optional, Union
+
+from core.termclock import Countdown, Stopwatch
+
+# One session: ended (epoch s), active seconds, planned seconds (0 for a
+# stopwatch), kind (0 stopwatch, 1 countdown), completed, tag (UTF-8, padded).
+_RECORD = struct.Struct("<dddBB6x16s")
+# One index entry per local day: day ordinal, number of the day's first record.
+_INDEX = struct.Struct("<qq")
+
+DATA_FILE = "sessions.bin"
+INDEX_FILE = "sessions.idx"
+TAG_BYTES = 16
+# Shorter sessions are accidental starts (or a UI that failed to open).
+MIN_ACTIVE = 1.0
+
+
+def default_history_dir() -> str:
+    """`$XDG_DATA_HOME/time-manager`, falling back to `~/.local/share/time-manager`."""
+    base = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+    return os.path.join(base, "time-manager")
+
+
+@dataclass(frozen=True)
+class Session:
+    ended: float
+    active: float
+    planned: float
+    kind: str
+    completed: bool
+    tag: str
+
+    @property
+    def day(self) -> date:
+        return date.fromtimestamp(self.ended)
+
+
+def _session(fields: tuple) -> Session:
+    ended, active, planned, kind, completed, tag = fields
+    return Session(
+        ended,
+        active,
+        planned,
+        "countdown" if kind else "stopwatch",
+        bool(completed),
+        tag.rstrip(b"\0").decode("utf-8", "replace"),
+    )
+
+
+def _encode_tag(tag: str) -> bytes:
+    raw = tag.encode("utf-8")[:TAG_BYTES]
+    # Don't leave half a multi-byte character at the cut.
+    return raw.decode("utf-8", "ignore").encode("utf-8")
+
+
+class SessionLog:
+    """Append-only log of finished sessions with a per-day index.
+
+    Records are fixed-width (48 bytes) and appended in the order sessions end,
+    so each local day is one contiguous run of records. The index holds one
+    16-byte entry per day with that day's first record number; queries bisect
+    it and mmap only the matching slice of the log. Appends take an exclusive
+    `flock`, so several `tm` processes can share one log.
+    """
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        self.directory = directory or default_history_dir()
+        self.data_path = os.path.join(self.directory, DATA_FILE)
+        self.index_path = os.path.join(self.directory, INDEX_FILE)
+
+    def append(
+        self,
+        kind: str,
+        active: float,
+        *,
+        planned: float = 0.0,
+        completed: bool = False,
+        tag: str = "",
+        ended: Optional[float] = None,
+    ) -> None:
+        ended = time.time() if ended is None else ended
+        record = _RECORD.pack(
+            ended, active, planned, kind == "countdown", completed, _encode_tag(tag)
+        )
+        day = date.fromtimestamp(ended).toordinal()
+
+        os.makedirs(self.directory, exist_ok=True)
+        data = os.open(self.data_path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            fcntl.flock(data, fcntl.LOCK_EX)
+            index = os.open(self.index_path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                # Drop a torn trailing record left by a writer that crashed mid-append.
+                size = os.fstat(data).st_size
+                number = size // _RECORD.size
+                if size % _RECORD.size:
+                    os.ftruncate(data, number * _RECORD.size)
+                index_size = os.fstat(index).st_size // _INDEX.size * _INDEX.size
+                last_day = None
+                if index_size:
+                    tail = os.pread(index, _INDEX.size, index_size - _INDEX.size)
+                    last_day, _ = _INDEX.unpack(tail)
+                if last_day is None or day > last_day:
+                    os.write(index, _INDEX.pack(day, number))
+                os.write(data, record)
+            finally:
+                os.close(index)
+        finally:
+            os.close(data)  # also releases the lock
+
+    def __len__(self) -> int:
+        try:
+            return os.stat(self.data_path).st_size // _RECORD.size
+        except FileNotFoundError:
+            return 0
+
+    def _index(self) -> tuple[list[int], list[int]]:
+        try:
+            with open(self.index_path, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return [], []
+        entries = list(_INDEX.iter_unpack(raw[: len(raw) // _INDEX.size * _INDEX.size]))
+        return [day for day, _ in entries], [first for _, first in entries]
+
+    def _days(self, start: date, end: date) -> Iterator[tuple[int, Iterator[tuple]]]:
+        """Yield (day ordinal, raw record tuples) for each indexed day in the range."""
+        days, firsts = self._index()
+        total = len(self)
+        lo = bisect_left(days, start.toordinal())
+        hi = bisect_left(days, end.toordinal() + 1)
+        if lo == hi:
+            return
+        first = firsts[lo]
+        last = firsts[hi] if hi < len(firsts) else total
+        if last <= first:
+            return
+
+        with open(self.data_path, "rb") as f:
+            # mmap offsets must be page-aligned, so map from the page holding `first`.
+            offset = first * _RECORD.size
+            aligned = offset - offset % mmap.ALLOCATIONGRANULARITY
+            length = last * _RECORD.size - aligned
+            with mmap.mmap(f.fileno(), length, access=mmap.ACCESS_READ, offset=aligned) as view:
+                base = offset - aligned - first * _RECORD.size
+                for i in range(lo, hi):
+                    day_last = firsts[i + 1] if i + 1 < len(firsts) else total
+                    # Slicing an mmap copies just that day's records out of the page cache.
+                    chunk = view[base + firsts[i] * _RECORD.size : base + day_last * _RECORD.size]
+                    yield days[i], _RECORD.iter_unpack(chunk)
+
+    def sessions(self, start: date, end: date) -> Iterator[Session]:
+        """Yield the sessions that ended on local days `start` through `end` inclusive."""
+        for _, records in self._days(start, end):
+            for fields in records:
+                yield _session(fields)
+
+
+@dataclass
+class Totals:
+    sessions: int = 0
+    active: float = 0.0
+    completed: int = 0
+
+
+def stats(
+    log: SessionLog,
+    days: int,
+    *,
+    by: str = "day",
+    tag: Optional[str] = None,
+    today: Optional[date] = None,
+) -> dict[str, Totals]:
+    """Totals per day, ISO week or tag over the last `days` local days (including today).
+
+    The day of each record comes from the index, and tags are compared as raw
+    bytes, so the per-record work is one unpack and a few additions.
+    """
+    if by not in ("day", "week", "tag"):
+        raise ValueError(f"Unknown grouping {by!r}; expected day, week or tag.")
+    end = today or date.today()
+    start = end - timedelta(days=max(1, days) - 1)
+    wanted = None if tag is None else _encode_tag(tag).ljust(TAG_BYTES, b"\0")
+    totals: dict[object, Totals] = {}
+
+    for ordinal, records in log._days(start, end):
+        day = date.fromordinal(ordinal)
+        if by == "day":
+            entry = totals.setdefault(day.isoformat(), Totals())
+        elif by == "week":
+            year, week, _ = day.isocalendar()
+            entry = totals.setdefault(f"{year}-W{week:02}", Totals())
+        for _, active, _, _, completed, raw_tag in records:
+            if wanted is not None and raw_tag != wanted:
+                continue
+            if by == "tag":
+                entry = totals.get(raw_tag)
+                if entry is None:
+                    entry = totals[raw_tag] = Totals()
+            entry.sessions += 1
+            entry.active += active
+            entry.completed += completed
+
+    if by == "tag":
+        totals = {
+            (key.rstrip(b"\0").decode("utf-8", "replace") or "(untagged)"): entry
+            for key, entry in totals.items()
+        }
+    return {key: entry for key, entry in sorted(totals.items()) if entry.sessions}
+
+
+def log_session(
+    timer: Union[Stopwatch, Countdown],
+    tag: Optional[str] = None,
+    log: Optional[SessionLog] = None,
+) -> None:
+    """Record a finished `tm` session; sessions under `MIN_ACTIVE` seconds are skipped.
+
+    History is best-effort: a failure to write it is reported on stderr but
+    doesn't interrupt the exit.
+    """
+    if isinstance(timer, Countdown):
+        kind, planned = "countdown", float(timer.initial_seconds)
+        active, completed = planned - timer.time_left, timer.is_finished
+    else:
+        kind, planned, active, completed = "stopwatch", 0.0, timer.elapsed, False
+    if active < MIN_ACTIVE:
+        return
+    try:
+        (log or SessionLog()).append(
+            kind, active, planned=planned, completed=completed, tag=tag or ""
+        )
+    except OSError as exc:
+        print(f"time-manager: could not save session history: {exc}", file=sys.stderr)
@@ -0,0 +1,228 @@
+import os
+import signal
+import subprocess
+import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from time import monotonic
+from typing import Optional, Sequence, Union
+
+from core.termclock import Countdown, Stopwatch
+
+HOOK_TIMEOUT = 10.0
+# Each worker only waits on a child process, so a few threads are plenty.
+MAX_WORKERS = 4
+# Runs kept for the report; older ones are dropped.
+MAX_RECORDS = 1024
+
+
+@dataclass(frozen=True)
+class TickHook:
+    """A command to run each time the active time crosses a multiple of `every` seconds."""
+
+    every: int
+    command: str
+
+
+def parse_tick_hook(spec: str) -> TickHook:
+    """Parse `SECONDS:COMMAND`, e.g. `300:notify-send 'Five minutes in'`."""
+    every, sep, command = spec.partition(":")
+    seconds = int(every) if every.strip().isdigit() else 0
+    if not sep or seconds <= 0 or not command.strip():
+        raise ValueError(f"Expected SECONDS:COMMAND with whole seconds above 0, got {spec!r}.")
+    return TickHook(seconds, command)
+
+
+@dataclass(frozen=True)
+class HookRun:
+    """One hook execution; times are `monotonic()` seconds."""
+
+    event: str
+    command: str
+    queued: float
+    started: float
+    finished: float
+    returncode: Optional[int]  # None if it timed out or couldn't start
+    timed_out: bool = False
+    error: str = ""
+
+    @property
+    def delay(self) -> float:
+        """Time spent waiting for a worker."""
+        return self.started - self.queued
+
+    @property
+    def duration(self) -> float:
+        return self.finished - self.started
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0
+
+
+def _reading(timer: Union[Stopwatch, Countdown]) -> tuple[str, float, Optional[float]]:
+    """Kind, active seconds and seconds remaining (None for a stopwatch)."""
+    if isinstance(timer, Countdown):
+        left = timer.time_left
+        return "countdown", timer.initial_seconds - left, left
+    return "stopwatch", timer.elapsed, None
+
+
+class HookRunner:
+    """Runs shell-command hooks on a small thread pool, off the display loop.
+
+    `poll()` (call it on each redraw) and `finish()` only queue work. Hooks get
+    `TM_EVENT`, `TM_KIND`, `TM_ELAPSED` and `TM_REMAINING` in their environment,
+    run in their own session, and are killed along with their process group
+    after `timeout` seconds. A tick hook whose previous run is still going is
+    skipped rather than queued, so a slow hook can't pile up work in front of
+    the others.
+    """
+
+    def __init__(
+        self,
+        on_finish: Sequence[str] = (),
+        on_tick: Sequence[TickHook] = (),
+        *,
+        timeout: float = HOOK_TIMEOUT,
+    ) -> None:
+        self.on_finish = list(on_finish)
+        self.on_tick = list(on_tick)
+        self.timeout = timeout
+        self.records: deque[HookRun] = deque(maxlen=MAX_RECORDS)
+        self.skipped = 0
+        self._lock = threading.Lock()
+        self._busy: set[int] = set()  # tick hooks with a run in flight
+        self._fired = [0] * len(self.on_tick)  # multiples of `every` already handled
+        self._finished = False
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    def __bool__(self) -> bool:
+        return bool(self.on_finish or self.on_tick)
+
+    def poll(self, timer: Union[Stopwatch, Countdown]) -> None:
+        """Queue the tick hooks whose interval was crossed since the last poll."""
+        if not self.on_tick:
+            return
+        kind, active, remaining = _reading(timer)
+        for i, hook in enumerate(self.on_tick):
+            crossed = int(active // hook.every)
+            if crossed <= self._fired[i]:
+                # Also follows a reset back down.
+                self._fired[i] = crossed
+                continue
+            self._fired[i] = crossed
+            with self._lock:
+                if i in self._busy:
+                    self.skipped += 1
+                    continue
+                self._busy.add(i)
+            self._submit("tick", hook.command, kind, active, remaining, i)
+
+    def finish(self, timer: Union[Stopwatch, Countdown]) -> None:
+        """Queue the finish hooks (once)."""
+        if self._finished:
+            return
+        self._finished = True
+        kind, active, remaining = _reading(timer)
+        for command in self.on_finish:
+            self._submit("finish", command, kind, active, remaining)
+
+    def _submit(
+        self,
+        event: str,
+        command: str,
+        kind: str,
+        active: float,
+        remaining: Optional[float],
+        tick: Optional[int] = None,
+    ) -> None:
+        env = dict(
+            os.environ,
+            TM_EVENT=event,
+            TM_KIND=kind,
+            TM_ELAPSED=f"{active:.3f}",
+            TM_REMAINING="" if remaining is None else f"{remaining:.3f}",
+        )
+        if self._pool is None:
+            workers = min(MAX_WORKERS, len(self.on_finish) + len(self.on_tick))
+            self._pool = ThreadPoolExecutor(workers, thread_name_prefix="tm-hook")
+        self._pool.submit(self._run, event, command, env, monotonic(), tick)
+
+    def _run(
+        self, event: str, command: str, env: dict, queued: float, tick: Optional[int]
+    ) -> None:
+        started = monotonic()
+        returncode, timed_out, error = None, False, ""
+        try:
+            # Hooks mustn't draw over the timer display.
+            proc = subprocess.Popen(
+                command,
+                shell=True,
+                env=env,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+            try:
+                returncode = proc.wait(self.timeout)
+            except subprocess.TimeoutExpired:
+                timed_out = True
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+                proc.wait()
+        except OSError as exc:
+            error = str(exc)
+        finally:
+            self.records.append(
+                HookRun(event, command, queued, started, monotonic(), returncode, timed_out, error)
+            )
+            if tick is not None:
+                with self._lock:
+                    self._busy.discard(tick)
+
+    def close(self) -> None:
+        """Wait for queued and running hooks (each bounded by the timeout), then report failures.
+
+        Like the session history, hooks are best-effort: failures are summed up
+        on stderr rather than raised.
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        failed = [run for run in self.records if not run.ok]
+        for run in failed[-5:]:
+            if run.timed_out:
+                reason = f"timed out after {self.timeout:g} s"
+            elif run.error:
+                reason = run.error
+            else:
+                reason = f"exited with status {run.returncode}"
+            print(f"time-manager: {run.event} hook {run.command!r} {reason}", file=sys.stderr)
+        if len(failed) > 5:
+            print(f"time-manager: {len(failed) - 5} more hook runs failed", file=sys.stderr)
+
+    def print_report(self, file=None) -> None:
+        """Print queue delay and run time percentiles per event, like `LoopProfiler`."""
+        file = file or sys.stderr
+        print(f"{'hooks':<14}{'count':>6}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}", file=file)
+        for event in ("tick", "finish"):
+            runs = [run for run in self.records if run.event == event]
+            for name, values in (
+                (f"{event} delay", sorted(run.delay for run in runs)),
+                (f"{event} run", sorted(run.duration for run in runs)),
+            ):
+                if not values:
+                    continue
+                cells = "".join(
+                    f"{values[min(len(values) - 1, int(len(values) * q))] * 1000:>8.2f}ms"
+                    for q in (0.5, 0.95, 0.99, 1.0)
+                )
+                print(f"{name:<14}{len(values):>6}{cells}", file=file)
+        if self.skipped:
+            print(f"{self.skipped} tick runs skipped while the previous one ran", file=file)
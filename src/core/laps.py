@@ -0,0 +1,89 @@
+import math
+import struct
+from array import array
+from typing import BinaryIO, Iterator, Optional, TextIO, Union
+
+from core.formatting import format_time
+
+_BINARY_LAP = struct.Struct("<q")
+
+
+class LapRecorder:
+    """Records lap durations in a compact buffer with O(1) running statistics.
+
+    Laps are stored as integer nanoseconds in an `array('q')` (8 bytes per lap),
+    and min/max/mean/stddev are updated incrementally on every lap (Welford).
+    With `sink`, each lap is also streamed to a file: CSV if the path ends in
+    `.csv`, otherwise little-endian int64 nanoseconds. Pass `keep=False` to keep
+    only the statistics, so memory stays flat over very long sessions.
+    """
+
+    def __init__(self, sink: Optional[str] = None, *, keep: bool = True) -> None:
+        self._laps: Optional[array] = array("q") if keep else None
+        self._sink: Union[TextIO, BinaryIO, None] = None
+        self._csv = False
+        if sink is not None:
+            self._csv = sink.lower().endswith(".csv")
+            self._sink = open(sink, "w" if self._csv else "wb")
+            if self._csv:
+                self._sink.write("lap,lap_seconds,split_seconds\n")
+        self.clear()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[float]:
+        """Yield the kept lap durations in seconds."""
+        for lap_ns in self._laps or ():
+            yield lap_ns / 1e9
+
+    def clear(self) -> None:
+        if self._laps is not None:
+            del self._laps[:]
+        self.count = 0
+        self.last = 0.0
+        self.best = math.inf
+        self.worst = 0.0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._split = 0.0
+
+    def record(self, seconds: float) -> None:
+        lap_ns = round(seconds * 1e9)
+        seconds = lap_ns / 1e9
+        self.count += 1
+        self.last = seconds
+        self.best = min(self.best, seconds)
+        self.worst = max(self.worst, seconds)
+        delta = seconds - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (seconds - self.mean)
+        self._split += seconds
+
+        if self._laps is not None:
+            self._laps.append(lap_ns)
+        if self._sink is not None:
+            if self._csv:
+                self._sink.write(f"{self.count},{seconds:.9f},{self._split:.9f}\n")
+            else:
+                self._sink.write(_BINARY_LAP.pack(lap_ns))
+
+    @property
+    def stddev(self) -> float:
+        """Sample standard deviation of the lap durations."""
+        return math.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    def summary(self) -> str:
+        """One-line summary for display, or "" before the first lap."""
+        if not self.count:
+            return ""
+        return (
+            f"Lap {self.count}  last {format_time(self.last)}  "
+            f"best {format_time(self.best)}  mean {format_time(self.mean)}  "
+            f"± {self.stddev:.2f}s"
+        )
+
+    def close(self) -> None:
+        if self._sink is not None:
+            self._sink.close()
+            self._sink = None
@@ -0,0 +1,28 @@
+from time import sleep
+
+from core.clock import MONOTONIC, Clock
+
+# Sleep until this close to a deadline, then spin the rest of the way. Sleeps and
+# `select` timeouts routinely overshoot by a millisecond or more; spinning doesn't.
+SPIN_WINDOW = 0.002
+
+
+def wait_until(deadline: float, *, spin: float = SPIN_WINDOW, clock: Clock = MONOTONIC) -> float:
+    """Block until the `clock.now()` deadline and return how late we woke up.
+
+    Sleeps coarsely until `spin` seconds before the deadline, then busy-waits,
+    so the result is typically a few microseconds. Needs a real (not virtual) clock.
+    """
+    remaining = deadline - clock.now()
+    if remaining > spin:
+        sleep(remaining - spin)
+    while (now := clock.now()) < deadline:
+        pass
+    return now - deadline
+
+
+def coarse_timeout(
+    deadline: float, timeout: float, *, spin: float = SPIN_WINDOW, clock: Clock = MONOTONIC
+) -> float:
+    """Shorten a wait of `timeout` seconds so it ends `spin` before `deadline`."""
+    return max(0.0, min(timeout, deadline - clock.now() - spin))
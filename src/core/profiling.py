@@ -0,0 +1,112 @@
+import json
+import math
+import sys
+from time import perf_counter
+from typing import Optional
+
+# Log-linear buckets: 8 per power of two, from 1 µs up to ~2^27 µs (~2 minutes).
+_SUB_BUCKETS = 8
+_OCTAVES = 28
+_BUCKETS = _SUB_BUCKETS * _OCTAVES
+
+
+class Histogram:
+    """Fixed-size histogram of durations, with buckets at most 12.5% wide.
+
+    Recording is O(1) and memory doesn't grow with the number of samples, so it
+    can stay on for a whole session.
+    """
+
+    def __init__(self) -> None:
+        self.counts = [0] * _BUCKETS
+        self.count = 0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        if seconds > self.max:
+            self.max = seconds
+        micros = seconds * 1e6
+        if micros < 1.0:
+            index = 0
+        else:
+            mantissa, exponent = math.frexp(micros)  # micros = mantissa * 2**exponent
+            index = (exponent - 1) * _SUB_BUCKETS + int((mantissa - 0.5) * 2 * _SUB_BUCKETS)
+            index = min(index, _BUCKETS - 1)
+        self.counts[index] += 1
+
+    def percentile(self, percent: float) -> float:
+        """Upper bound (in seconds) of the bucket holding the given percentile."""
+        if not self.count:
+            return 0.0
+        rank = math.ceil(self.count * percent / 100)
+        seen = 0
+        for index, bucket in enumerate(self.counts):
+            seen += bucket
+            if seen >= rank:
+                octave, sub = divmod(index, _SUB_BUCKETS)
+                upper = math.ldexp(0.5 + (sub + 1) / (2 * _SUB_BUCKETS), octave + 1) / 1e6
+                return min(upper, self.max)
+        return self.max
+
+    def summary(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+
+class LoopProfiler:
+    """Records per-iteration timings of a render loop.
+
+    - iteration: time spent working in one loop iteration (excluding the wait)
+    - wakeup_lag: how much later than requested a timed wait actually returned
+    - render: time spent building and drawing the frame
+    """
+
+    def __init__(self) -> None:
+        self.iteration = Histogram()
+        self.wakeup_lag = Histogram()
+        self.render = Histogram()
+
+    def record(
+        self,
+        started: float,
+        rendered: float,
+        timeout: Optional[float],
+        woke: float,
+        timed_out: bool,
+    ) -> None:
+        """Record one iteration from `perf_counter()` timestamps.
+
+        The loop started at `started`, finished rendering at `rendered`, then
+        waited (up to `timeout` seconds) until `woke`. Call this at the end of
+        the iteration so input handling counts towards the iteration time.
+        """
+        render = rendered - started
+        self.render.record(render)
+        self.iteration.record(render + (perf_counter() - woke))
+        if timed_out and timeout is not None:
+            self.wakeup_lag.record(max(0.0, (woke - rendered) - timeout))
+
+    def report(self) -> dict[str, dict[str, float]]:
+        return {
+            "iteration": self.iteration.summary(),
+            "wakeup_lag": self.wakeup_lag.summary(),
+            "render": self.render.summary(),
+        }
+
+    def print_report(self, file=None) -> None:
+        file = file or sys.stderr
+        print(f"{'profile':<12}{'count':>8}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}", file=file)
+        for name, stats in self.report().items():
+            values = "".join(f"{stats[key] * 1000:>8.2f}ms" for key in ("p50", "p95", "p99", "max"))
+            print(f"{name:<12}{stats['count']:>8}{values}", file=file)
+
+    def dump(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=2)
+            f.write("\n")
@@ -0,0 +1,187 @@
+import heapq
+from itertools import count
+from typing import Iterable, Iterator, Optional, Union
+
+from core.clock import MONOTONIC, Clock
+from core.termclock import Countdown, Stopwatch
+
+Timer = Union[Stopwatch, Countdown]
+
+# Don't bother compacting small heaps; stale entries are cheap to skip there.
+_COMPACT_MIN_SIZE = 1024
+
+
+class TimerRegistry:
+    """A collection of named stopwatches and countdowns.
+
+    Running countdowns are kept in a min-heap keyed by deadline, so the next expiry
+    is an O(1) peek and `poll()` only touches countdowns that actually expired.
+    Pausing, resetting or removing a countdown leaves its heap entry behind; stale
+    entries are skipped lazily and the heap is compacted once they dominate it.
+    """
+
+    def __init__(self, clock: Clock = MONOTONIC) -> None:
+        self.clock = clock
+        self._timers: dict[str, Timer] = {}
+        # (deadline, token, name). An entry is live while `_tokens[name] == token`.
+        self._heap: list[tuple[float, int, str]] = []
+        self._tokens: dict[str, int] = {}
+        self._counter = count()
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._timers
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._timers)
+
+    def __getitem__(self, name: str) -> Timer:
+        return self._timers[name]
+
+    def items(self):
+        return self._timers.items()
+
+    def add_stopwatch(self, name: str, *, start: bool = False) -> Stopwatch:
+        stopwatch = Stopwatch(clock=self.clock)
+        if start:
+            stopwatch.start()
+        self._add(name, stopwatch)
+        return stopwatch
+
+    def add_countdown(self, name: str, seconds: int, *, start: bool = True) -> Countdown:
+        countdown = Countdown(seconds, clock=self.clock)
+        if not start:
+            countdown.pause()
+        self._add(name, countdown)
+        self._schedule(name, countdown)
+        return countdown
+
+    def remove(self, name: str) -> Timer:
+        timer = self._timers.pop(name)
+        self._unschedule(name)
+        self._maybe_compact()
+        return timer
+
+    def pause(self, name: str) -> None:
+        self.pause_all((name,))
+
+    def resume(self, name: str) -> None:
+        self.resume_all((name,))
+
+    def reset(self, name: str) -> None:
+        self.reset_all((name,))
+
+    def toggle(self, name: str) -> None:
+        if self._timers[name].is_running:
+            self.pause(name)
+        else:
+            self.resume(name)
+
+    def pause_all(self, names: Optional[Iterable[str]] = None) -> None:
+        """Pause the named timers (all timers if `names` is None)."""
+        for name, timer in self._select(names):
+            if isinstance(timer, Countdown):
+                timer.pause()
+                self._unschedule(name)
+            else:
+                timer.stop()
+        self._maybe_compact()
+
+    def resume_all(self, names: Optional[Iterable[str]] = None) -> None:
+        """Resume the named timers (all timers if `names` is None)."""
+        countdowns = []
+        for name, timer in self._select(names):
+            if isinstance(timer, Countdown):
+                if not timer.is_running:
+                    timer.resume()
+                    countdowns.append((name, timer))
+            else:
+                timer.start()
+        self._schedule_many(countdowns)
+
+    def reset_all(self, names: Optional[Iterable[str]] = None) -> None:
+        """Reset the named timers (all timers if `names` is None).
+
+        Stopwatches go back to zero and stop; countdowns restore their full
+        duration and keep running if they were.
+        """
+        countdowns = []
+        for name, timer in self._select(names):
+            timer.reset()
+            if isinstance(timer, Countdown):
+                self._unschedule(name)
+                countdowns.append((name, timer))
+        self._schedule_many(countdowns)
+        self._maybe_compact()
+
+    def next_deadline(self) -> Optional[float]:
+        """Return the `clock.now()` time of the next countdown expiry, if any."""
+        heap = self._heap
+        while heap and self._tokens.get(heap[0][2]) != heap[0][1]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def poll(self) -> list[str]:
+        """Return the names of countdowns that expired since the last poll.
+
+        Names are returned in deadline order. Only expired heap entries are
+        touched, so the cost is O(k log n) for k expiries.
+        """
+        now = self.clock.now()
+        heap = self._heap
+        expired = []
+        while heap and heap[0][0] <= now:
+            _, token, name = heapq.heappop(heap)
+            if self._tokens.get(name) != token:
+                continue
+            del self._tokens[name]
+            expired.append(name)
+        return expired
+
+    def _add(self, name: str, timer: Timer) -> None:
+        if name in self._timers:
+            raise ValueError(f"Timer '{name}' already exists.")
+        self._timers[name] = timer
+
+    def _select(self, names: Optional[Iterable[str]]):
+        if names is None:
+            return list(self._timers.items())
+        return [(name, self._timers[name]) for name in names]
+
+    def _entry(self, name: str, countdown: Countdown) -> Optional[tuple[float, int, str]]:
+        deadline = countdown.next_deadline
+        # Finished countdowns were already reported (or never ran); don't queue them.
+        if deadline is None or countdown.is_finished:
+            return None
+        token = next(self._counter)
+        self._tokens[name] = token
+        return (deadline, token, name)
+
+    def _schedule(self, name: str, countdown: Countdown) -> None:
+        entry = self._entry(name, countdown)
+        if entry is not None:
+            heapq.heappush(self._heap, entry)
+
+    def _schedule_many(self, countdowns: list[tuple[str, Countdown]]) -> None:
+        entries = [self._entry(name, countdown) for name, countdown in countdowns]
+        entries = [entry for entry in entries if entry is not None]
+        if len(entries) > len(self._heap):
+            # Bulk resume: re-heapifying is O(n) versus O(k log n) for k pushes.
+            self._heap.extend(entries)
+            heapq.heapify(self._heap)
+        else:
+            for entry in entries:
+                heapq.heappush(self._heap, entry)
+
+    def _unschedule(self, name: str) -> None:
+        self._tokens.pop(name, None)
+
+    def _maybe_compact(self) -> None:
+        heap = self._heap
+        if len(heap) < _COMPACT_MIN_SIZE or len(heap) < 2 * len(self._tokens):
+            return
+        tokens = self._tokens
+        self._heap = [entry for entry in heap if tokens.get(entry[2]) == entry[1]]
+        heapq.heapify(self._heap)
@@ -0,0 +1,166 @@
+import os
+import statistics
+import subprocess
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+from core.termclock import Stopwatch
+
+# `ru_maxrss` is kilobytes on Linux and bytes on macOS.
+_RSS_SCALE = 1 if sys.platform == "darwin" else 1024
+
+
+@dataclass(frozen=True)
+class RunResult:
+    """Wall time, CPU time (seconds) and peak RSS (bytes) of one finished command.
+
+    A run that couldn't be carried out (e.g. the command failed to start) has
+    `error` set and zeroes elsewhere; it counts as a failure, not a sample.
+    """
+
+    wall: float
+    user: float
+    sys: float
+    max_rss: int
+    returncode: int
+    error: Optional[str] = None
+
+    @classmethod
+    def failed(cls, exc: BaseException) -> "RunResult":
+        return cls(0.0, 0.0, 0.0, 0, -1, error=str(exc) or type(exc).__name__)
+
+
+@dataclass(frozen=True)
+class Summary:
+    """Statistics over one metric of several runs."""
+
+    count: int
+    mean: float
+    median: float
+    stddev: float
+    min: float
+    max: float
+    outliers: int
+
+
+def run_once(argv: Sequence[str], *, show_output: bool = False) -> RunResult:
+    """Run `argv` to completion and measure it with a `Stopwatch` and `os.wait4`.
+
+    `wait4` reports the child's own rusage, so concurrent runs don't see each
+    other's CPU time or memory. Linux counts the forking process's resident size
+    before `exec` towards `ru_maxrss`, so peak RSS has a floor of about `tm`'s own.
+    """
+    output = None if show_output else subprocess.DEVNULL
+    stopwatch = Stopwatch()
+    stopwatch.start()
+    proc = subprocess.Popen(argv, stdin=subprocess.DEVNULL, stdout=output, stderr=output)
+    _, status, usage = os.wait4(proc.pid, 0)
+    stopwatch.stop()
+    # We reaped the child ourselves; tell Popen so it doesn't try again.
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    return RunResult(
+        wall=stopwatch.elapsed,
+        user=usage.ru_utime,
+        sys=usage.ru_stime,
+        max_rss=usage.ru_maxrss * _RSS_SCALE,
+        returncode=proc.returncode,
+    )
+
+
+def summarize(values: Sequence[float]) -> Summary:
+    """Mean/median/stddev/min/max, counting values outside the 1.5×IQR fences as outliers."""
+    outliers = 0
+    if len(values) >= 4:
+        q1, _, q3 = statistics.quantiles(values, n=4)
+        low, high = q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1)
+        outliers = sum(1 for value in values if value < low or value > high)
+    return Summary(
+        count=len(values),
+        mean=statistics.fmean(values),
+        median=statistics.median(values),
+        stddev=statistics.stdev(values) if len(values) > 1 else 0.0,
+        min=min(values),
+        max=max(values),
+        outliers=outliers,
+    )
+
+
+class CommandRunner:
+    """Runs a command `warmup + runs` times, up to `jobs` at once, collecting results.
+
+    Each run is its own child process; the worker threads only sit in `wait4`,
+    so they don't contend for the GIL.
+    """
+
+    def __init__(
+        self,
+        argv: Sequence[str],
+        runs: int,
+        *,
+        warmup: int = 0,
+        jobs: int = 1,
+        show_output: bool = False,
+    ) -> None:
+        if runs < 1:
+            raise ValueError("runs must be at least 1")
+        if warmup < 0 or jobs < 1:
+            raise ValueError("warmup must be >= 0 and jobs >= 1")
+        self.argv = list(argv)
+        self.runs = runs
+        self.warmup = warmup
+        self.jobs = jobs
+        self.show_output = show_output
+        self.results: list[RunResult] = []
+        self.warmed_up = 0
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    def run_warmup(self) -> None:
+        """Run the warmup runs one at a time, so they don't overlap measured ones."""
+        for _ in range(self.warmup):
+            run_once(self.argv, show_output=self.show_output)
+            self.warmed_up += 1
+
+    def submit(self) -> list[Future]:
+        """Start the measured runs; each future appends to `results` as it finishes."""
+        self._pool = ThreadPoolExecutor(max_workers=self.jobs, thread_name_prefix="tm-run")
+        futures = [
+            self._pool.submit(run_once, self.argv, show_output=self.show_output)
+            for _ in range(self.runs)
+        ]
+        for future in futures:
+            future.add_done_callback(self._collect)
+        return futures
+
+    def _collect(self, future: Future) -> None:
+        if future.cancelled():
+            return
+        exc = future.exception()
+        self.results.append(RunResult.failed(exc) if exc is not None else future.result())
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    @property
+    def failures(self) -> int:
+        return sum(1 for result in self.results if result.returncode != 0)
+
+    @property
+    def errors(self) -> list[str]:
+        """Why each run that couldn't be carried out failed."""
+        return [result.error for result in self.results if result.error is not None]
+
+    def summary(self) -> dict[str, Summary]:
+        """Per-metric statistics over the finished measured runs."""
+        results = [result for result in self.results if result.error is None]
+        if not results:
+            return {}
+        return {
+            "wall": summarize([r.wall for r in results]),
+            "user": summarize([r.user for r in results]),
+            "sys": summarize([r.sys for r in results]),
+            "max_rss": summarize([r.max_rss for r in results]),
+        }
@@ -0,0 +1,155 @@
+"""Publish timer state to a memory-mapped file that other processes can read.
+
+The file has a fixed little-endian layout:
+
+    offset  0  4s  magic b"TMSH"
+    offset  4  H   layout version
+    offset  6  B   kind (0 = stopwatch, 1 = countdown)
+    offset  8  Q   sequence counter (odd while a write is in progress)
+    offset 16  B   running
+    offset 17  B   closed (the publishing process has exited)
+    offset 24  d   stopwatch: monotonic() start of the current run
+    offset 32  d   stopwatch: accumulated seconds before the current run
+    offset 40  d   countdown: monotonic() deadline while running
+    offset 48  d   countdown: seconds left while paused
+
+Writers bump the sequence counter around every update (a seqlock), so readers
+never block the writer: they retry if the counter was odd or changed while they
+copied the payload. A writer killed mid-update leaves the counter odd for good,
+so readers give up after `READ_TIMEOUT` and return what they saw marked `stale`.
+Times are `time.monotonic()` values, which are comparable across processes on
+the same machine.
+"""
+
+import mmap
+import os
+import struct
+from time import monotonic
+from typing import NamedTuple, Optional, Union
+
+from core.termclock import Countdown, Stopwatch
+
+_MAGIC = b"TMSH"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHBx")
+_SEQ = struct.Struct("<Q")
+_PAYLOAD = struct.Struct("<BB6xdddd")
+_SEQ_OFFSET = _HEADER.size
+_PAYLOAD_OFFSET = _SEQ_OFFSET + _SEQ.size
+SIZE = _PAYLOAD_OFFSET + _PAYLOAD.size
+# How long `read()` retries a torn or in-progress update before giving up.
+READ_TIMEOUT = 0.05
+
+_KINDS = ("stopwatch", "countdown")
+
+
+class SharedSnapshot(NamedTuple):
+    kind: str
+    running: bool
+    closed: bool
+    elapsed: Optional[float]  # stopwatches only
+    time_left: Optional[float]  # countdowns only
+    # The writer never finished its last update (it likely died mid-write).
+    stale: bool = False
+
+
+class SharedStateWriter:
+    """Publishes a `Stopwatch` or `Countdown` into a shared state file.
+
+    Publishing is only needed when the timer's state changes (start, stop, reset,
+    pause); readers compute the live value from the published start/deadline.
+    """
+
+    def __init__(self, path: str, timer: Union[Stopwatch, Countdown]) -> None:
+        self.timer = timer
+        self._kind = 1 if isinstance(timer, Countdown) else 0
+        self._seq = 0
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            os.ftruncate(fd, SIZE)
+            self._map = mmap.mmap(fd, SIZE)
+        finally:
+            os.close(fd)
+        _HEADER.pack_into(self._map, 0, _MAGIC, _VERSION, self._kind)
+        self.publish()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def publish(self, *, closed: bool = False) -> None:
+        """Write the timer's current state; `closed` freezes it for good."""
+        timer = self.timer
+        running = timer.is_running and not closed
+        if self._kind:
+            deadline = timer.next_deadline if running else 0.0
+            payload = (running, closed, 0.0, 0.0, deadline, timer.time_left)
+        elif running:
+            payload = (True, False, timer._start_time, timer._accumulated_time, 0.0, 0.0)
+        else:
+            payload = (False, closed, 0.0, timer.elapsed, 0.0, 0.0)
+
+        self._seq += 1
+        _SEQ.pack_into(self._map, _SEQ_OFFSET, self._seq)
+        _PAYLOAD.pack_into(self._map, _PAYLOAD_OFFSET, *payload)
+        self._seq += 1
+        _SEQ.pack_into(self._map, _SEQ_OFFSET, self._seq)
+
+    def close(self) -> None:
+        if not self._map.closed:
+            self.publish(closed=True)
+            self._map.close()
+
+
+class SharedStateReader:
+    """Reads a shared state file; each `read()` is a few memory copies, no syscalls.
+
+    If the writer died mid-update, `read()` returns after `READ_TIMEOUT` with
+    the last (possibly torn) values and `stale` set.
+    """
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), SIZE, access=mmap.ACCESS_READ)
+        magic, version, kind = _HEADER.unpack_from(self._map, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a time-manager state file.")
+        self.kind = _KINDS[kind]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def read(self) -> SharedSnapshot:
+        seq_from, payload_from = _SEQ.unpack_from, _PAYLOAD.unpack_from
+        shared = self._map
+        give_up = None
+        stale = False
+        while True:
+            (before,) = seq_from(shared, _SEQ_OFFSET)
+            if not before & 1:
+                payload = payload_from(shared, _PAYLOAD_OFFSET)
+                if seq_from(shared, _SEQ_OFFSET)[0] == before:
+                    break
+            # Only look at the clock once a retry is needed, keeping reads syscall-free.
+            if give_up is None:
+                give_up = monotonic() + READ_TIMEOUT
+            elif monotonic() >= give_up:
+                payload = payload_from(shared, _PAYLOAD_OFFSET)
+                stale = True
+                break
+
+        running, closed, start, accumulated, deadline, left = payload
+        if self.kind == "countdown":
+            time_left = max(0.0, deadline - monotonic()) if running else left
+            return SharedSnapshot(self.kind, bool(running), bool(closed), None, time_left, stale)
+        elapsed = accumulated + (monotonic() - start) if running else accumulated
+        return SharedSnapshot(self.kind, bool(running), bool(closed), elapsed, None, stale)
+
+    def close(self) -> None:
+        self._map.close()
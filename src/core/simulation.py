@@ -0,0 +1,68 @@
+import heapq
+from itertools import count
+from typing import Callable, Optional
+
+from core.clock import VirtualClock
+from core.registry import TimerRegistry
+
+
+class Simulation:
+    """Replays timer behaviour on a `VirtualClock`, jumping from event to event.
+
+    Scheduled actions (start, pause, resume, ...) and countdown expiries are the
+    only events; the clock jumps straight to whichever comes next, so hours of
+    timer activity run in as long as the events themselves take. Expiries are
+    collected in `finished` as `(time, name)` pairs.
+    """
+
+    def __init__(self, registry: Optional[TimerRegistry] = None) -> None:
+        if registry is None:
+            registry = TimerRegistry(VirtualClock())
+        if not isinstance(registry.clock, VirtualClock):
+            raise ValueError("a simulation needs a registry on a VirtualClock")
+        self.registry = registry
+        self.clock: VirtualClock = registry.clock
+        self.finished: list[tuple[float, str]] = []
+        self.on_finish: Optional[Callable[[float, str], None]] = None
+        self._events: list[tuple[float, int, Callable[[], None]]] = []
+        self._counter = count()
+
+    @property
+    def now(self) -> float:
+        return self.clock.now()
+
+    def at(self, when: float, action: Callable[[], None]) -> None:
+        """Run `action` when the clock reaches `when` seconds."""
+        heapq.heappush(self._events, (when, next(self._counter), action))
+
+    def after(self, delay: float, action: Callable[[], None]) -> None:
+        self.at(self.now + delay, action)
+
+    def run(self, until: Optional[float] = None) -> int:
+        """Advance through events up to `until` (or until none are left); return the step count.
+
+        Expiries due at the same moment as an action are reported before it runs.
+        """
+        steps = 0
+        events = self._events
+        while True:
+            deadline = self.registry.next_deadline()
+            when = events[0][0] if events else None
+            if deadline is not None and (when is None or deadline <= when):
+                when = deadline
+            if when is None or (until is not None and when > until):
+                break
+
+            self.clock.advance_to(when)
+            steps += 1
+            for name in self.registry.poll():
+                self.finished.append((self.now, name))
+                if self.on_finish is not None:
+                    self.on_finish(self.now, name)
+            while events and events[0][0] <= self.now:
+                _, _, action = heapq.heappop(events)
+                action()
+
+        if until is not None:
+            self.clock.advance_to(until)
+        return steps
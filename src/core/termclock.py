@@ -1,7 +1,9 @@
-from time import monotonic
 from dataclasses import dataclass, field
 from typing import Optional
 
+from core.clock import MONOTONIC, Clock
+from core.laps import LapRecorder
+
 
 @dataclass
 class Stopwatch:
@@ -10,6 +12,11 @@ class Stopwatch:
     _start_time: Optional[float] = None
     _accumulated_time: float = 0.0
     _running: bool = False
+    # Created on the first `lap()` unless a recorder (e.g. one streaming to a file)
+    # is passed in, so stopwatches that never record laps don't pay for one.
+    laps: Optional[LapRecorder] = field(default=None, repr=False)
+    _last_split: float = 0.0
+    clock: Clock = field(default=MONOTONIC, repr=False, compare=False)
 
     @property
     def is_running(self) -> bool:
@@ -19,24 +26,43 @@ class Stopwatch:
     def elapsed(self) -> float:
         """Return the total elapsed time in seconds."""
         if self._running:
-            return self._accumulated_time + (monotonic() - self._start_time)
+            return self._accumulated_time + (self.clock.now() - self._start_time)
         return self._accumulated_time
 
+    def until_next_second(self) -> Optional[float]:
+        """Seconds until `elapsed` reaches the next whole second, or None if stopped."""
+        if not self._running:
+            return None
+        return 1.0 - (self.elapsed % 1.0)
+
     def start(self):
         if not self._running:
-            self._start_time = monotonic()
+            self._start_time = self.clock.now()
             self._running = True
 
     def stop(self):
         if self._running:
-            self._accumulated_time += monotonic() - self._start_time
+            self._accumulated_time += self.clock.now() - self._start_time
             self._start_time = None
             self._running = False
 
+    def lap(self) -> float:
+        """Record a lap (the time since the previous lap) and return its duration."""
+        if self.laps is None:
+            self.laps = LapRecorder()
+        split = self.elapsed
+        duration = split - self._last_split
+        self._last_split = split
+        self.laps.record(duration)
+        return duration
+
     def reset(self):
         self._running = False
         self._accumulated_time = 0.0
         self._start_time = None
+        self._last_split = 0.0
+        if self.laps is not None:
+            self.laps.clear()
 
     def toggle(self):
         if self._running:
@@ -47,20 +73,29 @@ class Stopwatch:
 
 @dataclass
 class Countdown:
-    """Core logic for a countdown timer."""
+    """Core logic for a countdown timer.
+
+    While running, the countdown stores an absolute `clock.now()` deadline, so
+    `time_left` and `is_finished` are exact at any moment without ticking. Pausing
+    stores the time left instead, and resuming sets a new deadline from it. Once
+    finished, pause and resume do nothing until `reset()`.
+    """
 
     initial_seconds: int
-    _time_left: float = field(init=False)
-    _last_tick: Optional[float] = field(init=False, default=None)
+    _deadline: Optional[float] = field(init=False, default=None)
+    _paused_left: float = field(init=False)
     _running: bool = field(init=False, default=True)
+    clock: Clock = field(default=MONOTONIC, repr=False, compare=False)
 
     def __post_init__(self):
-        self._time_left = float(self.initial_seconds)
-        self._last_tick = monotonic()
+        self._paused_left = float(self.initial_seconds)
+        self._deadline = self.clock.now() + self._paused_left
 
     @property
     def time_left(self) -> float:
-        return max(0.0, self._time_left)
+        if self._running:
+            return max(0.0, self._deadline - self.clock.now())
+        return max(0.0, self._paused_left)
 
     @property
     def is_running(self) -> bool:
@@ -68,27 +103,184 @@ class Countdown:
 
     @property
     def is_finished(self) -> bool:
-        return self._time_left <= 0
+        return self.time_left <= 0
+
+    @property
+    def next_deadline(self) -> Optional[float]:
+        """The `clock.now()` time the countdown expires at, or None while paused."""
+        return self._deadline if self._running else None
+
+    def until_next_second(self) -> Optional[float]:
+        """Seconds until `time_left` drops below its current whole second.
+
+        Returns None while paused or finished, since nothing will change.
+        """
+        time_left = self.time_left
+        if not self._running or time_left <= 0:
+            return None
+        return time_left % 1.0
 
     def tick(self):
-        """Update the timer based on elapsed real time."""
-        if self._running and self._time_left > 0:
-            now = monotonic()
-            if self._last_tick:
-                delta = now - self._last_tick
-                self._time_left -= delta
-            self._last_tick = now
-        else:
-            self._last_tick = monotonic()
+        """No-op, kept for compatibility: the deadline keeps `time_left` current."""
 
     def pause(self):
-        self._running = False
-        self._last_tick = None
+        # A finished countdown stays finished: pausing would drop its deadline.
+        if self._running and not self.is_finished:
+            self._paused_left = self.time_left
+            self._deadline = None
+            self._running = False
 
     def resume(self):
+        if not self._running and not self.is_finished:
+            self._deadline = self.clock.now() + self._paused_left
+            self._running = True
+
+    def reset(self):
+        """Restore the full duration, keeping the running/paused state."""
+        self._paused_left = float(self.initial_seconds)
+        if self._running:
+            self._deadline = self.clock.now() + self._paused_left
+
+    def toggle(self):
+        if self._running:
+            self.pause()
+        else:
+            self.resume()
+
+
+class CompactStopwatch:
+    """A `Stopwatch` with `__slots__` and integer-nanosecond bookkeeping.
+
+    Same public API as `Stopwatch`, but smaller per instance, and the accumulated
+    time is exact however many start/stop cycles a long run goes through.
+    """
+
+    __slots__ = ("_start_ns", "_accumulated_ns", "_running", "clock")
+
+    def __init__(self, clock: Clock = MONOTONIC) -> None:
+        self.clock = clock
+        self._start_ns = 0
+        self._accumulated_ns = 0
+        self._running = False
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    @property
+    def elapsed_ns(self) -> int:
+        """Return the total elapsed time in nanoseconds."""
+        if self._running:
+            return self._accumulated_ns + (self.clock.now_ns() - self._start_ns)
+        return self._accumulated_ns
+
+    @property
+    def elapsed(self) -> float:
+        """Return the total elapsed time in seconds."""
+        return self.elapsed_ns / 1e9
+
+    def until_next_second(self) -> Optional[float]:
+        """Seconds until `elapsed` reaches the next whole second, or None if stopped."""
         if not self._running:
+            return None
+        return (1_000_000_000 - self.elapsed_ns % 1_000_000_000) / 1e9
+
+    def start(self):
+        if not self._running:
+            self._start_ns = self.clock.now_ns()
+            self._running = True
+
+    def stop(self):
+        if self._running:
+            self._accumulated_ns += self.clock.now_ns() - self._start_ns
+            self._start_ns = 0
+            self._running = False
+
+    def reset(self):
+        self._running = False
+        self._accumulated_ns = 0
+        self._start_ns = 0
+
+    def toggle(self):
+        if self._running:
+            self.stop()
+        else:
+            self.start()
+
+
+class CompactCountdown:
+    """A `Countdown` with `__slots__` and integer-nanosecond bookkeeping.
+
+    Same public API as `Countdown`, including the `clock.now_ns()` deadline while
+    running, so no float error builds up over long countdowns.
+    """
+
+    __slots__ = ("initial_seconds", "_deadline_ns", "_paused_left_ns", "_running", "clock")
+
+    def __init__(self, initial_seconds: int, clock: Clock = MONOTONIC) -> None:
+        self.clock = clock
+        self.initial_seconds = initial_seconds
+        self._paused_left_ns = initial_seconds * 1_000_000_000
+        self._deadline_ns = clock.now_ns() + self._paused_left_ns
+        self._running = True
+
+    @property
+    def time_left_ns(self) -> int:
+        if self._running:
+            return max(0, self._deadline_ns - self.clock.now_ns())
+        return max(0, self._paused_left_ns)
+
+    @property
+    def time_left(self) -> float:
+        return self.time_left_ns / 1e9
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    @property
+    def is_finished(self) -> bool:
+        return self.time_left_ns <= 0
+
+    @property
+    def next_deadline_ns(self) -> Optional[int]:
+        """The `clock.now_ns()` time the countdown expires at, or None while paused."""
+        return self._deadline_ns if self._running else None
+
+    @property
+    def next_deadline(self) -> Optional[float]:
+        """The `clock.now()` time the countdown expires at, or None while paused."""
+        return self._deadline_ns / 1e9 if self._running else None
+
+    def until_next_second(self) -> Optional[float]:
+        """Seconds until `time_left` drops below its current whole second.
+
+        Returns None while paused or finished, since nothing will change.
+        """
+        left_ns = self.time_left_ns
+        if not self._running or left_ns <= 0:
+            return None
+        return (left_ns % 1_000_000_000) / 1e9
+
+    def tick(self):
+        """No-op, kept for compatibility: the deadline keeps `time_left` current."""
+
+    def pause(self):
+        # A finished countdown stays finished: pausing would drop its deadline.
+        if self._running and not self.is_finished:
+            self._paused_left_ns = self.time_left_ns
+            self._running = False
+
+    def resume(self):
+        if not self._running and not self.is_finished:
+            self._deadline_ns = self.clock.now_ns() + self._paused_left_ns
             self._running = True
-            self._last_tick = monotonic()
+
+    def reset(self):
+        """Restore the full duration, keeping the running/paused state."""
+        self._paused_left_ns = self.initial_seconds * 1_000_000_000
+        if self._running:
+            self._deadline_ns = self.clock.now_ns() + self._paused_left_ns
 
     def toggle(self):
         if self._running:
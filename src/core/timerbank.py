@@ -0,0 +1,78 @@
+from time import monotonic
+from typing import Optional, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError as exc:
+    raise ImportError(
+        "TimerBank requires numpy. Install it with: pip install 'time-manager[bank]'"
+    ) from exc
+
+# An index, a sequence/array of indices, a boolean mask or a slice. None means all.
+Selection = Union[None, int, slice, Sequence[int], "np.ndarray"]
+
+
+class TimerBank:
+    """A fixed-size bank of timers stored as parallel NumPy arrays.
+
+    Every timer behaves like a `Stopwatch`; giving it a finite duration also makes
+    it a countdown (`remaining = duration - elapsed`). `elapsed()` and `remaining()`
+    read the clock once and compute every timer in a single vectorised expression.
+    """
+
+    def __init__(self, size: int, durations: Union[None, float, Sequence[float]] = None):
+        self.start_times = np.zeros(size)
+        self.accumulated = np.zeros(size)
+        self.running = np.zeros(size, dtype=bool)
+        self.durations = np.full(size, np.inf)
+        if durations is not None:
+            self.durations[:] = durations
+
+    def __len__(self) -> int:
+        return len(self.running)
+
+    def elapsed(self, now: Optional[float] = None) -> "np.ndarray":
+        """Return the elapsed time of every timer in seconds."""
+        if now is None:
+            now = monotonic()
+        return self.accumulated + np.where(self.running, now - self.start_times, 0.0)
+
+    def remaining(self, now: Optional[float] = None) -> "np.ndarray":
+        """Return the time left of every timer (inf for plain stopwatches)."""
+        return np.maximum(self.durations - self.elapsed(now), 0.0)
+
+    def finished(self, now: Optional[float] = None) -> "np.ndarray":
+        """Return a boolean mask of countdowns that have run out."""
+        return self.remaining(now) <= 0.0
+
+    def start(self, which: Selection = None, now: Optional[float] = None) -> None:
+        mask = self._mask(which) & ~self.running
+        self.start_times[mask] = monotonic() if now is None else now
+        self.running[mask] = True
+
+    def stop(self, which: Selection = None, now: Optional[float] = None) -> None:
+        mask = self._mask(which) & self.running
+        if now is None:
+            now = monotonic()
+        self.accumulated[mask] += now - self.start_times[mask]
+        self.running[mask] = False
+
+    def toggle(self, which: Selection = None, now: Optional[float] = None) -> None:
+        if now is None:
+            now = monotonic()
+        mask = self._mask(which)
+        was_running = mask & self.running
+        self.start(mask & ~self.running, now)
+        self.stop(was_running, now)
+
+    def reset(self, which: Selection = None) -> None:
+        mask = self._mask(which)
+        self.accumulated[mask] = 0.0
+        self.running[mask] = False
+
+    def _mask(self, which: Selection) -> "np.ndarray":
+        if isinstance(which, np.ndarray) and which.dtype == bool:
+            return which
+        mask = np.zeros(len(self.running), dtype=bool)
+        mask[slice(None) if which is None else which] = True
+        return mask
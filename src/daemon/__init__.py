@@ -0,0 +1,6 @@
+# time-manager timer daemon
+
+from .client import DaemonError, request, subscribe
+from .protocol import default_socket_path
+
+__all__ = ["DaemonError", "request", "subscribe", "default_socket_path"]
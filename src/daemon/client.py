@@ -0,0 +1,50 @@
+import socket
+from typing import Any, Iterator, Optional
+
+from .protocol import decode, default_socket_path, encode
+
+
+class DaemonError(Exception):
+    """Raised when the daemon is unreachable or rejects a request."""
+
+
+def _connect(path: Optional[str]) -> socket.socket:
+    path = path or default_socket_path()
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except OSError as exc:
+        sock.close()
+        raise DaemonError(f"Can't reach the timer daemon at {path} ({exc.strerror}).")
+    return sock
+
+
+def _read_response(stream) -> dict[str, Any]:
+    line = stream.readline()
+    if not line:
+        raise DaemonError("The timer daemon closed the connection.")
+    response = decode(line)
+    if not response.get("ok"):
+        raise DaemonError(response.get("error", "Request failed."))
+    return response
+
+
+def request(message: dict[str, Any], path: Optional[str] = None) -> dict[str, Any]:
+    """Send one request to the daemon and return its response."""
+    with _connect(path) as sock, sock.makefile("rb") as stream:
+        sock.sendall(encode(message))
+        return _read_response(stream)
+
+
+def subscribe(
+    names: Optional[list[str]] = None, path: Optional[str] = None
+) -> Iterator[dict[str, Any]]:
+    """Subscribe to timer updates and yield each pushed event until disconnected."""
+    message: dict[str, Any] = {"op": "subscribe"}
+    if names:
+        message["names"] = names
+    with _connect(path) as sock, sock.makefile("rb") as stream:
+        sock.sendall(encode(message))
+        _read_response(stream)
+        for line in stream:
+            yield decode(line)
@@ -0,0 +1,42 @@
+"""Wire format shared by the timer daemon and its clients.
+
+Messages are compact JSON objects, one per line, in both directions.
+
+Requests carry an `op` and its arguments:
+- `{"op": "create", "name": "tea", "seconds": 300}` (omit `seconds` for a stopwatch)
+- `{"op": "query" | "pause" | "resume" | "toggle" | "reset" | "remove", "name": ...}`
+- `{"op": "list"}`
+- `{"op": "subscribe", "names": [...]}` (omit `names` to follow every timer)
+
+Each request gets one response: `{"ok": true, ...}` or `{"ok": false, "error": ...}`.
+After a successful `subscribe` the server keeps pushing events on that connection:
+- `{"event": "tick", "timers": [<timer>, ...]}` once per second
+- `{"event": "finished", "name": ...}` when a countdown expires
+
+A timer is `{"name", "kind": "sw" | "cd", "running", "elapsed" | "time_left", "finished"}`.
+"""
+
+import json
+import os
+import tempfile
+from typing import Any
+
+OPS = ("create", "query", "pause", "resume", "toggle", "reset", "remove", "list", "subscribe")
+
+
+def default_socket_path() -> str:
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "time-manager.sock")
+    return os.path.join(tempfile.gettempdir(), f"time-manager-{os.getuid()}.sock")
+
+
+def encode(message: dict[str, Any]) -> bytes:
+    return json.dumps(message, separators=(",", ":")).encode() + b"\n"
+
+
+def decode(line: bytes) -> dict[str, Any]:
+    message = json.loads(line)
+    if not isinstance(message, dict):
+        raise ValueError("Message must be a JSON object.")
+    return message
@@ -0,0 +1,213 @@
+import asyncio
+import math
+import os
+import signal
+import socket
+from time import monotonic
+from typing import Any, Optional
+
+from core.registry import Timer, TimerRegistry
+from core.termclock import Countdown
+
+from .protocol import decode, default_socket_path, encode
+
+# Drop subscribers that stop reading once this much output is queued for them.
+_MAX_BUFFERED = 1 << 20
+
+
+def timer_state(name: str, timer: Timer) -> dict[str, Any]:
+    if isinstance(timer, Countdown):
+        time_left = timer.time_left
+        return {
+            "name": name,
+            "kind": "cd",
+            "running": timer.is_running,
+            "time_left": round(time_left, 3),
+            "finished": time_left <= 0,
+        }
+    return {
+        "name": name,
+        "kind": "sw",
+        "running": timer.is_running,
+        "elapsed": round(timer.elapsed, 3),
+        "finished": False,
+    }
+
+
+def _remove_stale_socket(path: str) -> None:
+    """Remove a socket file left by a dead daemon; refuse to replace a live one."""
+    if not os.path.exists(path):
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except OSError:
+        try:
+            os.unlink(path)
+        except OSError as exc:
+            # e.g. another user's socket on the shared /tmp fallback path.
+            raise RuntimeError(f"Could not remove the stale socket {path}: {exc.strerror}.")
+    else:
+        raise RuntimeError(f"A timer daemon is already listening on {path}.")
+    finally:
+        probe.close()
+
+
+class TimerDaemon:
+    """Hosts named timers in one asyncio process behind a Unix domain socket.
+
+    Every connection is a coroutine on the same event loop. Subscribers are fed
+    by a single broadcast step per second that encodes each distinct payload once
+    and queues it on every matching connection without waiting on slow readers.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path or default_socket_path()
+        self.registry = TimerRegistry()
+        # writer -> subscribed timer names (None means every timer)
+        self._subscribers: dict[asyncio.StreamWriter, Optional[frozenset[str]]] = {}
+        self._wake: Optional[asyncio.Event] = None
+
+    async def serve(self) -> None:
+        _remove_stale_socket(self.path)
+        self._wake = asyncio.Event()
+        # Shut down cleanly (and remove the socket file) on SIGTERM as well as Ctrl+C.
+        asyncio.get_running_loop().add_signal_handler(
+            signal.SIGTERM, asyncio.current_task().cancel
+        )
+        # A deep accept backlog so bursts of subscribers aren't refused.
+        server = await asyncio.start_unix_server(
+            self._handle, path=self.path, backlog=socket.SOMAXCONN
+        )
+        os.chmod(self.path, 0o600)
+        try:
+            async with server:
+                await asyncio.gather(server.serve_forever(), self._broadcast_loop())
+        except asyncio.CancelledError:
+            pass
+        finally:
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+
+    def dispatch(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Apply one request to the registry and return the response."""
+        op = request.get("op")
+        if op == "list":
+            return {"ok": True, "timers": [timer_state(*item) for item in self.registry.items()]}
+        if op == "subscribe":
+            names = request.get("names")
+            if names is not None and (
+                not isinstance(names, list) or not all(isinstance(n, str) for n in names)
+            ):
+                raise ValueError("'names' must be a list of timer names.")
+            return {"ok": True}
+
+        name = request.get("name")
+        if not isinstance(name, str) or not name:
+            raise ValueError("A timer name is required.")
+
+        if op == "create":
+            seconds = request.get("seconds")
+            if seconds is None:
+                timer = self.registry.add_stopwatch(name, start=True)
+            elif isinstance(seconds, int) and seconds > 0:
+                timer = self.registry.add_countdown(name, seconds)
+            else:
+                raise ValueError("Time must be a whole number of seconds greater than 0.")
+            self._wake.set()
+            return {"ok": True, "timer": timer_state(name, timer)}
+
+        if name not in self.registry:
+            raise ValueError(f"No timer named '{name}'.")
+        if op == "remove":
+            return {"ok": True, "timer": timer_state(name, self.registry.remove(name))}
+        if op in ("pause", "resume", "toggle", "reset"):
+            getattr(self.registry, op)(name)
+            self._wake.set()
+        elif op != "query":
+            raise ValueError(f"Unknown op '{op}'.")
+        return {"ok": True, "timer": timer_state(name, self.registry[name])}
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    # Longer than the stream limit; the rest of it can't be parsed.
+                    writer.write(encode({"ok": False, "error": "Request line is too long."}))
+                    await writer.drain()
+                    break
+                if not line:
+                    break
+                try:
+                    request = decode(line)
+                    response = self.dispatch(request)
+                except (ValueError, TypeError) as exc:
+                    response = {"ok": False, "error": str(exc)}
+                else:
+                    if request.get("op") == "subscribe":
+                        names = request.get("names")
+                        self._subscribers[writer] = frozenset(names) if names else None
+                writer.write(encode(response))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._subscribers.pop(writer, None)
+            writer.close()
+
+    async def _broadcast_loop(self) -> None:
+        next_tick = math.floor(monotonic()) + 1.0
+        while True:
+            # Wake on the next whole second, the next expiry, or a timer change.
+            wake_at = next_tick
+            deadline = self.registry.next_deadline()
+            if deadline is not None:
+                wake_at = min(wake_at, deadline)
+
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), max(0.0, wake_at - monotonic()))
+            except asyncio.TimeoutError:
+                pass
+
+            for name in self.registry.poll():
+                self._publish(encode({"event": "finished", "name": name}), name)
+
+            now = monotonic()
+            if now >= next_tick:
+                self._broadcast_ticks()
+                next_tick = math.floor(now) + 1.0
+
+    def _broadcast_ticks(self) -> None:
+        if not self._subscribers:
+            return
+        states: dict[str, dict[str, Any]] = {}
+
+        def state(name: str) -> dict[str, Any]:
+            if name not in states:
+                states[name] = timer_state(name, self.registry[name])
+            return states[name]
+
+        payloads: dict[Optional[frozenset[str]], bytes] = {}
+        for writer, names in list(self._subscribers.items()):
+            payload = payloads.get(names)
+            if payload is None:
+                selected = self.registry if names is None else names
+                timers = [state(name) for name in selected if name in self.registry]
+                payload = payloads[names] = encode({"event": "tick", "timers": timers})
+            self._send(writer, payload)
+
+    def _publish(self, payload: bytes, name: str) -> None:
+        for writer, names in list(self._subscribers.items()):
+            if names is None or name in names:
+                self._send(writer, payload)
+
+    def _send(self, writer: asyncio.StreamWriter, payload: bytes) -> None:
+        transport = writer.transport
+        if transport.is_closing() or transport.get_write_buffer_size() > _MAX_BUFFERED:
+            self._subscribers.pop(writer, None)
+            writer.close()
+            return
+        writer.write(payload)
@@ -0,0 +1,156 @@
+from typing import Optional
+from rich.segment import Segment
+from rich.style import Style
+from textual.geometry import Region, Size
+from textual.renderables.digits import DIGITS, DIGITS3X3, DIGITS3X3_BOLD
+from textual.strip import Strip
+from textual.widget import Widget
+
+Glyph = tuple[Segment, Segment, Segment]
+
+
+def _width(character: str) -> int:
+    return 3 if character in DIGITS else 1
+
+
+def _text_width(text: str) -> int:
+    return sum(_width(character) for character in text)
+
+
+class BigDigits(Widget):
+    """A drop-in replacement for `Digits` that redraws only the characters that changed.
+
+    Each glyph (the same 3x3 font as `Digits`) is turned into three segments once
+    per style and cached. The widget keeps each row as a list of those cached
+    segments, so `update()` swaps the entries of the changed characters and
+    refreshes only their cells; when a clock ticks, that is usually the last
+    digit. A change of width (e.g. gaining an hours field) re-lays out as usual.
+    """
+
+    DEFAULT_CSS = """
+    BigDigits {
+        width: auto;
+        height: 3;
+    }
+    """
+
+    def __init__(
+        self,
+        value: str = "",
+        *,
+        name: Optional[str] = None,
+        id: Optional[str] = None,
+        classes: Optional[str] = None,
+    ) -> None:
+        super().__init__(name=name, id=id, classes=classes)
+        self._value = value
+        self._glyphs: dict[tuple[str, Style], Glyph] = {}
+        # Cached segments per row for the current value and style, and the
+        # strips built from them (per widget width). The style and padding are
+        # cached too: `rich_style` is recomputed after every `refresh()`.
+        self._rows: Optional[list[list[Segment]]] = None
+        self._style: Optional[Style] = None
+        self._padding: Optional[int] = None
+        self._strips: dict[int, Strip] = {}
+        self._strips_width = -1
+        self.cells_refreshed = 0
+
+    @property
+    def value(self) -> str:
+        return self._value
+
+    def _glyph(self, character: str, style: Style) -> Glyph:
+        glyph = self._glyphs.get((character, style))
+        if glyph is None:
+            font = DIGITS3X3_BOLD if style.bold else DIGITS3X3
+            if character in DIGITS:
+                position = DIGITS.index(character) * 3
+                rows = [font[position + row].ljust(3) for row in range(3)]
+            else:
+                # Like `Digits`, anything outside the font sits on the bottom row.
+                rows = [" ", " ", character]
+            glyph = (Segment(rows[0], style), Segment(rows[1], style), Segment(rows[2], style))
+            self._glyphs[character, style] = glyph
+        return glyph
+
+    def update(self, value: str) -> None:
+        old = self._value
+        if value == old:
+            return
+        self._value = value
+        if len(value) != len(old) or any(_width(a) != _width(b) for a, b in zip(old, value)):
+            self._rows = None
+            self._padding = None
+            self.refresh(layout=True)
+            return
+
+        offset = self._offset()
+        column = 0
+        regions = []
+        for index, (before, after) in enumerate(zip(old, value)):
+            width = _width(after)
+            if before != after:
+                if self._rows is not None:
+                    glyph = self._glyph(after, self._style)
+                    for row in range(3):
+                        self._rows[row][index] = glyph[row]
+                regions.append(Region(offset + column, 0, width, 3))
+                self.cells_refreshed += 1
+            column += width
+        self._strips.clear()
+        self.refresh(*regions)
+
+    def notify_style_update(self) -> None:
+        self._style = None
+        self._rows = None
+        self._padding = None
+        self._strips.clear()
+        super().notify_style_update()
+
+    def _offset(self) -> int:
+        """Columns of padding before the glyphs, from `text-align`."""
+        if self._padding is None:
+            spare = self.size.width - _text_width(self._value)
+            align = self.styles.text_align
+            if spare <= 0:
+                self._padding = 0
+            elif align == "center":
+                self._padding = spare // 2
+            elif align in ("right", "end"):
+                self._padding = spare
+            else:
+                self._padding = 0
+        return self._padding
+
+    def render_line(self, y: int) -> Strip:
+        width = self.size.width
+        if width != self._strips_width:
+            self._strips.clear()
+            self._strips_width = width
+            self._padding = None
+        style = self._style
+        if style is None:
+            style = self._style = self.rich_style
+            self._rows = None
+        if y >= 3:
+            return Strip.blank(width, style)
+        if self._rows is None:
+            glyphs = [self._glyph(character, style) for character in self._value]
+            self._rows = [[glyph[row] for glyph in glyphs] for row in range(3)]
+            self._strips.clear()
+        strip = self._strips.get(y)
+        if strip is None:
+            offset = self._offset()
+            segments = self._rows[y]
+            if offset:
+                segments = [Segment(" " * offset, style), *segments]
+            strip = Strip(segments, offset + _text_width(self._value))
+            strip = strip.extend_cell_length(width, style).crop(0, width)
+            self._strips[y] = strip
+        return strip
+
+    def get_content_width(self, container: Size, viewport: Size) -> int:
+        return _text_width(self._value)
+
+    def get_content_height(self, container: Size, viewport: Size, width: int) -> int:
+        return 3
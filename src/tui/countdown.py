@@ -1,9 +1,25 @@
 from textual.app import App, ComposeResult
 from textual.containers import Container
-from textual.widgets import Digits, Footer, Header, Static
+from textual.widgets import Footer, Header, Static
 from textual.reactive import reactive
+from textual.timer import Timer
+from typing import TYPE_CHECKING, Optional
+from core.clock import MONOTONIC, Clock
 from core.formatting import format_time
+from core.history import SessionLog, log_session
+from core.precision import wait_until
+from core.profiling import LoopProfiler
+from core.shared import SharedStateWriter
 from core.termclock import Countdown
+from .bigdigits import BigDigits
+from .refresh import BoundaryRefresher, CachedDisplay
+
+if TYPE_CHECKING:  # subprocess, threads and http.server only load when these are used
+    from core.exporter import MetricsExporter
+    from core.hooks import HookRunner
+
+# Textual's timers are less punctual than a bare select, so spin a little longer.
+_PRECISE_SPIN = 0.005
 
 
 class CountdownTui(App):
@@ -21,10 +37,34 @@ class CountdownTui(App):
 
     time_left = reactive(0.0)
 
-    def __init__(self, seconds: int) -> None:
+    def __init__(
+        self,
+        seconds: int,
+        share: Optional[str] = None,
+        profiler: Optional[LoopProfiler] = None,
+        precise: bool = False,
+        history: Optional[SessionLog] = None,
+        tag: Optional[str] = None,
+        clock: Clock = MONOTONIC,
+        hooks: Optional["HookRunner"] = None,
+        exporter: Optional["MetricsExporter"] = None,
+    ) -> None:
         super().__init__()
-        self.countdown = Countdown(seconds)
+        self.profiler = profiler
+        self.precise = precise
+        self.hooks = hooks
+        self.history = history
+        self.tag = tag
+        self.countdown = Countdown(seconds, clock=clock)
+        self.shared = SharedStateWriter(share, self.countdown) if share else None
+        self.exporter = exporter
+        if exporter is not None:
+            exporter.start(self.countdown, profiler)
         self._finished_announced = False
+        self._finish_timer: Optional[Timer] = None
+        # The deadline the precise final wait aims at, for `completion_latency`.
+        self._finish_deadline: Optional[float] = None
+        self.completion_latency: Optional[float] = None
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -32,35 +72,75 @@ class CountdownTui(App):
             with Container(id="card-row"):
                 with Container(id="display-container"):
                     with Container(id="time-row"):
-                        yield Digits("00:00", id="countdown")
+                        yield BigDigits("00:00", id="countdown")
                     with Container(id="status-row"):
                         yield Static("Running", id="status", classes="running")
         yield Footer()
 
     def on_mount(self) -> None:
-        self.time_left = self.countdown.time_left
-        self.update_display()
-        self._sync_status()
-        self.set_interval(0.1, self.tick)
+        self.time_display = CachedDisplay(self.query_one("#countdown", BigDigits))
+        self.refresher = BoundaryRefresher(self, self.tick, self.profiler)
+        self.refresher.start()
+
+    def on_unmount(self) -> None:
+        if self.shared is not None:
+            self.shared.close()
+        if self.history is not None:
+            log_session(self.countdown, self.tag, self.history)
 
-    def tick(self) -> None:
-        self.countdown.tick()
+    def tick(self) -> Optional[float]:
         self.time_left = self.countdown.time_left
+        if self.hooks is not None:
+            self.hooks.poll(self.countdown)
 
         if self.countdown.is_finished and not self._finished_announced:
             self._finished_announced = True
-            self.notify("Time's up!", severity="error", timeout=10)
+            if self.precise and self._finish_deadline is not None:
+                now = self.countdown.clock.now()
+                self.completion_latency = now - self._finish_deadline
+            if self.hooks is not None:
+                self.hooks.finish(self.countdown)
+            if self.exporter is not None:
+                self.exporter.publish()
+            message = "Time's up!"
+            if self.completion_latency is not None:
+                message += f" (+{self.completion_latency * 1000:.2f} ms)"
+            self.notify(message, severity="error", timeout=10)
             self.bell()
             self.query_one("#status", Static).update("Time's Up!")
             self.query_one("#status", Static).set_class(True, "danger")
 
         self.update_display()
         self._sync_status()
+        delay = self.countdown.until_next_second()
+        if self.precise:
+            self._schedule_finish(delay)
+        return delay
+
+    def _schedule_finish(self, delay: Optional[float]) -> None:
+        """If the countdown expires before the next redraw, wake just short of it and spin."""
+        if self._finish_timer is not None:
+            self._finish_timer.stop()
+            self._finish_timer = None
+        deadline = self.countdown.next_deadline
+        if delay is None or deadline is None:
+            return
+        self._finish_deadline = deadline
+        until_deadline = deadline - self.countdown.clock.now()
+        if until_deadline <= delay:
+            self._finish_timer = self.set_timer(
+                max(0.0, until_deadline - _PRECISE_SPIN), lambda: self._finish(deadline)
+            )
+
+    def _finish(self, deadline: float) -> None:
+        self._finish_timer = None
+        if self.countdown.next_deadline == deadline:
+            wait_until(deadline, spin=_PRECISE_SPIN, clock=self.countdown.clock)
+            self.refresher.poke()
 
     def update_display(self) -> None:
-        time_str = format_time(self.time_left, show_centiseconds=False)
-        digits = self.query_one("#countdown", Digits)
-        digits.update(time_str)
+        self.time_display.update(format_time(self.time_left, show_centiseconds=False))
+        digits = self.time_display.widget
 
         # Subtle urgency cue while still respecting the palette.
         is_finished = self.countdown.is_finished
@@ -72,7 +152,11 @@ class CountdownTui(App):
 
     def action_toggle_pause(self) -> None:
         self.countdown.toggle()
-        self._sync_status()
+        self.refresher.poke()
+        if self.shared is not None:
+            self.shared.publish()
+        if self.exporter is not None:
+            self.exporter.publish()
 
     def _sync_status(self) -> None:
         status_widget = self.query_one("#status", Static)
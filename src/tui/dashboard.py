@@ -0,0 +1,289 @@
+import random
+from typing import Optional
+from rich.segment import Segment
+from textual.app import App, ComposeResult
+from textual.binding import Binding
+from textual.geometry import Region, Size
+from textual.message import Message
+from textual.reactive import reactive
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+from textual.widgets import Footer, Header, Static
+from core.clock import MONOTONIC, Clock
+from core.formatting import format_time
+from core.profiling import LoopProfiler
+from core.registry import Timer, TimerRegistry
+from core.termclock import Countdown
+from .refresh import BoundaryRefresher
+
+_NAME_WIDTH = 28
+# Cap refresh wakeups: with many timers the visible rows change second at
+# slightly different moments, and a few ms of lag is invisible.
+_MIN_DELAY = 0.1
+
+
+def _row(name: str, timer: Timer) -> tuple[str, str]:
+    """The display text of one timer and its state: running, paused or finished."""
+    if isinstance(timer, Countdown):
+        kind, seconds = "countdown", timer.time_left
+        state = "finished" if timer.is_finished else "running" if timer.is_running else "paused"
+    else:
+        kind, seconds = "stopwatch", timer.elapsed
+        state = "running" if timer.is_running else "paused"
+    time_str = format_time(seconds, show_centiseconds=False, fixed_hours=True)
+    return f" {name:<{_NAME_WIDTH}.{_NAME_WIDTH}} {kind:<10} {state:<9} {time_str:>10}", state
+
+
+class TimerTable(ScrollView, can_focus=True):
+    """A virtual table of the timers in a `TimerRegistry`.
+
+    Only the visible rows are ever formatted. `tick()` re-formats them, refreshes
+    just the lines whose text changed, and returns the delay until the next
+    visible row changes, so idle cost depends on the screen height rather than
+    the number of timers.
+    """
+
+    COMPONENT_CLASSES = {
+        "timer-table--cursor",
+        "timer-table--paused",
+        "timer-table--finished",
+    }
+
+    BINDINGS = [
+        Binding("up", "cursor(-1)", "Up", show=False),
+        Binding("down", "cursor(1)", "Down", show=False),
+        Binding("pageup", "page(-1)", "Page up", show=False),
+        Binding("pagedown", "page(1)", "Page down", show=False),
+        Binding("home", "cursor(-1_000_000_000)", "Top", show=False),
+        Binding("end", "cursor(1_000_000_000)", "Bottom", show=False),
+    ]
+
+    cursor = reactive(0)
+
+    class ViewChanged(Message):
+        """Posted when different rows come into view (scrolling, resizing)."""
+
+    def __init__(self, registry: TimerRegistry, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.registry = registry
+        self.names: list[str] = []
+        # row -> text last drawn, and row -> (text, state, cursor, width, strip)
+        self._shown: dict[int, str] = {}
+        self._strips: dict[int, tuple] = {}
+        self.lines_rendered = 0
+
+    def sync(self) -> None:
+        """Pick up added or removed timers."""
+        self.names = list(self.registry)
+        self.virtual_size = Size(self.size.width, len(self.names))
+        self.cursor = min(self.cursor, max(0, len(self.names) - 1))
+        self._shown.clear()
+        self._strips.clear()
+        self.refresh()
+
+    @property
+    def selected(self) -> Optional[str]:
+        return self.names[self.cursor] if self.names else None
+
+    def _visible_rows(self) -> range:
+        top = self.scroll_offset.y
+        return range(top, min(top + self.size.height, len(self.names)))
+
+    def tick(self) -> Optional[float]:
+        """Refresh the visible rows that changed; return the delay until the next change."""
+        visible = self._visible_rows()
+        if len(self._strips) > 4 * max(1, len(visible)):
+            # Drop cached lines that scrolled out of view long ago.
+            self._strips = {row: self._strips[row] for row in visible if row in self._strips}
+            self._shown = {row: self._shown[row] for row in visible if row in self._shown}
+        delay = None
+        for row in visible:
+            name = self.names[row]
+            timer = self.registry[name]
+            text, _ = _row(name, timer)
+            if self._shown.get(row) != text:
+                self.refresh_line(row)
+            until = timer.until_next_second()
+            if until is not None and (delay is None or until < delay):
+                delay = until
+        return None if delay is None else max(delay, _MIN_DELAY)
+
+    def render_line(self, y: int) -> Strip:
+        row = self.scroll_offset.y + y
+        width = self.size.width
+        if row >= len(self.names):
+            return Strip.blank(width, self.rich_style)
+        name = self.names[row]
+        text, state = _row(name, self.registry[name])
+        is_cursor = row == self.cursor
+        cached = self._strips.get(row)
+        if cached is not None and cached[:4] == (text, state, is_cursor, width):
+            return cached[4]
+
+        style = self.rich_style
+        if state != "running":
+            style += self.get_component_rich_style(f"timer-table--{state}")
+        if is_cursor:
+            style += self.get_component_rich_style("timer-table--cursor")
+        strip = Strip([Segment(text[:width].ljust(width), style)], width)
+        self._shown[row] = text
+        self._strips[row] = (text, state, is_cursor, width, strip)
+        self.lines_rendered += 1
+        return strip
+
+    def on_resize(self) -> None:
+        self.virtual_size = Size(self.size.width, len(self.names))
+        self._strips.clear()
+        self.post_message(self.ViewChanged())
+
+    def watch_scroll_y(self, old: float, new: float) -> None:
+        super().watch_scroll_y(old, new)
+        self.post_message(self.ViewChanged())
+
+    def watch_cursor(self, old: int, new: int) -> None:
+        self.refresh_line(old)
+        self.refresh_line(new)
+        self.scroll_to_region(Region(0, new, 1, 1), animate=False, immediate=True)
+
+    def action_cursor(self, step: int) -> None:
+        if self.names:
+            self.cursor = max(0, min(len(self.names) - 1, self.cursor + step))
+
+    def action_page(self, direction: int) -> None:
+        self.action_cursor(direction * max(1, self.size.height - 1))
+
+
+class DashboardTui(App):
+    """A dashboard of many named timers."""
+
+    TITLE = "Time Manager"
+    SUB_TITLE = "Dashboard"
+
+    CSS_PATH = "theme.tcss"
+
+    BINDINGS = [
+        ("q", "quit", "Quit"),
+        ("space", "toggle", "Start/Stop"),
+        ("r", "reset", "Reset"),
+        ("s", "add_stopwatch", "New stopwatch"),
+        ("c", "add_countdown", "New 5m countdown"),
+        ("d", "remove", "Delete"),
+    ]
+
+    def __init__(
+        self,
+        registry: Optional[TimerRegistry] = None,
+        profiler: Optional[LoopProfiler] = None,
+    ) -> None:
+        super().__init__()
+        self.profiler = profiler
+        self.registry = registry if registry is not None else TimerRegistry()
+        self._counter = len(self.registry)
+
+    @classmethod
+    def demo(
+        cls,
+        count: int,
+        profiler: Optional[LoopProfiler] = None,
+        clock: Clock = MONOTONIC,
+    ) -> "DashboardTui":
+        """A dashboard pre-filled with `count` mixed timers at staggered offsets."""
+        rng = random.Random(0)
+        registry = TimerRegistry(clock)
+        for i in range(count):
+            if i % 2:
+                name = f"countdown-{i:05}"
+                registry.add_countdown(name, rng.randint(5, 3600))
+            else:
+                name = f"stopwatch-{i:05}"
+                registry.add_stopwatch(name, start=True)
+            if i % 7 == 0:
+                registry.pause(name)
+        return cls(registry, profiler)
+
+    def compose(self) -> ComposeResult:
+        yield Header(show_clock=True)
+        header = f" {'NAME':<{_NAME_WIDTH}} {'KIND':<10} {'STATE':<9} {'TIME':>10}"
+        yield Static(header, id="dash-header")
+        yield TimerTable(self.registry, id="dash-table")
+        yield Static("", id="dash-summary")
+        yield Footer()
+
+    def on_mount(self) -> None:
+        self.table = self.query_one(TimerTable)
+        self.table.sync()
+        self.table.focus()
+        self.refresher = BoundaryRefresher(self, self.tick, self.profiler)
+        self.refresher.start()
+        self.update_summary()
+
+    def on_timer_table_view_changed(self) -> None:
+        self.refresher.poke()
+
+    def tick(self) -> Optional[float]:
+        """Announce expired countdowns, redraw, and return the delay until the next change."""
+        finished = self.registry.poll()
+        if finished:
+            self._announce(finished)
+        delay = self.table.tick()
+        # Wake for off-screen expiries too, not just the visible rows.
+        deadline = self.registry.next_deadline()
+        if deadline is not None:
+            until = max(0.0, deadline - self.registry.clock.now())
+            delay = until if delay is None else min(delay, until)
+        return delay
+
+    def _announce(self, names: list[str]) -> None:
+        if len(names) <= 3:
+            for name in names:
+                self.notify(f"{name} finished", severity="warning")
+        else:
+            self.notify(f"{len(names)} countdowns finished", severity="warning")
+        self.bell()
+        self.update_summary()
+
+    def update_summary(self) -> None:
+        running = finished = 0
+        for _, timer in self.registry.items():
+            if isinstance(timer, Countdown) and timer.is_finished:
+                finished += 1
+            elif timer.is_running:
+                running += 1
+        self.query_one("#dash-summary", Static).update(
+            f" {len(self.registry)} timers, {running} running, {finished} finished"
+        )
+
+    def _changed(self) -> None:
+        self.table.sync()
+        self.refresher.poke()
+        self.update_summary()
+
+    def action_toggle(self) -> None:
+        if self.table.selected is not None:
+            self.registry.toggle(self.table.selected)
+            self._changed()
+
+    def action_reset(self) -> None:
+        if self.table.selected is not None:
+            self.registry.reset(self.table.selected)
+            self._changed()
+
+    def action_remove(self) -> None:
+        if self.table.selected is not None:
+            self.registry.remove(self.table.selected)
+            self._changed()
+
+    def _new_name(self, prefix: str) -> str:
+        while True:
+            self._counter += 1
+            name = f"{prefix}-{self._counter}"
+            if name not in self.registry:
+                return name
+
+    def action_add_stopwatch(self) -> None:
+        self.registry.add_stopwatch(self._new_name("stopwatch"), start=True)
+        self._changed()
+
+    def action_add_countdown(self) -> None:
+        self.registry.add_countdown(self._new_name("countdown"), 5 * 60)
+        self._changed()
@@ -0,0 +1,89 @@
+from time import perf_counter
+from typing import Callable, Optional
+
+from core.profiling import LoopProfiler
+from textual.message_pump import MessagePump
+from textual.timer import Timer
+from textual.widget import Widget
+
+# Wake slightly after a second boundary so the new value is already visible.
+_WAKE_SLACK = 0.005
+
+
+class CachedDisplay:
+    """Holds a widget reference and only calls `update` when the text changes."""
+
+    def __init__(self, widget: Widget) -> None:
+        self.widget = widget
+        self.text: Optional[str] = None
+        self.updates = 0
+        self.skipped = 0
+
+    def update(self, text: str) -> bool:
+        if text == self.text:
+            self.skipped += 1
+            return False
+        self.text = text
+        self.widget.update(text)
+        self.updates += 1
+        return True
+
+
+class BoundaryRefresher:
+    """Runs a refresh callback on each visible change instead of at a fixed rate.
+
+    `refresh` redraws and returns the delay until the display will next change,
+    or None when nothing changes on its own (paused, finished). Call `poke()` after
+    the timer state changes to redraw immediately and reschedule.
+    """
+
+    def __init__(
+        self,
+        owner: MessagePump,
+        refresh: Callable[[], Optional[float]],
+        profiler: Optional[LoopProfiler] = None,
+    ):
+        self._owner = owner
+        self._refresh = refresh
+        self._profiler = profiler
+        self._timer: Optional[Timer] = None
+        self._timeout: Optional[float] = None
+        self._waiting_since = 0.0
+        self.wakeups = 0
+
+    def start(self) -> None:
+        self.poke()
+
+    def poke(self) -> None:
+        self._wake(timed_out=False)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._wake(timed_out=True)
+
+    def _wake(self, timed_out: bool) -> None:
+        woke = perf_counter()
+        waited_since, waited_for = self._waiting_since, self._timeout
+        self.stop()
+        self.wakeups += 1
+        delay = self._refresh()
+        rendered = perf_counter()
+
+        self._timeout = None
+        if delay is not None:
+            self._timeout = delay + _WAKE_SLACK
+            self._waiting_since = rendered
+            self._timer = self._owner.set_timer(self._timeout, self._on_timer)
+
+        if self._profiler is not None:
+            # "render" is the refresh callback; Textual repaints the changed
+            # widgets afterwards on its own schedule.
+            self._profiler.render.record(rendered - woke)
+            self._profiler.iteration.record(perf_counter() - woke)
+            if timed_out and waited_for is not None:
+                self._profiler.wakeup_lag.record(max(0.0, woke - waited_since - waited_for))
+
+    def stop(self) -> None:
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
@@ -1,17 +1,26 @@
 from textual.app import App, ComposeResult
 from textual.containers import Container
-from textual.widgets import Header, Footer, Digits, Button, Static
+from textual.widgets import Header, Footer, Button, Static
 from textual.reactive import reactive
+from typing import TYPE_CHECKING, Optional
+from core.clock import MONOTONIC, Clock
 from core.formatting import format_time
+from core.history import SessionLog, log_session
+from core.laps import LapRecorder
+from core.profiling import LoopProfiler
+from core.shared import SharedStateWriter
 from core.termclock import Stopwatch
+from .bigdigits import BigDigits
+from .refresh import BoundaryRefresher, CachedDisplay
+
+if TYPE_CHECKING:  # subprocess, threads and http.server only load when these are used
+    from core.exporter import MetricsExporter
+    from core.hooks import HookRunner
 
 
 def _format_stopwatch(seconds: float) -> str:
     """Always format stopwatch as HH:MM:SS"""
-    time_str = format_time(seconds, show_centiseconds=False)
-    if time_str.count(":") == 1:
-        return f"00:{time_str}"
-    return time_str
+    return format_time(seconds, show_centiseconds=False, fixed_hours=True)
 
 
 class StopwatchTui(App):
@@ -25,14 +34,35 @@ class StopwatchTui(App):
     BINDINGS = [
         ("q", "quit", "Quit"),
         ("space", "toggle_timer", "Start/Stop"),
+        ("l", "lap", "Lap"),
         ("r", "reset_timer", "Reset"),
     ]
 
     time_elapsed = reactive(0.0)
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        share: Optional[str] = None,
+        laps_file: Optional[str] = None,
+        profiler: Optional[LoopProfiler] = None,
+        history: Optional[SessionLog] = None,
+        tag: Optional[str] = None,
+        clock: Clock = MONOTONIC,
+        hooks: Optional["HookRunner"] = None,
+        exporter: Optional["MetricsExporter"] = None,
+    ) -> None:
         super().__init__()
-        self.stopwatch = Stopwatch()
+        self.profiler = profiler
+        self.history = history
+        self.tag = tag
+        self.hooks = hooks
+        # Laps streamed to a file aren't also kept in memory.
+        laps = LapRecorder(laps_file, keep=False) if laps_file else None
+        self.stopwatch = Stopwatch(laps=laps, clock=clock)
+        self.shared = SharedStateWriter(share, self.stopwatch) if share else None
+        self.exporter = exporter
+        if exporter is not None:
+            exporter.start(self.stopwatch, profiler)
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -40,11 +70,13 @@ class StopwatchTui(App):
             with Container(id="card-row"):
                 with Container(id="display-container"):
                     with Container(id="time-row"):
-                        yield Digits("00:00:00", id="time-display")
+                        yield BigDigits("00:00:00", id="time-display")
                     with Container(id="hint-row"):
                         yield Static("HH:MM:SS", id="format-hint")
                     with Container(id="status-row"):
                         yield Static("Ready", id="status", classes="ready")
+                    with Container(id="laps-row"):
+                        yield Static("", id="laps")
             with Container(id="buttons-row"):
                 with Container(id="buttons"):
                     # Don't use `variant=` here; we want fully deterministic styling via TCSS.
@@ -52,48 +84,74 @@ class StopwatchTui(App):
                     yield Button(
                         "STOP", id="stop", classes="stop", disabled=True, flat=True
                     )
+                    yield Button(
+                        "LAP", id="lap", classes="lap", disabled=True, flat=True
+                    )
                     yield Button("RESET", id="reset", classes="reset", flat=True)
         yield Footer()
 
     def on_mount(self) -> None:
-        self.set_interval(1 / 60, self.update_time)
+        self.time_display = CachedDisplay(self.query_one("#time-display", BigDigits))
+        self.refresher = BoundaryRefresher(self, self.update_time, self.profiler)
+        self.refresher.start()
         self.update_buttons()
+        self.update_laps()
 
-    def update_time(self) -> None:
+    def on_unmount(self) -> None:
+        if self.shared is not None:
+            self.shared.close()
+        if self.stopwatch.laps is not None:
+            self.stopwatch.laps.close()
+        if self.history is not None:
+            log_session(self.stopwatch, self.tag, self.history)
+
+    def update_time(self) -> Optional[float]:
         self.time_elapsed = self.stopwatch.elapsed
-        time_str = _format_stopwatch(self.time_elapsed)
-        self.query_one("#time-display", Digits).update(time_str)
+        self.time_display.update(_format_stopwatch(self.time_elapsed))
+        if self.hooks is not None:
+            self.hooks.poll(self.stopwatch)
+        return self.stopwatch.until_next_second()
 
     def action_toggle_timer(self) -> None:
         self.stopwatch.toggle()
-        self.update_buttons()
+        self.on_state_change()
+
+    def action_lap(self) -> None:
+        if self.stopwatch.is_running:
+            self.stopwatch.lap()
+            self.update_laps()
 
     def action_reset_timer(self) -> None:
         self.stopwatch.reset()
-        self.time_elapsed = 0.0
-        self.query_one("#time-display", Digits).update("00:00:00")
-        self.update_buttons()
+        self.on_state_change()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "start":
             self.stopwatch.start()
         elif event.button.id == "stop":
             self.stopwatch.stop()
+        elif event.button.id == "lap":
+            self.action_lap()
+            return
         elif event.button.id == "reset":
             self.stopwatch.reset()
-            self.time_elapsed = 0.0
-            self.query_one("#time-display", Digits).update("00:00:00")
 
+        self.on_state_change()
+
+    def on_state_change(self) -> None:
+        self.refresher.poke()
         self.update_buttons()
+        self.update_laps()
+        if self.shared is not None:
+            self.shared.publish()
+        if self.exporter is not None:
+            self.exporter.publish()
 
     def update_buttons(self) -> None:
         running = self.stopwatch.is_running
-        if running:
-            self.query_one("#start").disabled = True
-            self.query_one("#stop").disabled = False
-        else:
-            self.query_one("#start").disabled = False
-            self.query_one("#stop").disabled = True
+        self.query_one("#start").disabled = running
+        self.query_one("#stop").disabled = not running
+        self.query_one("#lap").disabled = not running
 
         status = (
             "Running" if running else ("Ready" if self.time_elapsed == 0 else "Paused")
@@ -103,3 +161,8 @@ class StopwatchTui(App):
         status_widget.set_class(running, "running")
         status_widget.set_class((not running) and self.time_elapsed == 0, "ready")
         status_widget.set_class((not running) and self.time_elapsed > 0, "paused")
+
+    def update_laps(self) -> None:
+        laps = self.stopwatch.laps
+        self.query_one("#laps-row").display = bool(laps)
+        self.query_one("#laps", Static).update(laps.summary() if laps else "")